@@ -1,29 +1,88 @@
 # altotech_podcast/agents/base.py
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Callable
 import os
+import random
 from openai import AsyncAzureOpenAI
 from pydantic_ai import Agent
 from pydantic_ai.models.openai import OpenAIModel
 from dotenv import load_dotenv
 
+from agents.resilience import ResilientCaller
+from agents.routing import CallType, ModelRouter, ModelTier, default_router
+
 load_dotenv()
 
+MODEL_ENV_VARS = {
+    ModelTier.MINI: 'AZURE_OPENAI_MINI_MODEL',
+    ModelTier.REASONING: 'AZURE_OPENAI_REASONING_MODEL',
+}
+
+# One caller per deployment so breaker state and hedge percentiles are shared
+default_callers: dict[ModelTier, ResilientCaller] = {tier: ResilientCaller() for tier in ModelTier}
+
+def create_tier_agents(system_prompt: str, tiers: list[ModelTier] | None = None) -> dict[ModelTier, Agent]:
+    """Create one agent per model tier, sharing a single Azure client."""
+    azure_client = AsyncAzureOpenAI(
+        azure_endpoint=os.getenv('AZURE_OPENAI_ENDPOINT'),
+        api_version=os.getenv('AZURE_OPENAI_API_VERSION'),
+        api_key=os.getenv('AZURE_OPENAI_API_KEY'),
+        # 429s go to the shared scheduler, which pauses the whole deployment
+        max_retries=0,
+    )
+    agents = {}
+    for tier in tiers or list(ModelTier):
+        # Fall back to the reasoning deployment if no mini deployment is configured
+        model = os.getenv(MODEL_ENV_VARS[tier]) or os.getenv(MODEL_ENV_VARS[ModelTier.REASONING])
+        agents[tier] = Agent(
+            OpenAIModel(model, openai_client=azure_client),
+            system_prompt=system_prompt
+        )
+    return agents
+
+async def close_agents(agents: dict[ModelTier, Agent]) -> None:
+    """Close the HTTP clients behind a set of tier agents."""
+    clients = {id(client): client for agent in agents.values() if (client := getattr(agent.model, 'client', None))}
+    for client in clients.values():
+        await client.close()
+
 class PodcastAgent(ABC):
     """Base class for podcast agents with common functionality."""
     
-    def __init__(self, use_mini_model: bool = False):
-        model = os.getenv('AZURE_OPENAI_REASONING_MODEL') if use_mini_model else os.getenv('AZURE_OPENAI_REASONING_MODEL')
-        azure_client = AsyncAzureOpenAI(
-            azure_endpoint=os.getenv('AZURE_OPENAI_ENDPOINT'),
-            api_version=os.getenv('AZURE_OPENAI_API_VERSION'),
-            api_key=os.getenv('AZURE_OPENAI_API_KEY'),
-        )
-        openai_model = OpenAIModel(model, openai_client=azure_client)
-        self.agent = Agent(
-            openai_model,
-            system_prompt=self.get_system_prompt()
-        )
+    def __init__(self, use_mini_model: bool = False, router: ModelRouter | None = None):
+        tiers = [ModelTier.MINI] if use_mini_model else list(ModelTier)
+        self.agents = create_tier_agents(self.get_system_prompt(), tiers)
+        self.agent = self.agents[ModelTier.MINI] if use_mini_model else self.agents[ModelTier.REASONING]
+        self.router = router or default_router
+        self.callers = default_callers
+        self._last_filler: str | None = None
+    
+    async def run_agent(
+        self,
+        prompt: str,
+        call_type: CallType,
+        fallback: Callable[[], Any] | None = None,
+        **run_kwargs: Any
+    ) -> Any:
+        """Run the prompt on the routed model tier, falling back to a filler line on failure."""
+        try:
+            result = await self.router.run(self.agents, call_type, prompt, callers=self.callers, **run_kwargs)
+        except Exception as e:
+            # The show must go on: a stalled or failing model gets a filler line instead
+            print(f"LLM call failed ({type(e).__name__}: {e}), using filler line")
+            return fallback() if fallback else self.filler_line()
+        return result.data
+    
+    async def aclose(self) -> None:
+        """Release the agent's HTTP connections once its show is over."""
+        await close_agents(self.agents)
+    
+    def filler_line(self) -> str:
+        """Pick a filler line from the persona's pool, avoiding an immediate repeat."""
+        lines = getattr(self, 'filler_lines', None) or PersonaTraits.DEFAULT_FILLER_LINES
+        choices = [line for line in lines if line != self._last_filler] or lines
+        self._last_filler = random.choice(choices)
+        return self._last_filler
     
     @abstractmethod
     def get_system_prompt(self) -> str:
@@ -38,6 +97,16 @@ class PodcastAgent(ABC):
 class PersonaTraits:
     """Mixin for agent personality traits."""
     
+    DEFAULT_FILLER_LINES = [
+        "Hmm... that's a great question, give me a second.",
+        "You know... let me think about that one.",
+    ]
+    
+    @property
+    def filler_lines(self) -> list[str]:
+        """Return in-character lines used when a response can't be generated in time."""
+        return self.DEFAULT_FILLER_LINES
+    
     @property
     @abstractmethod
     def personality_traits(self) -> list[str]:
@@ -3,10 +3,13 @@ from typing import Any
 
 from context.company import CompanyContext
 from agents.base import PodcastAgent, PersonaTraits
+from agents.routing import CallType
 
 class AltoTechCEO(PodcastAgent, PersonaTraits):
     """AltoTech CEO personality and knowledge."""
     
+    speaker_name = "Arm"
+    
     def __init__(self):
         self.company_context = CompanyContext()
         super().__init__()
@@ -36,6 +39,15 @@ class AltoTechCEO(PodcastAgent, PersonaTraits):
             "Emphasizes points by repeating key words"
         ]
     
+    @property
+    def filler_lines(self) -> list[str]:
+        return [
+            "Hmm... fundamentally, that's a profound question.",
+            "Actually... very good question, this one. Let me think.",
+            "You know... data, data is the key for this, really.",
+            "Hmm... our team, our customers, they teach us a lot on this.",
+        ]
+    
     def get_system_prompt(self) -> str:
         return f"""You are the CEO of AltoTech Global, Warodom Khamphanchai (Nickname: Arm). Keep responses conversational and brief.
 
@@ -56,8 +68,12 @@ Remember: You're in a podcast conversation, not giving a presentation."""
 Relevant Context: {context_snippets}
 Question: {prompt}"""
 
-        result = await self.agent.run(enhanced_prompt)
-        return result.data
+        # Combined audience questions get a longer, explicit airtime budget
+        word_budget = kwargs.get('word_budget')
+        if word_budget:
+            enhanced_prompt += f"\nThis combines several audience questions. Answer each of them briefly, in about {word_budget} words total."
+
+        return await self.run_agent(enhanced_prompt, kwargs.get('call_type', CallType.ANSWER))
     
     def _get_context_snippets(self, topic: str) -> str:
         """Extract relevant context based on the topic."""
@@ -67,7 +83,7 @@ Question: {prompt}"""
         elif 'innovation' in topic.lower():
             return f"Energy Savings: {self.company_context.metrics.energy_savings}, Area: {self.company_context.metrics.managed_area}"
         elif 'customer' in topic.lower():
-            stories = '\n'.join(f"- {cs.name}: {cs.results['energy_savings']} savings" 
+            stories = '\n'.join(f"- {cs.name}: {cs.headline}" 
                               for cs in self.company_context.success_stories)
             return f"Success Stories:\n{stories}"
         elif 'future' in topic.lower():
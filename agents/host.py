@@ -2,6 +2,9 @@
 from typing import Any
 
 from agents.base import PodcastAgent, PersonaTraits
+from agents.routing import CallType
+from models.turns import HostTurn, TurnSignal
+from context.coverage import describe_coverage
 from context.topics import get_topic_prompt
 
 class ElonMuskHost(PodcastAgent, PersonaTraits):
@@ -42,13 +45,62 @@ class ElonMuskHost(PodcastAgent, PersonaTraits):
             "Adds 'order of magnitude' to numerical comparisons"
         ]
     
+    @property
+    def filler_lines(self) -> list[str]:
+        return [
+            "Um... well, actually, that's kind of a deep question, let's sit with it for a second.",
+            "Uh... fundamentally, I think the audience wants to hear more about this.",
+            "It's quite profound actually... let's dig into that.",
+            "Well, actually... take us a bit deeper on that.",
+        ]
+    
     def get_system_prompt(self) -> str:
         return f"""You are Elon Musk hosting a tech podcast interview about energy innovation and AI. Keep it natural and engaging.
 {self.format_traits_for_prompt()}"""
 
     async def generate_response(self, prompt: str, **kwargs: Any) -> str:
+        prompt, call_type = self._build_prompt(prompt, **kwargs)
+        return await self.run_agent(prompt, call_type)
+    
+    async def generate_turn(self, prompt: str, **kwargs: Any) -> HostTurn:
+        """Generate the next host line together with the producer's stay/move-on/end decision."""
+        next_topic = kwargs.get('next_topic', '')
+        prompt, call_type = self._build_prompt(prompt, **kwargs)
+        coverage = kwargs.get('coverage')
+        covered = ""
+        if coverage is not None and kwargs.get('topic'):
+            scores = coverage.question_scores(kwargs['topic'])
+            done = len(coverage.covered_questions(kwargs['topic']))
+            covered = f"\nKey questions already addressed in this topic: {done} of {len(scores)}."
+        next_step = (
+            f"If the current topic has been sufficiently covered, set signal to 'move_on' and make your line open the next topic: {next_topic}."
+            if next_topic else
+            "This is the last topic. If it has been sufficiently covered, set signal to 'end' and make your line a brief closing remark."
+        )
+        prompt = f"""{prompt}
+
+Also act as the producer. Judge whether the current topic has been sufficiently covered: key questions addressed, depth of discussion, natural point to transition.{covered}
+{next_step}
+Otherwise set signal to 'stay' and ask the follow-up. Give your confidence in the signal from 0 to 1."""
+        return await self.run_agent(
+            prompt,
+            call_type,
+            fallback=lambda: HostTurn(question=self.filler_line(), signal=TurnSignal.STAY, confidence=0.0),
+            result_type=HostTurn
+        )
+    
+    def _build_prompt(self, prompt: str, **kwargs: Any) -> tuple[str, CallType]:
         topic = kwargs.get('topic', '')
         previous_topic = kwargs.get('previous_topic', '')
+        # Openings/closings have no topic; audience hand-offs are short bridges
+        call_type = kwargs.get('call_type')
+        if call_type is None:
+            if not topic:
+                call_type = CallType.OPENING
+            elif 'audience_question' in kwargs or 'audience_question_groups' in kwargs:
+                call_type = CallType.BRIDGE
+            else:
+                call_type = CallType.FOLLOW_UP
         
         if topic:
             topic_info = get_topic_prompt(topic)
@@ -62,20 +114,37 @@ class ElonMuskHost(PodcastAgent, PersonaTraits):
             
             # If there's a previous response, acknowledge it before new questions
             previous_response = kwargs.get('previous_response')
-            if previous_response and 'audience_question' in kwargs:
+            if 'audience_question_groups' in kwargs:
+                groups = kwargs['audience_question_groups']
+                themes = "\n".join(
+                    f"Theme {i}:\n" + "\n".join(f"- {q}" for q in group)
+                    for i, group in enumerate(groups, 1)
+                )
+                prompt = f"""Previous guest's response: {previous_response or ''}
+Several audience members sent questions, grouped by theme:
+{themes}
+As the host, acknowledge the previous response in 1 short sentence, then combine these into one short question for the guest that covers every theme, naming the people who asked.
+Remember to ask the guest about these questions, don't answer them yourself."""
+            elif previous_response and 'audience_question' in kwargs:
                 prompt = f"""Previous guest's response: {previous_response}
 As the host, acknowledge the previous response in 1 short sentence, then smoothly transition to the audience question: {kwargs['audience_question']}
 Remember to ask the guest about this question, don't answer it yourself."""
             else:
-                # Include suggested questions in the prompt for inspiration
+                # Panel questions go to everyone, so they need room for several angles
+                if kwargs.get('panel'):
+                    prompt += f"\nYou're hosting a panel with {', '.join(kwargs['panel'])}. Ask one question the whole panel can answer from their own perspective."
+                # Include suggested questions in the prompt for inspiration, minus the ones already covered
+                coverage = kwargs.get('coverage')
+                questions = (
+                    describe_coverage(coverage, topic) if coverage is not None else
+                    "Available questions for inspiration:\n" + "\n".join(f"- {q}" for q in suggested_questions)
+                )
                 prompt = f"""Topic Context: {context}
 
-Available questions for inspiration:
-{chr(10).join(f"- {q}" for q in suggested_questions)}
+{questions}
 
 Based on this context and these suggested questions, {prompt}
 Don't limit yourself to the suggested questions, but try to ask things that smoothly flow from the previous question.
 Try to stick with one question and not asking multiple questions at the same time."""
         
-        result = await self.agent.run(prompt)
-        return result.data
\ No newline at end of file
+        return prompt, call_type
\ No newline at end of file
@@ -0,0 +1,76 @@
+# altotech_podcast/agents/offline.py
+import asyncio
+import itertools
+import os
+import random
+from typing import Any
+
+from pydantic_ai import Agent
+from pydantic_ai.messages import ModelMessage, ModelResponse, TextPart, ToolCallPart
+from pydantic_ai.models.function import AgentInfo, FunctionModel
+
+OFFLINE_ENV_DEFAULTS = {
+    'AZURE_OPENAI_ENDPOINT': 'https://offline.invalid',
+    'AZURE_OPENAI_API_VERSION': 'offline',
+    'AZURE_OPENAI_API_KEY': 'offline',
+    'AZURE_OPENAI_REASONING_MODEL': 'offline-reasoning',
+    'AZURE_OPENAI_MINI_MODEL': 'offline-mini',
+}
+
+def configure_offline_env() -> None:
+    """Fill in placeholder Azure settings so agents can be constructed without credentials."""
+    for key, value in OFFLINE_ENV_DEFAULTS.items():
+        os.environ.setdefault(key, value)
+
+class OfflineModel:
+    """Stand-in for the Azure deployments: canned replies after a simulated latency."""
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, seed: int | None = None):
+        self.latency = latency
+        self.jitter = jitter
+        self.calls = 0
+        self._random = random.Random(seed)
+        self._counter = itertools.count(1)
+
+    def _fake_value(self, schema: dict[str, Any]) -> Any:
+        if 'enum' in schema:
+            return self._random.choice(schema['enum'])
+        kind = schema.get('type')
+        if kind in ('number', 'integer'):
+            low, high = schema.get('minimum', 0), schema.get('maximum', 1)
+            return round(self._random.uniform(low, high), 2) if kind == 'number' else int(low)
+        if kind == 'boolean':
+            return self._random.random() < 0.5
+        if kind == 'array':
+            return []
+        return f"Offline line {next(self._counter)}"
+
+    def _fake_args(self, schema: dict[str, Any]) -> dict[str, Any]:
+        definitions = schema.get('$defs', {})
+        args = {}
+        for name, prop in schema.get('properties', {}).items():
+            if '$ref' in prop:
+                prop = definitions[prop['$ref'].split('/')[-1]]
+            elif 'allOf' in prop:
+                prop = definitions[prop['allOf'][0]['$ref'].split('/')[-1]]
+            args[name] = self._fake_value(prop)
+        return args
+
+    async def respond(self, messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+        self.calls += 1
+        await asyncio.sleep(max(0.0, self.latency + self._random.uniform(-self.jitter, self.jitter)))
+        if info.result_tools:
+            tool = info.result_tools[0]
+            return ModelResponse(parts=[ToolCallPart.from_raw_args(tool.name, self._fake_args(tool.parameters_json_schema))])
+        return ModelResponse(parts=[TextPart(f"Offline line {next(self._counter)}")])
+
+    def as_model(self) -> FunctionModel:
+        return FunctionModel(self.respond)
+
+def use_offline_model(target: Any, model: OfflineModel) -> None:
+    """Swap every tier agent on ``target`` (an agent or PodcastPrompts) for the offline model."""
+    for tier, agent in list(target.agents.items()):
+        offline_agent = Agent(model.as_model(), system_prompt=agent._system_prompts)
+        if getattr(target, 'agent', None) is agent:
+            target.agent = offline_agent
+        target.agents[tier] = offline_agent
@@ -0,0 +1,122 @@
+# altotech_podcast/agents/panel.py
+import asyncio
+from dataclasses import dataclass
+from typing import Any
+
+from agents.base import PodcastAgent, PersonaTraits
+from agents.guest import AltoTechCEO
+from agents.routing import CallType
+
+@dataclass(frozen=True)
+class PanelistProfile:
+    """Who a panelist is and which session speaks for them."""
+    session: str
+    name: str
+    role: str
+    personality_traits: tuple[str, ...]
+    focus: str
+    communication_style: tuple[str, ...] = (
+        "Avoid using asterisks (*) for emphasis",
+        "Don't use action descriptions like [chuckles] or [laughs]",
+        "Keep it casual, like a real conversation",
+        "Keep responses under 1-2 short sentences",
+        "Add your own angle instead of repeating the other panelists",
+    )
+
+INVESTOR_PANEL = [
+    PanelistProfile(
+        session="investor",
+        name="Mei",
+        role="a partner at a Southeast Asian climate-tech venture fund and AltoTech investor",
+        personality_traits=(
+            "Sharp on unit economics and capital efficiency",
+            "Optimistic about decarbonisation as a market",
+            "Asks herself what could go wrong",
+        ),
+        focus="Market size, returns, and what it takes to scale across the region",
+    ),
+    PanelistProfile(
+        session="operator",
+        name="Somchai",
+        role="director of facilities at a premium Bangkok shopping mall that uses AltoTech",
+        personality_traits=(
+            "Practical and down to earth",
+            "Cares about tenant comfort and maintenance effort",
+            "Convinced by measured results, not promises",
+        ),
+        focus="Day-to-day operation, energy bills, and how the building team works with the AI",
+    ),
+]
+
+class Panelist(PodcastAgent, PersonaTraits):
+    """Panel guest built from a PanelistProfile."""
+
+    def __init__(self, profile: PanelistProfile):
+        self.profile = profile
+        super().__init__()
+
+    @property
+    def speaker_name(self) -> str:
+        return self.profile.name
+
+    @property
+    def personality_traits(self) -> list[str]:
+        return list(self.profile.personality_traits)
+
+    @property
+    def communication_style(self) -> list[str]:
+        return list(self.profile.communication_style)
+
+    def get_system_prompt(self) -> str:
+        return f"""You are {self.profile.name}, {self.profile.role}, speaking on an investor panel about AltoTech Global. Keep responses conversational and brief.
+
+{self.format_traits_for_prompt()}
+
+Your angle: {self.profile.focus}
+
+Remember: You're one voice on a panel, not giving a presentation."""
+
+    async def generate_response(self, prompt: str, **kwargs: Any) -> str:
+        topic = kwargs.get('topic', '')
+        return await self.run_agent(f"Topic: {topic}\nQuestion to the panel: {prompt}", kwargs.get('call_type', CallType.ANSWER))
+
+class Panel:
+    """Guests that answer the same question in parallel, then speak one after another."""
+
+    def __init__(self, guests: dict[str, PodcastAgent], rotate: bool = True):
+        # Session -> guest, in speaking order
+        self.guests = guests
+        self.rotate = rotate
+        self.rounds = 0
+
+    def __len__(self) -> int:
+        return len(self.guests)
+
+    def name_of(self, session: str) -> str:
+        return getattr(self.guests[session], 'speaker_name', session)
+
+    @property
+    def names(self) -> list[str]:
+        return [self.name_of(session) for session in self.guests]
+
+    def speaking_order(self) -> list[str]:
+        """Sessions in speaking order; rotation gives every guest a turn to go first."""
+        sessions = list(self.guests)
+        if not self.rotate:
+            return sessions
+        shift = self.rounds % len(sessions)
+        return sessions[shift:] + sessions[:shift]
+
+    async def answer(self, question: str, **kwargs: Any) -> list[tuple[str, str]]:
+        """Every guest answers concurrently, so a round costs one LLM latency, not K."""
+        order = self.speaking_order()
+        self.rounds += 1
+        answers = await asyncio.gather(*(self.guests[session].generate_response(question, **kwargs) for session in order))
+        return list(zip(order, answers))
+
+def build_panel(ceo: PodcastAgent | None = None, profiles: list[PanelistProfile] | None = None) -> Panel:
+    """The CEO on the guest session plus one session per panelist."""
+    guests: dict[str, PodcastAgent] = {"right": ceo or AltoTechCEO()}
+    for profile in INVESTOR_PANEL if profiles is None else profiles:
+        guests[profile.session] = Panelist(profile)
+    return Panel(guests)
@@ -0,0 +1,308 @@
+# altotech_podcast/agents/rate_limit.py
+import asyncio
+import contextvars
+import os
+import statistics
+import time
+from collections import OrderedDict, defaultdict, deque
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, AsyncIterator, Hashable, Iterator, Mapping
+
+class Priority(IntEnum):
+    """Order in which waiting model calls are let through, most urgent first."""
+    LIVE = 0  # Lines the audience is waiting for
+    BACKGROUND = 1  # Producer decisions, captions
+    BATCH = 2  # Batch episodes, summaries
+
+@dataclass(frozen=True)
+class RequestContext:
+    """Who a model call is made for: its room, and the most urgent priority it may use."""
+    room: str = "default"
+    priority: Priority = Priority.LIVE
+
+_request_context: contextvars.ContextVar[RequestContext] = contextvars.ContextVar(
+    "llm_request_context", default=RequestContext()
+)
+
+@contextmanager
+def request_context(room: str, priority: Priority = Priority.LIVE) -> Iterator[None]:
+    """Attribute model calls made in this block (and tasks created in it) to ``room``."""
+    token = _request_context.set(RequestContext(room, priority))
+    try:
+        yield
+    finally:
+        _request_context.reset(token)
+
+def current_request_context() -> RequestContext:
+    return _request_context.get()
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about four characters a token), good enough for admission."""
+    return len(text) // 4 + 1
+
+@dataclass
+class DeploymentLimits:
+    """Quota of one model deployment; None leaves that dimension unlimited."""
+    requests_per_minute: float | None = None
+    tokens_per_minute: float | None = None
+    max_concurrent: int | None = None
+
+    @classmethod
+    def from_env(cls, prefix: str) -> "DeploymentLimits":
+        """Limits from <prefix>_RPM, <prefix>_TPM and <prefix>_CONCURRENCY."""
+        def number(suffix: str, kind: type) -> Any:
+            value = os.getenv(f"{prefix}_{suffix}")
+            return kind(value) if value else None
+        return cls(number("RPM", float), number("TPM", float), number("CONCURRENCY", int))
+
+class TokenBucket:
+    """Budget refilled continuously at ``per_minute`` (times ``scale``), holding up to a minute's worth."""
+
+    def __init__(self, per_minute: float):
+        self.per_minute = per_minute
+        self.capacity = per_minute
+        self.level = per_minute
+        self.scale = 1.0
+        self._updated = time.monotonic()
+
+    def refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self._updated) * self.per_minute * self.scale / 60)
+        self._updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds until ``amount`` is available; requests bigger than the bucket wait for a full one."""
+        self.refill(now)
+        missing = min(amount, self.capacity) - self.level
+        return max(0.0, missing * 60 / (self.per_minute * self.scale))
+
+    def take(self, amount: float) -> None:
+        # Corrections after the call may push the level below zero; later calls wait it out
+        self.level -= amount
+
+@dataclass
+class Grant:
+    """Permission for one model call; set ``used`` to the actual tokens once known."""
+    deployment: Hashable
+    reserved: int
+    used: int | None = None
+
+@dataclass
+class _Waiter:
+    tokens: int
+    priority: Priority
+    room: str
+    future: asyncio.Future
+    enqueued: float
+
+@dataclass
+class _Deployment:
+    limits: DeploymentLimits
+    requests: TokenBucket | None
+    tokens: TokenBucket | None
+    # Per priority, rooms in round-robin order, each with its own FIFO of waiting calls
+    queues: dict[Priority, OrderedDict[str, deque[_Waiter]]] = field(
+        default_factory=lambda: {priority: OrderedDict() for priority in Priority}
+    )
+    in_flight: int = 0
+    scale: float = 1.0
+    paused_until: float = 0.0
+    backoff: float = 0.0
+    throttled: int = 0
+    timer: asyncio.TimerHandle | None = None
+    granted: dict[Priority, int] = field(default_factory=lambda: defaultdict(int))
+    waits: dict[Priority, deque[float]] = field(default_factory=lambda: defaultdict(lambda: deque(maxlen=200)))
+
+    def wait_time(self, tokens: int, now: float) -> float | None:
+        """Seconds before a call of ``tokens`` may start; None while it waits for a running call."""
+        if self.limits.max_concurrent is not None and self.in_flight >= self.limits.max_concurrent:
+            return None
+        wait = max(0.0, self.paused_until - now)
+        if self.requests is not None:
+            wait = max(wait, self.requests.wait_time(1, now))
+        if self.tokens is not None:
+            wait = max(wait, self.tokens.wait_time(tokens, now))
+        return wait
+
+    def set_scale(self, scale: float) -> None:
+        self.scale = scale
+        for bucket in (self.requests, self.tokens):
+            if bucket is not None:
+                bucket.refill(time.monotonic())
+                bucket.scale = scale
+
+class LLMScheduler:
+    """Admission control in front of every model call, one queue per deployment.
+
+    Each deployment has request and token buckets sized to its RPM/TPM quota, and
+    calls reserve their estimated tokens before they start. Waiting calls are let
+    through strictly by priority (live lines, then background work, then batch
+    jobs) and round-robin across rooms within a priority, so a busy room cannot
+    starve the others. A 429 pauses the deployment for its Retry-After and lowers
+    its rate; successful calls restore it gradually.
+    """
+
+    def __init__(
+        self,
+        limits: Mapping[Hashable, DeploymentLimits] | None = None,
+        throttle_factor: float = 0.7,
+        recovery: float = 0.05,
+        min_scale: float = 0.25,
+    ):
+        self.limits = dict(limits or {})
+        self.throttle_factor = throttle_factor
+        self.recovery = recovery
+        self.min_scale = min_scale
+        self._deployments: dict[Hashable, _Deployment] = {}
+
+    def _deployment(self, key: Hashable) -> _Deployment:
+        if key not in self._deployments:
+            limits = self.limits.get(key) or DeploymentLimits()
+            self._deployments[key] = _Deployment(
+                limits,
+                TokenBucket(limits.requests_per_minute) if limits.requests_per_minute else None,
+                TokenBucket(limits.tokens_per_minute) if limits.tokens_per_minute else None,
+            )
+        return self._deployments[key]
+
+    @asynccontextmanager
+    async def slot(self, key: Hashable, tokens: int, priority: Priority = Priority.LIVE) -> AsyncIterator[Grant]:
+        """Wait for permission to call deployment ``key``, and give it back when done."""
+        grant = await self.acquire(key, tokens, priority)
+        try:
+            yield grant
+        finally:
+            self.release(grant)
+
+    async def acquire(self, key: Hashable, tokens: int, priority: Priority = Priority.LIVE) -> Grant:
+        context = current_request_context()
+        # A batch job's calls never jump ahead of live ones, whatever their call type
+        priority = max(priority, context.priority)
+        deployment = self._deployment(key)
+        waiter = _Waiter(tokens, priority, context.room, asyncio.get_running_loop().create_future(), time.monotonic())
+        deployment.queues[priority].setdefault(context.room, deque()).append(waiter)
+        self._dispatch(deployment)
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # Granted just as the caller gave up: hand the slot back
+                self.release(Grant(key, tokens))
+            else:
+                self._remove(deployment, waiter)
+            raise
+        return Grant(key, tokens)
+
+    def release(self, grant: Grant) -> None:
+        deployment = self._deployment(grant.deployment)
+        deployment.in_flight -= 1
+        if grant.used is not None and deployment.tokens is not None:
+            # Settle the estimate against what the call actually used
+            deployment.tokens.take(grant.used - grant.reserved)
+        self._dispatch(deployment)
+
+    def succeeded(self, key: Hashable) -> None:
+        deployment = self._deployment(key)
+        deployment.backoff = 0.0
+        if deployment.scale < 1.0:
+            deployment.set_scale(min(1.0, deployment.scale + self.recovery))
+
+    def throttled(self, key: Hashable, headers: Mapping[str, str] | None = None) -> float:
+        """Back off after a 429; returns the pause in seconds."""
+        deployment = self._deployment(key)
+        deployment.throttled += 1
+        pause = _retry_after(headers or {})
+        if pause is None:
+            # No hint from the server: exponential backoff, reset by the next success
+            pause = deployment.backoff = min(60.0, max(1.0, deployment.backoff * 2))
+        now = time.monotonic()
+        deployment.paused_until = max(deployment.paused_until, now + pause)
+        deployment.set_scale(max(self.min_scale, deployment.scale * self.throttle_factor))
+        self._dispatch(deployment)
+        return pause
+
+    def _remove(self, deployment: _Deployment, waiter: _Waiter) -> None:
+        rooms = deployment.queues[waiter.priority]
+        queue = rooms.get(waiter.room)
+        if queue is not None and waiter in queue:
+            queue.remove(waiter)
+            if not queue:
+                del rooms[waiter.room]
+            # The removed call may have been holding up the ones behind it
+            self._dispatch(deployment)
+
+    def _dispatch(self, deployment: _Deployment) -> None:
+        """Grant waiting calls in priority and round-robin order while the quota allows."""
+        if deployment.timer is not None:
+            deployment.timer.cancel()
+            deployment.timer = None
+        now = time.monotonic()
+        for priority in Priority:
+            rooms = deployment.queues[priority]
+            while rooms:
+                room, queue = next(iter(rooms.items()))
+                waiter = queue[0]
+                wait = deployment.wait_time(waiter.tokens, now)
+                if wait is None:
+                    return
+                if wait > 0:
+                    # Nothing of lower priority may overtake the head of the line
+                    deployment.timer = asyncio.get_running_loop().call_later(wait, self._dispatch, deployment)
+                    return
+                queue.popleft()
+                if queue:
+                    rooms.move_to_end(room)
+                else:
+                    del rooms[room]
+                if waiter.future.done():
+                    continue
+                if deployment.requests is not None:
+                    deployment.requests.take(1)
+                if deployment.tokens is not None:
+                    deployment.tokens.take(waiter.tokens)
+                deployment.in_flight += 1
+                deployment.granted[priority] += 1
+                deployment.waits[priority].append(now - waiter.enqueued)
+                waiter.future.set_result(None)
+
+    def report(self) -> dict[str, Any]:
+        now = time.monotonic()
+        report = {}
+        for key, deployment in self._deployments.items():
+            report[getattr(key, "value", str(key))] = {
+                "limits": vars(deployment.limits),
+                "rate_scale": round(deployment.scale, 2),
+                "paused_for": round(max(0.0, deployment.paused_until - now), 1),
+                "throttled": deployment.throttled,
+                "in_flight": deployment.in_flight,
+                "tokens_available": round(deployment.tokens.level) if deployment.tokens else None,
+                "priorities": {
+                    priority.name.lower(): {
+                        "queued": sum(len(queue) for queue in deployment.queues[priority].values()),
+                        "rooms_waiting": list(deployment.queues[priority]),
+                        "granted": deployment.granted[priority],
+                        "wait_p50_ms": _percentile_ms(deployment.waits[priority], 50),
+                        "wait_p95_ms": _percentile_ms(deployment.waits[priority], 95),
+                    }
+                    for priority in Priority
+                },
+            }
+        return report
+
+def _percentile_ms(samples: deque[float], p: int) -> float:
+    if len(samples) < 2:
+        return round(samples[0] * 1000, 1) if samples else 0.0
+    return round(statistics.quantiles(samples, n=100, method="inclusive")[p - 1] * 1000, 1)
+
+def _retry_after(headers: Mapping[str, str]) -> float | None:
+    """Pause requested by a 429's headers (retry-after-ms or retry-after, in seconds)."""
+    for name, factor in (("retry-after-ms", 0.001), ("retry-after", 1.0)):
+        value = headers.get(name)
+        if value:
+            try:
+                return float(value) * factor
+            except ValueError:
+                # An HTTP date; not worth parsing, fall back to exponential backoff
+                return None
+    return None
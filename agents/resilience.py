@@ -0,0 +1,135 @@
+# altotech_podcast/agents/resilience.py
+import asyncio
+import random
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Awaitable, Callable, TypeVar
+
+T = TypeVar("T")
+
+class CircuitOpenError(Exception):
+    """Raised when a call is refused because the circuit breaker is open."""
+
+@dataclass
+class CallPolicy:
+    """Deadline, hedging and retry settings for LLM calls."""
+    deadline: float = 12.0  # Seconds the audience can wait for a line
+    hedge_percentile: float = 0.9
+    initial_hedge_delay: float = 4.0  # Used until enough latencies are measured
+    min_hedge_delay: float = 1.0
+    max_retries: int = 2
+    backoff_base: float = 0.25
+    backoff_cap: float = 2.0
+
+class CircuitBreaker:
+    """Opens after consecutive failures and lets a single trial through after a cool-down."""
+
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._trial_in_flight = False
+
+    @property
+    def is_open(self) -> bool:
+        return self._opened_at is not None
+
+    def allow(self) -> bool:
+        """Return whether a call may be attempted right now."""
+        if self._opened_at is None:
+            return True
+        if self._trial_in_flight or time.monotonic() - self._opened_at < self.reset_timeout:
+            return False
+        self._trial_in_flight = True
+        return True
+
+    def cancel_trial(self) -> None:
+        """Release a half-open trial that was cancelled before it finished."""
+        self._trial_in_flight = False
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        self._trial_in_flight = False
+        if self._opened_at is not None or self._failures >= self.failure_threshold:
+            self._opened_at = time.monotonic()
+
+class ResilientCaller:
+    """Runs calls under a deadline with hedging, jittered retries and a circuit breaker."""
+
+    def __init__(self, policy: CallPolicy | None = None, breaker: CircuitBreaker | None = None, window: int = 50):
+        self.policy = policy or CallPolicy()
+        self.breaker = breaker or CircuitBreaker()
+        self._latencies: deque[float] = deque(maxlen=window)
+
+    def hedge_delay(self) -> float:
+        """Delay before a hedged second request, from the latency percentile."""
+        if len(self._latencies) < 5:
+            return self.policy.initial_hedge_delay
+        samples = sorted(self._latencies)
+        index = min(len(samples) - 1, int(len(samples) * self.policy.hedge_percentile))
+        return max(self.policy.min_hedge_delay, samples[index])
+
+    async def _timed(self, factory: Callable[[], Awaitable[T]]) -> T:
+        start = time.perf_counter()
+        result = await factory()
+        self._latencies.append(time.perf_counter() - start)
+        return result
+
+    async def _hedged(self, factory: Callable[[], Awaitable[T]]) -> T:
+        pending = {asyncio.ensure_future(self._timed(factory))}
+        hedged = False
+        error: BaseException | None = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=None if hedged else self.hedge_delay(),
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+                if not done and not hedged:
+                    hedged = True
+                    pending.add(asyncio.ensure_future(self._timed(factory)))
+            raise error
+        finally:
+            # The losing request is cancelled, which closes its HTTP connection;
+            # wait for that so no request outlives the call
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.wait(pending)
+
+    async def _with_retries(self, factory: Callable[[], Awaitable[T]]) -> T:
+        for attempt in range(self.policy.max_retries + 1):
+            try:
+                return await self._hedged(factory)
+            except Exception:
+                if attempt == self.policy.max_retries:
+                    raise
+                # Full jitter keeps concurrent shows from retrying in lockstep
+                await asyncio.sleep(random.uniform(0, min(self.policy.backoff_cap, self.policy.backoff_base * 2 ** attempt)))
+
+    async def call(self, factory: Callable[[], Awaitable[T]], deadline: float | None = None) -> T:
+        """Run ``factory`` and return its result or raise once the deadline passes."""
+        if not self.breaker.allow():
+            raise CircuitOpenError("LLM circuit breaker is open")
+        try:
+            result = await asyncio.wait_for(self._with_retries(factory), deadline or self.policy.deadline)
+        except asyncio.CancelledError:
+            self.breaker.cancel_trial()
+            raise
+        except Exception:
+            self.breaker.record_failure()
+            raise
+        self.breaker.record_success()
+        return result
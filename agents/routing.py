@@ -0,0 +1,191 @@
+# altotech_podcast/agents/routing.py
+import statistics
+import time
+from collections import deque, defaultdict
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Iterable
+
+from openai import RateLimitError
+from pydantic_ai import Agent
+
+from agents.rate_limit import DeploymentLimits, LLMScheduler, Priority, estimate_tokens
+
+if TYPE_CHECKING:
+    from agents.resilience import ResilientCaller
+
+class CallType(str, Enum):
+    """Kinds of LLM calls made during a show."""
+    OPENING = "opening"
+    BRIDGE = "bridge"
+    FOLLOW_UP = "follow_up"
+    ANSWER = "answer"
+    PRODUCER = "producer"
+    TRANSLATION = "translation"
+    SUMMARY = "summary"
+    RECAP = "recap"
+
+class ModelTier(str, Enum):
+    """Model tiers, cheapest first."""
+    MINI = "mini"
+    REASONING = "reasoning"
+
+# Preferred tier per call type: only substantive answers need the big model
+DEFAULT_ROUTES: dict[CallType, ModelTier] = {
+    CallType.OPENING: ModelTier.MINI,
+    CallType.BRIDGE: ModelTier.MINI,
+    CallType.FOLLOW_UP: ModelTier.MINI,
+    CallType.ANSWER: ModelTier.REASONING,
+    CallType.PRODUCER: ModelTier.MINI,
+    CallType.TRANSLATION: ModelTier.MINI,
+    # Post-show: chunk summaries on the cheap model, the episode recap on the big one
+    CallType.SUMMARY: ModelTier.MINI,
+    CallType.RECAP: ModelTier.REASONING,
+}
+
+# Rolling median latency (seconds) above which a call type falls back to a faster tier
+DEFAULT_LATENCY_BUDGETS: dict[CallType, float] = {
+    CallType.OPENING: 3.0,
+    CallType.BRIDGE: 2.0,
+    CallType.FOLLOW_UP: 3.0,
+    CallType.ANSWER: 8.0,
+    CallType.PRODUCER: 2.0,
+    CallType.TRANSLATION: 2.0,
+    CallType.SUMMARY: 10.0,
+    CallType.RECAP: 20.0,
+}
+
+# Hard per-call deadlines (seconds) before the speaker falls back to a filler line
+DEFAULT_DEADLINES: dict[CallType, float] = {
+    CallType.OPENING: 8.0,
+    CallType.BRIDGE: 6.0,
+    CallType.FOLLOW_UP: 8.0,
+    CallType.ANSWER: 15.0,
+    CallType.PRODUCER: 5.0,
+    CallType.TRANSLATION: 6.0,
+    CallType.SUMMARY: 30.0,
+    CallType.RECAP: 60.0,
+}
+
+# Live lines go ahead of producer decisions and captions, which go ahead of post-show work
+DEFAULT_PRIORITIES: dict[CallType, Priority] = {
+    CallType.OPENING: Priority.LIVE,
+    CallType.BRIDGE: Priority.LIVE,
+    CallType.FOLLOW_UP: Priority.LIVE,
+    CallType.ANSWER: Priority.LIVE,
+    CallType.PRODUCER: Priority.BACKGROUND,
+    CallType.TRANSLATION: Priority.BACKGROUND,
+    CallType.SUMMARY: Priority.BATCH,
+    CallType.RECAP: Priority.BATCH,
+}
+
+# Completion tokens reserved per call until the actual usage is known
+DEFAULT_COMPLETION_TOKENS: dict[CallType, int] = {
+    CallType.OPENING: 150,
+    CallType.BRIDGE: 150,
+    CallType.FOLLOW_UP: 200,
+    CallType.ANSWER: 600,
+    CallType.PRODUCER: 100,
+    CallType.TRANSLATION: 200,
+    CallType.SUMMARY: 500,
+    CallType.RECAP: 800,
+}
+
+class ModelRouter:
+    """Chooses a model tier per call type from configured routes and measured latency."""
+
+    def __init__(
+        self,
+        routes: dict[CallType, ModelTier] | None = None,
+        latency_budgets: dict[CallType, float] | None = None,
+        deadlines: dict[CallType, float] | None = None,
+        window: int = 20,
+        probe_every: int = 5,
+        scheduler: LLMScheduler | None = None,
+    ):
+        self.routes = {**DEFAULT_ROUTES, **(routes or {})}
+        self.latency_budgets = {**DEFAULT_LATENCY_BUDGETS, **(latency_budgets or {})}
+        self.deadlines = {**DEFAULT_DEADLINES, **(deadlines or {})}
+        self.probe_every = probe_every
+        self._latencies: dict[ModelTier, deque[float]] = defaultdict(lambda: deque(maxlen=window))
+        self._fallbacks: dict[CallType, int] = defaultdict(int)
+        # Tokens used by every call routed through this router
+        self.total_tokens = 0
+        # Every call waits for its deployment's quota
+        self.scheduler = scheduler or default_scheduler
+
+    def record(self, tier: ModelTier, seconds: float) -> None:
+        """Record the latency of a completed call."""
+        self._latencies[tier].append(seconds)
+
+    def rolling_latency(self, tier: ModelTier) -> float | None:
+        """Median latency over the recent window, or None if unmeasured."""
+        samples = self._latencies.get(tier)
+        return statistics.median(samples) if samples else None
+
+    def choose(self, call_type: CallType, available: Iterable[ModelTier]) -> ModelTier:
+        """Pick the tier for a call, falling back to a faster tier when over budget."""
+        available = sorted(set(available), key=list(ModelTier).index)
+        preferred = self.routes[call_type]
+        if preferred not in available:
+            # Closest tier that is actually configured
+            return min(available, key=lambda t: abs(list(ModelTier).index(t) - list(ModelTier).index(preferred)))
+
+        observed = self.rolling_latency(preferred)
+        budget = self.latency_budgets.get(call_type)
+        if observed is None or budget is None or observed <= budget:
+            return preferred
+
+        faster = [
+            t for t in available
+            if t != preferred and (self.rolling_latency(t) or 0.0) < observed
+        ]
+        if not faster:
+            return preferred
+        # Periodically probe the preferred tier so a recovered model gets used again
+        self._fallbacks[call_type] += 1
+        if self._fallbacks[call_type] % self.probe_every == 0:
+            return preferred
+        return min(faster, key=lambda t: self.rolling_latency(t) or 0.0)
+
+    async def run(
+        self,
+        agents: dict[ModelTier, Agent],
+        call_type: CallType,
+        prompt: str,
+        callers: dict[ModelTier, "ResilientCaller"] | None = None,
+        **kwargs: Any
+    ) -> Any:
+        """Run the prompt on the routed agent and record its latency.
+
+        Every attempt waits for a slot from the scheduler, which enforces the
+        deployment's quota and lets live lines go first. With ``callers``, the call
+        goes through the tier's ResilientCaller and is bounded by the call type's
+        deadline, queueing included.
+        """
+        tier = self.choose(call_type, agents.keys())
+        prompt_text = "".join(agents[tier]._system_prompts) + prompt + str(kwargs.get('message_history') or "")
+        tokens = estimate_tokens(prompt_text) + DEFAULT_COMPLETION_TOKENS[call_type]
+
+        async def attempt() -> Any:
+            async with self.scheduler.slot(tier, tokens, DEFAULT_PRIORITIES[call_type]) as grant:
+                start = time.perf_counter()
+                try:
+                    result = await agents[tier].run(prompt, **kwargs)
+                except RateLimitError as e:
+                    self.scheduler.throttled(tier, e.response.headers)
+                    raise
+                self.scheduler.succeeded(tier)
+                self.record(tier, time.perf_counter() - start)
+                grant.used = result.usage().total_tokens
+                self.total_tokens += grant.used or 0
+                return result
+
+        if callers is None:
+            return await attempt()
+        return await callers[tier].call(attempt, deadline=self.deadlines.get(call_type))
+
+# One scheduler per process, so every show, batch job and summary shares the quota
+default_scheduler = LLMScheduler({tier: DeploymentLimits.from_env(f"AZURE_OPENAI_{tier.name}") for tier in ModelTier})
+
+# Shared by every agent in the process so latency measurements pool together
+default_router = ModelRouter()
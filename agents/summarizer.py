@@ -0,0 +1,231 @@
+# altotech_podcast/agents/summarizer.py
+import asyncio
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+
+from agents.base import close_agents, create_tier_agents, default_callers
+from agents.routing import CallType, default_router
+from context.topics import TOPIC_PROMPTS
+from models.dialogue import DialogueContent
+from models.enums import TopicArea
+from models.summary import AudienceQA, ChunkSummary, EpisodeRecap
+
+# Bump when the prompts or result models change, so cached results are recomputed
+PROMPT_VERSION = 1
+
+Result = TypeVar("Result", bound=BaseModel)
+
+def _digest(data: Any) -> str:
+    return hashlib.blake2b(json.dumps(data, ensure_ascii=False).encode(), digest_size=16).hexdigest()
+
+@dataclass
+class TranscriptChunk:
+    """Consecutive turns on one topic, small enough for one summary call."""
+    topic: str | None
+    turns: list[DialogueContent]
+
+    @property
+    def key(self) -> str:
+        """Content hash: an unchanged chunk maps to the same cached summary."""
+        return _digest([PROMPT_VERSION, self.topic, [(t["role"], t.get("speaker"), t["content"]) for t in self.turns]])
+
+    @property
+    def topic_area(self) -> TopicArea | None:
+        try:
+            return TopicArea(self.topic)
+        except ValueError:
+            return None
+
+    @property
+    def title(self) -> str:
+        return self.topic_area.display_name if self.topic_area else "Show"
+
+    def format(self) -> str:
+        lines = []
+        for turn in self.turns:
+            name = turn.get("speaker") or turn["role"].title()
+            if turn["dialogue_type"] == "audience_response":
+                name += " (answering the audience)"
+            lines.append(f"{name}: {turn['content']}")
+        return "\n".join(lines)
+
+def chunk_transcript(dialogue: list[DialogueContent], max_turns: int = 12) -> list[TranscriptChunk]:
+    """Split a transcript into runs of one topic, at most about ``max_turns`` each.
+
+    Long runs are only split before a host line, so a question stays with its answer.
+    """
+    chunks: list[TranscriptChunk] = []
+    for turn in dialogue:
+        topic = turn.get("topic")
+        if (
+            not chunks
+            or chunks[-1].topic != topic
+            or (len(chunks[-1].turns) >= max_turns and turn["role"] == "host")
+        ):
+            chunks.append(TranscriptChunk(topic, []))
+        chunks[-1].turns.append(turn)
+    return chunks
+
+class SummaryCache:
+    """Map and reduce results keyed by content hash, optionally persisted as a JSON file."""
+
+    def __init__(self, path: str | None = None):
+        self.path = path
+        self._items: dict[str, dict[str, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+        if path and os.path.exists(path):
+            with open(path, 'r') as f:
+                self._items = json.load(f)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, key: str, model: type[Result]) -> Result | None:
+        if key not in self._items:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return model.model_validate(self._items[key])
+
+    def put(self, key: str, value: BaseModel) -> None:
+        self._items[key] = value.model_dump()
+
+    def save(self) -> None:
+        if self.path:
+            with open(self.path, 'w') as f:
+                json.dump(self._items, f, indent=1, ensure_ascii=False)
+
+@dataclass
+class ShowSummary:
+    """Everything the post-show pipeline produces for one episode."""
+    recap: EpisodeRecap
+    sections: list[tuple[TranscriptChunk, ChunkSummary]]
+
+    @property
+    def audience_qa(self) -> list[AudienceQA]:
+        return [qa for _, section in self.sections for qa in section.audience_qa]
+
+    @property
+    def coverage(self) -> dict[str, dict[str, bool]]:
+        """For each topic, which of its suggested questions the show answered."""
+        covered = {
+            (chunk.topic, question.strip().lower())
+            for chunk, section in self.sections
+            for question in section.covered_questions
+        }
+        return {
+            topic.display_name: {
+                question: (topic.value, question.lower()) in covered
+                for question in prompt.suggested_questions or []
+            }
+            for topic, prompt in TOPIC_PROMPTS.items()
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "summary": self.recap.summary,
+            "highlights": self.recap.highlights,
+            "sections": [
+                {"topic": chunk.title, "turns": len(chunk.turns), "summary": section.summary, "highlights": section.highlights}
+                for chunk, section in self.sections
+            ],
+            "audience_qa": [qa.model_dump() for qa in self.audience_qa],
+            "coverage": self.coverage,
+        }
+
+    def to_markdown(self, title: str) -> str:
+        lines = [f"# {title}", "", self.recap.summary, "", "## Highlights", ""]
+        lines += [f"- {highlight}" for highlight in self.recap.highlights]
+        lines += ["", "## Sections"]
+        for chunk, section in self.sections:
+            lines += ["", f"### {chunk.title}", "", section.summary]
+        if self.audience_qa:
+            lines += ["", "## Audience Q&A", ""]
+            lines += [f"- **{qa.asker}:** {qa.question}\n  {qa.answer}" for qa in self.audience_qa]
+        lines += ["", "## Suggested questions covered"]
+        for topic, questions in self.coverage.items():
+            lines += ["", f"### {topic}", ""]
+            lines += [f"- [{'x' if covered else ' '}] {question}" for question, covered in questions.items()]
+        return "\n".join(lines) + "\n"
+
+class ShowSummarizer:
+    """Post-show map-reduce over a transcript.
+
+    Topic sections are summarized concurrently, at most ``concurrency`` calls at a
+    time (map), then merged into one episode recap (reduce). Both steps are cached
+    by content, so re-running after edits only re-summarizes the changed sections.
+    """
+
+    def __init__(self, concurrency: int = 4, cache: SummaryCache | None = None, max_turns: int = 12):
+        self.agents = create_tier_agents(
+            system_prompt="""You are the editor of AltoTech's investor podcast.
+You write accurate, concise post-show summaries for investors.
+Only report what was actually said in the transcript. Keep names, company names and numbers exactly as spoken."""
+        )
+        self.router = default_router
+        self.callers = default_callers
+        self.cache = cache if cache is not None else SummaryCache()
+        self.max_turns = max_turns
+        self._semaphore = asyncio.Semaphore(concurrency)
+
+    async def aclose(self) -> None:
+        """Release the summarizer's HTTP connections."""
+        await close_agents(self.agents)
+
+    async def _run(self, key: str, call_type: CallType, prompt: str, result_type: type[Result]) -> Result:
+        if (cached := self.cache.get(key, result_type)) is not None:
+            return cached
+        async with self._semaphore:
+            result = await self.router.run(self.agents, call_type, prompt, callers=self.callers, result_type=result_type)
+        self.cache.put(key, result.data)
+        return result.data
+
+    async def summarize_chunk(self, chunk: TranscriptChunk) -> ChunkSummary:
+        topic_prompt = TOPIC_PROMPTS.get(chunk.topic_area)
+        suggested = (topic_prompt.suggested_questions or []) if topic_prompt else []
+        questions = "\n".join(f"- {q}" for q in suggested) or "(none)"
+        prompt = f"""Section of the podcast about: {chunk.title}
+
+Suggested questions for this topic:
+{questions}
+
+Transcript:
+{chunk.format()}
+
+Summarize this section, list its highlights, which of the suggested questions it answered (copied verbatim), and the audience questions it answered."""
+        return await self._run(chunk.key, CallType.SUMMARY, prompt, ChunkSummary)
+
+    async def recap(self, sections: list[tuple[TranscriptChunk, ChunkSummary]]) -> EpisodeRecap:
+        outline = "\n\n".join(
+            f"{chunk.title}:\n{section.summary}\nHighlights:\n" + "\n".join(f"- {h}" for h in section.highlights)
+            for chunk, section in sections
+        )
+        prompt = f"""These are the summaries of each section of the podcast, in order:
+
+{outline}
+
+Merge them into a summary of the whole episode and pick its most important highlights."""
+        # Section summaries are determined by their chunks, so the chunk keys identify the recap
+        key = _digest([PROMPT_VERSION, "recap", [chunk.key for chunk, _ in sections]])
+        return await self._run(key, CallType.RECAP, prompt, EpisodeRecap)
+
+    async def summarize(self, dialogue: list[DialogueContent]) -> ShowSummary:
+        chunks = chunk_transcript(dialogue, self.max_turns)
+        if not chunks:
+            raise ValueError("Nothing to summarize: the transcript is empty")
+        try:
+            results = await asyncio.gather(*(self.summarize_chunk(chunk) for chunk in chunks), return_exceptions=True)
+            # Sections that did finish stay cached for the next run
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+            sections = list(zip(chunks, results))
+            return ShowSummary(await self.recap(sections), sections)
+        finally:
+            self.cache.save()
@@ -0,0 +1,193 @@
+# altotech_podcast/batch.py
+"""Headless batch episode generator.
+
+Runs many podcast episodes concurrently and writes their transcripts:
+
+    python batch.py --count 8 --concurrency 4 --output episodes/
+    python batch.py --specs episodes.jsonl --offline
+
+Each line of a specs file is an episode:
+    {"name": "ep1", "topics": ["challenges", "future_vision"], "host": "elon_musk",
+     "guest": "altotech_ceo", "audience_questions": [{"name": "Ann", "question": "..."}]}
+
+Guests are "altotech_ceo" or a panelist's session name ("investor", "operator").
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import time
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Callable
+
+from agents.offline import OfflineModel, configure_offline_env, use_offline_model
+from agents.rate_limit import Priority, request_context
+
+@dataclass
+class EpisodeSpec:
+    """What to record for one episode."""
+    name: str
+    topics: list[Any]
+    host: str = "elon_musk"
+    guest: str = "altotech_ceo"
+    audience_questions: list[dict[str, str]] = field(default_factory=list)
+
+def personas() -> tuple[dict[str, Callable[[], Any]], dict[str, Callable[[], Any]]]:
+    """Host and guest factories by spec name; panelists can be booked as solo guests."""
+    from agents.guest import AltoTechCEO
+    from agents.host import ElonMuskHost
+    from agents.panel import INVESTOR_PANEL, Panelist
+
+    hosts = {"elon_musk": ElonMuskHost}
+    guests = {"altotech_ceo": AltoTechCEO}
+    guests.update({profile.session: partial(Panelist, profile) for profile in INVESTOR_PANEL})
+    return hosts, guests
+
+def load_specs(path: str) -> list[EpisodeSpec]:
+    from models.enums import TopicArea
+    hosts, guests = personas()
+    specs = []
+    with open(path, 'r') as f:
+        for number, line in enumerate(f, 1):
+            if line.strip():
+                data = json.loads(line)
+                data["topics"] = [TopicArea(t) for t in data.get("topics") or list(TopicArea)]
+                spec = EpisodeSpec(**data)
+                if spec.host not in hosts:
+                    raise ValueError(f"{path}:{number}: unknown host {spec.host!r} (one of {', '.join(hosts)})")
+                if spec.guest not in guests:
+                    raise ValueError(f"{path}:{number}: unknown guest {spec.guest!r} (one of {', '.join(guests)})")
+                specs.append(spec)
+    return specs
+
+def shuffled_specs(count: int, seed: int) -> list[EpisodeSpec]:
+    """Episodes that differ only in topic order."""
+    from models.enums import TopicArea
+    rng = random.Random(seed)
+    specs = []
+    for index in range(count):
+        topics = list(TopicArea)
+        rng.shuffle(topics)
+        specs.append(EpisodeSpec(name=f"episode-{index + 1:03d}", topics=topics))
+    return specs
+
+def write_transcript(spec: EpisodeSpec, state: Any, output_dir: str) -> None:
+    """Write the episode transcript as JSONL and Markdown."""
+    with open(os.path.join(output_dir, f"{spec.name}.jsonl"), 'w') as f:
+        for index, dialogue in enumerate(state.dialogue_history):
+            f.write(json.dumps({"episode": spec.name, "index": index, **dialogue}, ensure_ascii=False) + "\n")
+
+    speakers = {"host": "Host", "guest": "Guest"}
+    lines = [
+        f"# {spec.name}",
+        "",
+        f"_Topics: {', '.join(t.display_name for t in spec.topics)}_",
+        "",
+    ]
+    for question in state.audience_questions:
+        lines.append(f"> Audience: {question}")
+    if state.audience_questions:
+        lines.append("")
+    for dialogue in state.dialogue_history:
+        lines.append(f"**{speakers.get(dialogue['role'], dialogue['role'])}:** {dialogue['content']}")
+        lines.append("")
+    with open(os.path.join(output_dir, f"{spec.name}.md"), 'w') as f:
+        f.write("\n".join(lines))
+
+async def run_batch(
+    specs: list[EpisodeSpec],
+    output_dir: str,
+    concurrency: int,
+    max_turns_per_topic: int,
+    offline_latency: float | None = None,
+) -> None:
+    from agents.routing import default_router
+    from context.question_bank import QuestionBank
+    from start import run_podcast
+    from ui.console import PodcastConsole
+    from ui.prompts import PodcastPrompts
+
+    hosts, guests = personas()
+
+    os.makedirs(output_dir, exist_ok=True)
+    bank = QuestionBank.load()
+    semaphore = asyncio.Semaphore(concurrency)
+    dashboard = PodcastConsole().batch_dashboard()
+    progress = {spec.name: dashboard.add_episode(spec.name) for spec in specs}
+    failures: dict[str, str] = {}
+
+    async def run_episode(spec: EpisodeSpec) -> None:
+        async with semaphore:
+            submissions_path = os.path.join(output_dir, f"{spec.name}.questions.json")
+            with open(submissions_path, 'w') as f:
+                json.dump(spec.audience_questions, f)
+            components = []
+            try:
+                prompts = PodcastPrompts(submissions_path)
+                components.append(prompts)
+                host = hosts[spec.host]()
+                components.append(host)
+                guest = guests[spec.guest]()
+                components.append(guest)
+                if offline_latency is not None:
+                    model = OfflineModel(latency=offline_latency, jitter=offline_latency / 2)
+                    for target in components:
+                        use_offline_model(target, model)
+                # Each episode is its own room, queued behind any live show in the process
+                with request_context(spec.name, Priority.BATCH):
+                    state = await run_podcast(
+                        console=progress[spec.name],
+                        prompts=prompts,
+                        host=host,
+                        guest=guest,
+                        question_bank=QuestionBank(bank.topics),
+                        topics=spec.topics,
+                        max_turns_per_topic=max_turns_per_topic
+                    )
+            except Exception as e:
+                progress[spec.name].status = "failed"
+                failures[spec.name] = f"{type(e).__name__}: {e}"
+                return
+            finally:
+                # Like main.release_show: an episode's agents and clients do not outlive it
+                for component in components:
+                    try:
+                        await component.aclose()
+                    except Exception as e:
+                        print(f"Error releasing {type(component).__name__}: {e}")
+            write_transcript(spec, state, output_dir)
+
+    tokens_before = default_router.total_tokens
+    start = time.perf_counter()
+    with dashboard:
+        await asyncio.gather(*(run_episode(spec) for spec in specs))
+    elapsed = time.perf_counter() - start
+    tokens = default_router.total_tokens - tokens_before
+
+    completed = len(specs) - len(failures)
+    dashboard.console.print(
+        f"\n{completed}/{len(specs)} episodes in {elapsed:.1f}s: "
+        f"{completed / elapsed * 3600:.1f} episodes/hour, "
+        f"{tokens} tokens ({tokens / elapsed:.1f} tokens/s). Transcripts in {output_dir}"
+    )
+    for name, error in failures.items():
+        dashboard.console.print(f"[bold red]{name} failed:[/bold red] {error}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Record podcast episodes headlessly, in parallel")
+    parser.add_argument("--specs", help="JSONL file of episode specs")
+    parser.add_argument("--count", type=int, default=4, help="Episodes with shuffled topic order (without --specs)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--concurrency", type=int, default=4, help="Episodes running at the same time")
+    parser.add_argument("--max-turns-per-topic", type=int, default=3)
+    parser.add_argument("--output", default="episodes")
+    parser.add_argument("--offline", type=float, nargs="?", const=0.05, metavar="LATENCY",
+                        help="Use the offline stand-in model with this simulated latency (seconds)")
+    args = parser.parse_args()
+
+    if args.offline is not None:
+        configure_offline_env()
+    specs = load_specs(args.specs) if args.specs else shuffled_specs(args.count, args.seed)
+    asyncio.run(run_batch(specs, args.output, args.concurrency, args.max_turns_per_topic, args.offline))
@@ -0,0 +1,102 @@
+# altotech_podcast/benchmarks/audience_memory.py
+"""Per-client server memory of WebSocket audience clients versus read-only SSE subscribers.
+
+Starts the real FastAPI app under uvicorn in this process, opens idle clients from a
+child process, and charges the traced Python allocations in the server to each client.
+
+    python -m benchmarks.audience_memory --clients 500
+"""
+import argparse
+import asyncio
+import gc
+import os
+import socket
+import subprocess
+import sys
+import tracemalloc
+
+from agents.offline import configure_offline_env
+
+configure_offline_env()
+os.environ["PODCAST_WARMUP"] = "0"
+
+import uvicorn
+
+import main
+
+CLIENT_SCRIPT = r"""
+import asyncio, sys
+kind, port, count = sys.argv[1], int(sys.argv[2]), int(sys.argv[3])
+
+async def websocket_client():
+    import websockets
+    ws = await websockets.connect(f"ws://127.0.0.1:{port}/ws/audience", ping_interval=None)
+    await ws.recv()  # Snapshot
+    return ws
+
+async def sse_client():
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(b"GET /sse/audience HTTP/1.1\r\nHost: bench\r\nAccept: text/event-stream\r\n\r\n")
+    await writer.drain()
+    await reader.readuntil(b"\r\n\r\n")  # Headers
+    await reader.readuntil(b"\n\n")  # Snapshot event
+    return writer
+
+async def main():
+    client = websocket_client if kind == "websocket" else sse_client
+    clients = []
+    for _ in range(count):
+        clients.append(await client())
+    print("ready", flush=True)
+    sys.stdin.readline()
+
+asyncio.run(main())
+"""
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+async def measure(kind: str, port: int, count: int) -> float:
+    gc.collect()
+    before = tracemalloc.get_traced_memory()[0]
+    proc = await asyncio.create_subprocess_exec(
+        sys.executable, "-c", CLIENT_SCRIPT, kind, str(port), str(count),
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE
+    )
+    await proc.stdout.readline()
+    await asyncio.sleep(0.5)  # Let every connection settle into its idle wait
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0] - before
+    proc.stdin.write(b"\n")
+    await proc.wait()
+    await asyncio.sleep(0.5)  # Let the server tear the connections down
+    return used / count
+
+async def run(count: int) -> None:
+    port = free_port()
+    server = uvicorn.Server(uvicorn.Config(main.app, host="127.0.0.1", port=port, log_level="warning"))
+    serve = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.05)
+
+    tracemalloc.start()
+    # Warm up imports and caches so they are not charged to the first path
+    await measure("websocket", port, 5)
+    await measure("sse", port, 5)
+    ws = await measure("websocket", port, count)
+    sse = await measure("sse", port, count)
+    tracemalloc.stop()
+
+    server.should_exit = True
+    await serve
+    print(f"{count} idle clients (traced server-side Python memory)")
+    print(f"  websocket  {ws / 1024:6.2f} KiB/client")
+    print(f"  sse        {sse / 1024:6.2f} KiB/client  ({sse / ws:.0%} of websocket)")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(run(args.clients))
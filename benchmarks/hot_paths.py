@@ -0,0 +1,273 @@
+# altotech_podcast/benchmarks/hot_paths.py
+"""Microbenchmarks for the ConnectionManager code that runs during a show.
+
+Uses fake WebSockets, so nothing leaves the process. Results are compared with a
+baselines file and regressions beyond a threshold are flagged (exit status 1).
+Baselines are machine-specific, so the file is not committed: the first run on a
+machine records a baseline for every case that has none, and later runs compare
+against it. Record it from the commit you want to compare against.
+
+    python -m benchmarks.hot_paths                    # compare (records missing baselines)
+    python -m benchmarks.hot_paths --save-baseline    # re-record every baseline
+    python -m benchmarks.hot_paths --only fanout
+"""
+import argparse
+import asyncio
+import contextlib
+import gc
+import io
+import json
+import os
+import sys
+import time
+from dataclasses import dataclass
+from statistics import quantiles
+from typing import Awaitable, Callable
+
+from agents.offline import configure_offline_env
+
+configure_offline_env()
+os.environ["PODCAST_WARMUP"] = "0"
+
+import main
+from context.company import CompanyContext
+from models.enums import TopicArea
+from models.state import PodcastState
+from server.message_queue import MessageLane
+
+BASELINES_PATH = os.path.join(os.path.dirname(__file__), "baselines.json")
+LINE = "Host: So tell me, how does the AI actually decide when to pre-cool a mall before opening hours?"
+
+class FakeWebSocket:
+    """Stands in for a connected client; optionally reports speaking as finished right away."""
+
+    def __init__(self, on_send: Callable[[str], None] | None = None):
+        self.sent = 0
+        self.bytes = 0
+        self.on_send = on_send
+
+    async def send_text(self, text: str) -> None:
+        self.sent += 1
+        self.bytes += len(text)
+        if self.on_send:
+            self.on_send(text)
+
+    async def close(self, code: int = 1000) -> None:
+        pass
+
+@dataclass
+class Result:
+    name: str
+    ops: int
+    seconds: float
+    latencies: list[float]
+    # Throughput is fixed by the offered rate; judge these on latency instead
+    rate_limited: bool = False
+
+    @property
+    def ops_per_sec(self) -> float:
+        return self.ops / self.seconds
+
+    def percentile(self, p: int) -> float:
+        if len(self.latencies) < 2:
+            return self.latencies[0] if self.latencies else 0.0
+        return quantiles(self.latencies, n=100, method="inclusive")[p - 1]
+
+def new_manager(session: str = "audience", connections: int = 0, **socket_kwargs) -> main.ConnectionManager:
+    manager = main.ConnectionManager()
+    manager.sessions[session].extend(FakeWebSocket(**socket_kwargs) for _ in range(connections))
+    return manager
+
+def timed_ops(name: str, ops: int, fn: Callable[[int], object]) -> Result:
+    latencies = []
+    start = time.perf_counter()
+    for i in range(ops):
+        t = time.perf_counter()
+        fn(i)
+        latencies.append(time.perf_counter() - t)
+    return Result(name, ops, time.perf_counter() - start, latencies)
+
+async def timed_async_ops(name: str, ops: int, fn: Callable[[int], Awaitable[object]]) -> Result:
+    latencies = []
+    start = time.perf_counter()
+    for i in range(ops):
+        t = time.perf_counter()
+        await fn(i)
+        latencies.append(time.perf_counter() - t)
+    return Result(name, ops, time.perf_counter() - start, latencies)
+
+# Cases
+
+async def bench_broadcast(ops: int) -> list[Result]:
+    manager = new_manager()
+    return [await timed_async_ops("broadcast", ops, lambda i: manager.broadcast(LINE, "left"))]
+
+async def bench_fanout(ops: int, connection_counts: list[int]) -> list[Result]:
+    """Dispatch a backlog of audience frames to N sockets; latency is each frame's
+    dispatch time, from the previous frame reaching the last socket to this one doing so."""
+    results = []
+    for connections in connection_counts:
+        manager = new_manager("audience", connections - 1)
+        done_at: list[float] = []
+        manager.sessions["audience"].append(FakeWebSocket(lambda text: done_at.append(time.perf_counter())))
+        # The whole backlog is measured, not just what fits under the audience lane cap
+        manager.message_queue.max_per_lane = None
+        for i in range(ops):
+            manager.message_queue.put(f"audience line {i}", "audience", MessageLane.AUDIENCE)
+        start = time.perf_counter()
+        manager.ensure_queue_processor()
+        while len(done_at) < ops:
+            await asyncio.sleep(0)
+        elapsed = time.perf_counter() - start
+        await stop_queue(manager)
+        latencies = [b - a for a, b in zip([start] + done_at, done_at)]
+        results.append(Result(f"fanout[{connections}]", ops, elapsed, latencies))
+    return results
+
+async def stop_queue(manager: main.ConnectionManager) -> None:
+    manager.queue_task.cancel()
+    await asyncio.wait([manager.queue_task])
+
+async def bench_rate(ops: int, rates: list[int], connections: int) -> list[Result]:
+    """Enqueue-to-send latency on the show lane at a steady message rate, with the
+    speaker reporting speaking finished as soon as a frame arrives."""
+    results = []
+    for rate in rates:
+        manager = main.ConnectionManager()
+        # Show frames leave in the order they were queued (frame seqs are given out at send time)
+        sent_at: list[float] = []
+        latencies: list[float] = []
+
+        def on_send(text: str) -> None:
+            latencies.append(time.perf_counter() - sent_at[len(latencies)])
+            asyncio.get_running_loop().call_soon(manager.update_speaking_state, {"leftIsSpeaking": False}, "left")
+
+        manager.sessions["left"].append(FakeWebSocket(on_send))
+        manager.sessions["left"].extend(FakeWebSocket() for _ in range(connections - 1))
+        manager.ensure_queue_processor()
+        start = time.perf_counter()
+        count = min(ops, rate * 2)
+        for i in range(count):
+            manager.message_queue.put(f"show line {i}", "left", MessageLane.SHOW)
+            sent_at.append(time.perf_counter())
+            # Absolute schedule, so a slow dispatch does not lower the offered rate
+            await asyncio.sleep(max(0.0, start + (i + 1) / rate - time.perf_counter()))
+        while len(latencies) < count:
+            await asyncio.sleep(0.001)
+        elapsed = time.perf_counter() - start
+        await stop_queue(manager)
+        results.append(Result(f"show_lane[{rate}/s]", count, elapsed, latencies, rate_limited=True))
+    return results
+
+async def bench_speaking_state(ops: int) -> list[Result]:
+    manager = new_manager()
+    return [timed_ops("update_speaking_state", ops, lambda i: manager.update_speaking_state({"leftIsSpeaking": bool(i % 2)}, "left"))]
+
+async def bench_state(ops: int) -> list[Result]:
+    state = PodcastState(current_topic=TopicArea.COMPANY_GROWTH)
+    dialogue = {"role": "guest", "content": LINE, "dialogue_type": "response"}
+    return [
+        timed_ops("add_dialogue", ops, lambda i: state.add_dialogue(dialogue)),
+        timed_ops("get_current_topic_exchanges", ops, lambda i: state.get_current_topic_exchanges()),
+    ]
+
+async def bench_company_context(ops: int) -> list[Result]:
+    context = CompanyContext()
+    return [timed_ops("format_for_prompt", ops, lambda i: context.format_for_prompt())]
+
+def better(a: Result, b: Result) -> Result:
+    if a.rate_limited:
+        return a if a.percentile(95) <= b.percentile(95) else b
+    return a if a.ops_per_sec >= b.ops_per_sec else b
+
+async def run_cases(
+    ops: int,
+    connection_counts: list[int],
+    rates: list[int],
+    only: str | None,
+    repeat: int = 3,
+) -> list[Result]:
+    """Run every case ``repeat`` times and keep the best run, which is the least disturbed by noise."""
+    cases = {
+        "broadcast": lambda: bench_broadcast(ops),
+        "fanout": lambda: bench_fanout(ops, connection_counts),
+        "show_lane": lambda: bench_rate(ops, rates, connection_counts[0]),
+        "update_speaking_state": lambda: bench_speaking_state(ops),
+        "state": lambda: bench_state(ops),
+        "format_for_prompt": lambda: bench_company_context(ops),
+    }
+    best: dict[str, Result] = {}
+    for name, case in cases.items():
+        if only and only not in name:
+            continue
+        for _ in range(repeat):
+            # Like timeit: garbage left by earlier cases must not be collected on this one's clock
+            gc.collect()
+            gc.disable()
+            try:
+                # The manager logs every frame; keep terminal I/O out of the numbers
+                with contextlib.redirect_stdout(io.StringIO()):
+                    results = await case()
+            finally:
+                gc.enable()
+            for result in results:
+                previous = best.get(result.name)
+                best[result.name] = better(result, previous) if previous else result
+    return list(best.values())
+
+def baseline_of(result: Result) -> dict[str, float]:
+    return {"ops_per_sec": round(result.ops_per_sec, 1), "p95_us": round(result.percentile(95) * 1e6, 1)}
+
+def compare(results: list[Result], baselines: dict[str, dict[str, float]], threshold: float) -> list[str]:
+    """Names of results more than ``threshold`` worse than baseline: throughput, or p95
+    latency for rate-limited cases."""
+    print(f"{'case':<30} {'ops/s':>12} {'p50 us':>9} {'p95 us':>9} {'p99 us':>9} {'vs base':>8}")
+    regressions = []
+    for r in results:
+        base = baselines.get(r.name)
+        change, flag = "new", ""
+        if base:
+            if r.rate_limited:
+                # Positive is slower
+                worse = r.percentile(95) * 1e6 / base["p95_us"] - 1
+                change = f"{worse:+.0%} p95"
+            else:
+                worse = 1 - r.ops_per_sec / base["ops_per_sec"]
+                change = f"{-worse:+.0%}"
+            if worse > threshold:
+                regressions.append(r.name)
+                flag = "  REGRESSION"
+        print(
+            f"{r.name:<30} {r.ops_per_sec:>12,.0f} {r.percentile(50) * 1e6:>9.1f} "
+            f"{r.percentile(95) * 1e6:>9.1f} {r.percentile(99) * 1e6:>9.1f} {change:>8}{flag}"
+        )
+    return regressions
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ops", type=int, default=5000)
+    parser.add_argument("--connections", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--rates", type=int, nargs="+", default=[50, 500], help="Show-lane messages per second")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per case; the best one is reported")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed throughput drop before flagging")
+    parser.add_argument("--baselines", default=BASELINES_PATH)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--only", help="Run only cases whose name contains this")
+    args = parser.parse_args()
+
+    results = asyncio.run(run_cases(args.ops, args.connections, args.rates, args.only, args.repeat))
+    baselines = {}
+    if os.path.exists(args.baselines):
+        with open(args.baselines, 'r') as f:
+            baselines = json.load(f)
+    regressions = compare(results, baselines, args.threshold)
+
+    recorded = [r for r in results if args.save_baseline or r.name not in baselines]
+    if recorded:
+        baselines.update({r.name: baseline_of(r) for r in recorded})
+        with open(args.baselines, 'w') as f:
+            json.dump(baselines, f, indent=2, sort_keys=True)
+        print(f"Baselines for {len(recorded)} case(s) saved to {args.baselines}")
+    if regressions and not args.save_baseline:
+        print(f"{len(regressions)} regression(s) beyond {args.threshold:.0%}: {', '.join(regressions)}")
+        sys.exit(1)
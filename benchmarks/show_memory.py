@@ -0,0 +1,117 @@
+# altotech_podcast/benchmarks/show_memory.py
+"""Steady-state server memory across many consecutive shows.
+
+Runs back-to-back shows through ConnectionManager with the offline model, audience
+questions arriving and a fake client on every session, and reports traced Python
+memory after each batch of shows plus the allocation sites that grew the most.
+
+    python -m benchmarks.show_memory --shows 100
+"""
+import argparse
+import asyncio
+import contextlib
+import gc
+import io
+import json
+import os
+import sys
+import tempfile
+
+from agents.offline import OfflineModel, configure_offline_env, use_offline_model
+
+configure_offline_env()
+os.environ["PODCAST_WARMUP"] = "0"
+os.environ["PODCAST_SUBMISSIONS"] = os.path.join(tempfile.mkdtemp(), "submissions.json")
+
+import main
+from agents.guest import AltoTechCEO
+from agents.host import ElonMuskHost
+from benchmarks.hot_paths import FakeWebSocket
+from context.topics import OPENING_PROMPT
+from server.memory import MemoryInspector
+from ui.prompts import PodcastPrompts
+
+class OfflineManager(main.ConnectionManager):
+    """Builds every show on the offline model instead of Azure."""
+
+    def __init__(self, model: OfflineModel):
+        super().__init__()
+        self.model = model
+        # Short, fast turns so a show fits in about a second
+        self.scheduler_options = {"prior_generation": 0.01, "prior_airtime": 0.01, "words_per_second": 1000}
+
+    def warm_up(self):
+        pass
+
+    def _take_show(self):
+        prompts, host, guest = PodcastPrompts(self.submissions_path), ElonMuskHost(), AltoTechCEO()
+        for target in (prompts, host, guest):
+            use_offline_model(target, self.model)
+        return prompts, host, guest, asyncio.create_task(host.generate_response(OPENING_PROMPT))
+
+async def ask_questions(path: str, interval: float) -> None:
+    """Keep audience questions arriving while shows run."""
+    count = 0
+    while True:
+        await asyncio.sleep(interval)
+        count += 1
+        try:
+            with open(path, 'r') as f:
+                submissions = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            submissions = []
+        submissions.append({"name": f"Guest {count}", "question": f"How does question {count} scale?"})
+        with open(path, 'w') as f:
+            json.dump(submissions, f)
+
+async def run(shows: int, seconds: float, checkpoints: int) -> None:
+    # The manager logs every frame; only this benchmark's own lines go to the terminal
+    out = sys.stdout
+    with contextlib.redirect_stdout(io.StringIO()) as log:
+        await run_shows(shows, seconds, checkpoints, out, log)
+
+async def run_shows(shows: int, seconds: float, checkpoints: int, out, log: io.StringIO) -> None:
+    inspector = MemoryInspector()
+    inspector.start()
+    manager = OfflineManager(OfflineModel(latency=0.002))
+    for session, connections in manager.sessions.items():
+        # Speakers report that they finished speaking, like a real client after playback
+        done = {f"{session}IsSpeaking": False}
+        on_send = (lambda text, done=done, session=session: asyncio.get_running_loop().call_soon(manager.update_speaking_state, done, session)) \
+            if session in manager.speaker_roles else None
+        connections.append(FakeWebSocket(on_send))
+    manager.ensure_queue_processor()
+    asker = asyncio.create_task(ask_questions(manager.submissions_path, 0.05))
+
+    every = max(1, shows // checkpoints)
+    readings = []
+    for show in range(1, shows + 1):
+        await manager.run_podcast(minutes=seconds / 60)
+        log.seek(0)
+        log.truncate()
+        if show % every == 0 or show == shows:
+            gc.collect()
+            readings.append((show, inspector.traced_kib))
+            print(f"after show {show:4d}: {readings[-1][1]:9.1f} KiB traced ({manager.state.exchange_count} turns last show)", file=out)
+            # The first checkpoint still includes warm-up (imports, caches, regexes)
+            if len(readings) == 2:
+                inspector.mark("steady")
+
+    asker.cancel()
+    await manager.shutdown()
+    (first_show, first), (last_show, last) = readings[min(1, len(readings) - 1)], readings[-1]
+    per_show = (last - first) / max(1, last_show - first_show)
+    print(f"growth from show {first_show} to {last_show}: {last - first:+.1f} KiB ({per_show:+.2f} KiB/show)", file=out)
+    if "steady" not in inspector.marks:
+        return
+    print(f"top growth sites since show {first_show}:", file=out)
+    for site in inspector.report(top=8, since="steady")["growth"]:
+        print(f"  {site['kib']:+8.1f} KiB  {site['site']}", file=out)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--shows", type=int, default=100)
+    parser.add_argument("--seconds", type=float, default=1.0, help="Slot length of each show")
+    parser.add_argument("--checkpoints", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(run(args.shows, args.seconds, args.checkpoints))
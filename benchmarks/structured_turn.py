@@ -0,0 +1,62 @@
+# altotech_podcast/benchmarks/structured_turn.py
+"""Compare the three-call exchange (host, guest, producer) with the structured host turn.
+
+Runs entirely offline: every LLM call goes to an OfflineModel with simulated latency.
+
+    python -m benchmarks.structured_turn --exchanges 20 --latency 0.05
+"""
+import argparse
+import asyncio
+import time
+
+from agents.offline import OfflineModel, configure_offline_env, use_offline_model
+
+configure_offline_env()
+
+from agents.host import ElonMuskHost
+from agents.guest import AltoTechCEO
+from models.enums import TopicArea
+from ui.prompts import PodcastPrompts
+
+async def three_call_loop(host, guest, prompts, exchanges: int) -> None:
+    topic = TopicArea.PRODUCT_INNOVATION
+    for _ in range(exchanges):
+        question = await host.generate_response(f"Ask a follow-up question about {topic.display_name}", topic=topic.value)
+        await guest.generate_response(question, topic=topic.value)
+        await prompts.should_continue(topic, [question])
+
+async def structured_loop(host, guest, exchanges: int) -> None:
+    topic = TopicArea.PRODUCT_INNOVATION
+    for _ in range(exchanges):
+        turn = await host.generate_turn(
+            f"Ask a follow-up question about {topic.display_name}",
+            topic=topic.value,
+            next_topic=TopicArea.CUSTOMER_SUCCESS.display_name
+        )
+        await guest.generate_response(turn.question, topic=topic.value)
+
+async def main(exchanges: int, latency: float) -> None:
+    host, guest, prompts = ElonMuskHost(), AltoTechCEO(), PodcastPrompts()
+    results = {}
+    for name in ("three-call", "structured"):
+        model = OfflineModel(latency=latency, seed=0)
+        for target in (host, guest, prompts):
+            use_offline_model(target, model)
+        start = time.perf_counter()
+        if name == "three-call":
+            await three_call_loop(host, guest, prompts, exchanges)
+        else:
+            await structured_loop(host, guest, exchanges)
+        elapsed = time.perf_counter() - start
+        results[name] = (model.calls, elapsed)
+        print(f"{name:<11} {model.calls:4d} LLM calls  {elapsed:7.3f}s  {elapsed / exchanges * 1000:7.1f} ms/exchange")
+
+    saved = 1 - results["structured"][1] / results["three-call"][1]
+    print(f"structured turn saves {saved:.0%} of exchange latency")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--exchanges", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.05, help="Simulated seconds per LLM call")
+    args = parser.parse_args()
+    asyncio.run(main(args.exchanges, args.latency))
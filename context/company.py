@@ -24,6 +24,14 @@ class CustomerSuccess(BaseModel):
     results: dict[str, Any]
     testimonial: str | None = None
 
+    @property
+    def headline(self) -> str:
+        """Short headline result, preferring energy savings when reported."""
+        if 'energy_savings' in self.results:
+            return f"{self.results['energy_savings']} savings"
+        key, value = next(iter(self.results.items()))
+        return f"{key.replace('_', ' ')}: {value}"
+
 class CompanyContext(BaseModel):
     """AltoTech Global company context from official documents."""
     name: str = "AltoTech Global"
@@ -125,6 +133,6 @@ Recent Milestones:
 
 Customer Success:
 {chr(10).join(
-    f"- {cs.name} ({cs.location}): {cs.results['energy_savings']} savings"
+    f"- {cs.name} ({cs.location}): {cs.headline}"
     for cs in self.success_stories
 )}"""
\ No newline at end of file
@@ -0,0 +1,214 @@
+# altotech_podcast/context/coverage.py
+import re
+from dataclasses import dataclass, field
+from typing import Any, NamedTuple
+
+import numpy as np
+
+from context.company import CompanyContext
+from context.topics import TOPIC_PROMPTS
+from models.enums import TopicArea
+
+_TOKEN = re.compile(r"\d+(?:\.\d+)?|[a-z]+")
+_STOP_WORDS = {
+    "a", "about", "all", "an", "and", "are", "as", "at", "be", "but", "by", "can", "do", "does", "for",
+    "from", "get", "has", "have", "how", "i", "in", "including", "is", "it", "its", "of", "on", "or",
+    "our", "so", "some", "such", "that", "the", "this", "to", "up", "was", "we", "what", "when",
+    "where", "which", "who", "why", "will", "with", "you", "your",
+}
+# Numbers identify a metric far better than the words around it
+NUMBER_BOOST = 2.0
+# Surface words remembered per index (most are not in the vocabulary at all)
+MAX_LOOKUP = 20_000
+
+def _stem(word: str) -> str:
+    for suffix in ("ing", "ed", "es", "s"):
+        if word.endswith(suffix) and len(word) - len(suffix) >= 4:
+            return word[:-len(suffix)]
+    return word
+
+def _term(token: str) -> str | None:
+    if token in _STOP_WORDS or (len(token) == 1 and not token.isdigit()):
+        return None
+    return _stem(token)
+
+def terms(text: str) -> list[str]:
+    """Lower-cased, stemmed content words and numbers ("388% YoY" -> ["388", "yoy"])."""
+    return [term for token in _TOKEN.findall(text.lower()) if (term := _term(token)) is not None]
+
+class Fact(NamedTuple):
+    kind: str  # "metric", "story" or "milestone"
+    name: str
+    text: str
+
+def company_facts(company: CompanyContext | None = None) -> list[Fact]:
+    """Metrics, customer stories and milestones the guest can cite."""
+    company = company or CompanyContext()
+    facts = [
+        Fact("metric", name, f"{name.replace('_', ' ')} {value}")
+        for name, value in company.metrics.model_dump().items()
+    ]
+    facts += [Fact("story", story.name, f"{story.name} {story.location} {story.headline}") for story in company.success_stories]
+    facts += [Fact("milestone", milestone, milestone) for milestone in company.key_milestones]
+    return facts
+
+class CoverageIndex:
+    """Term vectors for every suggested question and company fact, built once.
+
+    Rows are IDF-weighted and sum to 1, so a target's score is the share of its
+    weight whose terms have come up. Matrices are stored term-major (vocabulary x
+    targets), so one term's weights are a contiguous row.
+    """
+
+    def __init__(self, questions: dict[TopicArea, list[str]], facts: list[Fact]):
+        self.questions = questions
+        self.facts = facts
+        texts = [q for qs in questions.values() for q in qs] + [fact.text for fact in facts]
+        documents = [set(terms(text)) for text in texts]
+        self.vocabulary: dict[str, int] = {}
+        for document in documents:
+            for term in sorted(document):
+                self.vocabulary.setdefault(term, len(self.vocabulary))
+        frequency = np.zeros(len(self.vocabulary))
+        for document in documents:
+            frequency[[self.vocabulary[term] for term in document]] += 1
+        self.idf = np.log((len(documents) + 1) / (frequency + 1)) + 1
+        self.question_weights = {
+            topic: self._weights(qs, boost_numbers=False) for topic, qs in questions.items()
+        }
+        self.fact_weights = self._weights([fact.text for fact in facts], boost_numbers=True)
+        # Surface token -> vocabulary row (-1 when it is not a term we track)
+        self._lookup: dict[str, int] = {}
+
+    def _weights(self, texts: list[str], boost_numbers: bool) -> np.ndarray:
+        weights = np.zeros((len(self.vocabulary), len(texts)))
+        for column, text in enumerate(texts):
+            for term in set(terms(text)):
+                row = self.vocabulary[term]
+                weights[row, column] = self.idf[row] * (NUMBER_BOOST if boost_numbers and term[0].isdigit() else 1.0)
+            total = weights[:, column].sum()
+            if total:
+                weights[:, column] /= total
+        return weights
+
+    def term_ids(self, text: str) -> set[int]:
+        """Vocabulary rows of the tracked terms in ``text``; one regex pass plus dict lookups."""
+        lookup = self._lookup
+        ids = set()
+        for token in _TOKEN.findall(text.lower()):
+            index = lookup.get(token)
+            if index is None:
+                if token[0].isdigit():
+                    # Numbers are their own term; remembering every one would grow without bound
+                    index = self.vocabulary.get(token, -1)
+                else:
+                    term = _term(token)
+                    index = self.vocabulary.get(term, -1) if term is not None else -1
+                    if len(lookup) < MAX_LOOKUP:
+                        lookup[token] = index
+            if index >= 0:
+                ids.add(index)
+        return ids
+
+_default_index: CoverageIndex | None = None
+
+def default_index() -> CoverageIndex:
+    """Index over TOPIC_PROMPTS and the default CompanyContext, shared by all trackers."""
+    global _default_index
+    if _default_index is None:
+        _default_index = CoverageIndex(
+            {topic: list(prompt.suggested_questions or []) for topic, prompt in TOPIC_PROMPTS.items()},
+            company_facts(),
+        )
+    return _default_index
+
+@dataclass
+class _Scope:
+    scores: np.ndarray
+    seen: set[int] = field(default_factory=set)
+
+class CoverageTracker:
+    """Live coverage of the topics' suggested questions and the company facts.
+
+    Each line only adds the weights of terms not seen before in its scope, so an
+    update costs O(new tokens) however long the show runs. Only guest lines count:
+    the host is prompted with the open questions, so asking one does not cover it.
+    Questions are scoped to the line's topic.
+    """
+
+    def __init__(self, index: CoverageIndex | None = None, threshold: float = 0.5):
+        self.index = index or default_index()
+        self.threshold = threshold
+        self.topics = {topic: _Scope(np.zeros(weights.shape[1])) for topic, weights in self.index.question_weights.items()}
+        self.facts = _Scope(np.zeros(len(self.index.facts)))
+
+    def observe(self, dialogue: dict[str, Any]) -> None:
+        """Fold one dialogue entry (with its "topic") into the scores."""
+        if dialogue.get("role") != "guest":
+            return
+        ids = self.index.term_ids(dialogue["content"])
+        if not ids:
+            return
+        topic = dialogue.get("topic")
+        if topic in self.topics:
+            self._add(self.topics[topic], self.index.question_weights[topic], ids)
+        self._add(self.facts, self.index.fact_weights, ids)
+
+    @staticmethod
+    def _add(scope: _Scope, weights: np.ndarray, ids: set[int]) -> None:
+        # Repeated terms are filtered before touching NumPy; most lines add only a few
+        new = ids - scope.seen
+        if new:
+            scope.seen |= new
+            scope.scores += weights[list(new)].sum(axis=0)
+
+    def question_scores(self, topic: TopicArea) -> list[tuple[str, float]]:
+        return list(zip(self.index.questions[topic], self.topics[topic].scores.tolist()))
+
+    def covered_questions(self, topic: TopicArea) -> list[str]:
+        return [question for question, score in self.question_scores(topic) if score >= self.threshold]
+
+    def open_questions(self, topic: TopicArea) -> list[str]:
+        return [question for question, score in self.question_scores(topic) if score < self.threshold]
+
+    def topic_complete(self, topic: TopicArea) -> bool:
+        """Every suggested question of ``topic`` has come up."""
+        scores = self.topics[topic].scores
+        return bool(len(scores)) and bool((scores >= self.threshold).all())
+
+    def cited_facts(self, kind: str | None = None) -> list[Fact]:
+        return self._facts(kind, cited=True)
+
+    def uncited_facts(self, kind: str | None = None) -> list[Fact]:
+        return self._facts(kind, cited=False)
+
+    def _facts(self, kind: str | None, cited: bool) -> list[Fact]:
+        covered = self.facts.scores >= self.threshold
+        return [
+            fact for fact, is_covered in zip(self.index.facts, covered.tolist())
+            if is_covered == cited and (kind is None or fact.kind == kind)
+        ]
+
+    def report(self) -> dict[str, Any]:
+        return {
+            "topics": {
+                topic.value: {question: round(score, 2) for question, score in self.question_scores(topic)}
+                for topic in self.topics
+            },
+            "cited": {fact.name: fact.kind for fact in self.cited_facts()},
+            "uncited_metrics": [fact.name for fact in self.uncited_facts("metric")],
+        }
+
+def describe_coverage(coverage: CoverageTracker, topic: TopicArea, facts: int = 4) -> str:
+    """Prompt lines: which suggested questions are still open and which metrics are unused."""
+    lines = []
+    open_questions = coverage.open_questions(topic)
+    covered = coverage.covered_questions(topic)
+    if open_questions:
+        lines += ["Questions not covered yet:", *(f"- {q}" for q in open_questions)]
+    if covered:
+        lines += ["Already covered (don't repeat):", *(f"- {q}" for q in covered)]
+    unused = coverage.uncited_facts("metric")[:facts]
+    if unused:
+        lines.append("Metrics the guest hasn't mentioned yet: " + "; ".join(fact.text for fact in unused))
+    return "\n".join(lines)
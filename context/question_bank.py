@@ -0,0 +1,115 @@
+# altotech_podcast/context/question_bank.py
+import asyncio
+import json
+import os
+import random
+from typing import Any, Awaitable
+
+from context.coverage import terms
+from context.topics import TOPIC_PROMPTS
+from models.enums import TopicArea
+
+DEFAULT_BANK_PATH = os.path.join(os.path.dirname(__file__), "question_bank.json")
+
+def _words(text: str) -> set[str]:
+    return set(terms(text))
+
+def _similarity(a: set[str], b: set[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+class QuestionBank:
+    """Pre-generated opening questions and transition lines, indexed by topic.
+
+    File layout::
+
+        {"topics": {"<topic>": {"openings": [...], "transitions": {"<previous topic>": [...]}}}}
+    """
+
+    def __init__(self, topics: dict[str, dict[str, Any]] | None = None):
+        self.topics = topics or {}
+        self._used: set[str] = set()
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_BANK_PATH) -> "QuestionBank":
+        """Load a bank from disk, or return an empty bank if there is none."""
+        try:
+            with open(path, 'r') as f:
+                return cls(json.load(f).get("topics", {}))
+        except (FileNotFoundError, json.JSONDecodeError) as e:
+            print(f"No question bank loaded ({e}), host questions will be generated live")
+            return cls()
+
+    def save(self, path: str = DEFAULT_BANK_PATH) -> None:
+        with open(path, 'w') as f:
+            json.dump({"topics": self.topics}, f, indent=2, ensure_ascii=False)
+
+    def pick(self, topic: str, previous_topic: str = "", recent_dialogue: list[str] | None = None) -> str | None:
+        """Pick an unused line for a topic opening, least similar to the recent dialogue."""
+        entry = self.topics.get(topic, {})
+        candidates = entry.get("transitions", {}).get(previous_topic, []) if previous_topic else []
+        candidates = candidates or entry.get("openings", [])
+        candidates = [c for c in candidates if c not in self._used]
+        if not candidates:
+            return None
+
+        recent = [_words(line) for line in recent_dialogue or []]
+        def overlap(candidate: str) -> float:
+            words = _words(candidate)
+            return max((_similarity(words, r) for r in recent), default=0.0)
+
+        lowest = min(overlap(c) for c in candidates)
+        choice = random.choice([c for c in candidates if overlap(c) == lowest])
+        self._used.add(choice)
+        return choice
+
+async def build_question_bank(host: Any, per_topic: int = 5, concurrency: int = 4) -> QuestionBank:
+    """Generate openings and transition lines for every topic through the host agent."""
+    semaphore = asyncio.Semaphore(concurrency)
+    fillers = set(getattr(host, 'filler_lines', []))
+    topics = list(TOPIC_PROMPTS)
+
+    async def generate(topic: TopicArea, previous_topic: str) -> str | None:
+        async with semaphore:
+            line = await host.generate_response(
+                f"Ask about {topic.display_name}",
+                topic=topic.value,
+                previous_topic=previous_topic
+            )
+        # Filler lines mean the call failed; they don't belong in the bank
+        return None if line in fillers else line
+
+    jobs: list[tuple[str, str, Awaitable[str | None]]] = []
+    for index, topic in enumerate(topics):
+        previous_topics = [""] + ([topics[index - 1].value] if index > 0 else [])
+        for previous_topic in previous_topics:
+            for _ in range(per_topic):
+                jobs.append((topic.value, previous_topic, generate(topic, previous_topic)))
+
+    results = await asyncio.gather(*(job for _, _, job in jobs))
+    bank: dict[str, dict[str, Any]] = {topic.value: {"openings": [], "transitions": {}} for topic in topics}
+    for (topic, previous_topic, _), line in zip(jobs, results):
+        if line is None:
+            continue
+        if previous_topic:
+            lines = bank[topic]["transitions"].setdefault(previous_topic, [])
+        else:
+            lines = bank[topic]["openings"]
+        if line not in lines:
+            lines.append(line)
+    return QuestionBank(bank)
+
+if __name__ == "__main__":
+    import argparse
+    from agents.host import ElonMuskHost
+
+    parser = argparse.ArgumentParser(description="Pre-generate the host question bank")
+    parser.add_argument("--per-topic", type=int, default=5)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--output", default=DEFAULT_BANK_PATH)
+    args = parser.parse_args()
+
+    bank = asyncio.run(build_question_bank(ElonMuskHost(), args.per_topic, args.concurrency))
+    bank.save(args.output)
+    print(f"Saved question bank for {len(bank.topics)} topics to {args.output}")
@@ -9,6 +9,10 @@ class TopicPrompt(NamedTuple):
     context: str | None = None
     suggested_questions: list[str] | None = None
 
+OPENING_PROMPT = "Welcome AltoTech's lovely investors to the 4th AGM 2025. Give a very brief (1-3 sentences), engaging introduction to this talk about AltoTech and smart building solutions. You are happy to be the host today."
+
+CLOSING_PROMPT = "Give a brief, positive closing remark about AltoTech's potential impact on energy sustainability."
+
 # Mapping of topics to their prompts and context
 TOPIC_PROMPTS: dict[TopicArea, TopicPrompt] = {
     TopicArea.COMPANY_GROWTH: TopicPrompt(
@@ -0,0 +1,152 @@
+# altotech_podcast/engine/scheduler.py
+import time
+from collections import deque
+from contextlib import contextmanager
+from statistics import median
+from typing import Iterator
+
+from models.enums import Role, TopicArea
+
+class RollingCost:
+    """Rolling median of recent samples, with a prior until the first one arrives."""
+
+    def __init__(self, prior: float, window: int = 20):
+        self.prior = prior
+        self.samples: deque[float] = deque(maxlen=window)
+
+    def add(self, seconds: float) -> None:
+        self.samples.append(seconds)
+
+    @property
+    def value(self) -> float:
+        return median(self.samples) if self.samples else self.prior
+
+class ShowScheduler:
+    """Splits a fixed show slot across topics and decides which turns still fit.
+
+    Airtime is measured from speaking state transitions (falling back to a word-count
+    estimate when no client reports it); generation latency is timed per turn. While one
+    speaker is on air the next line is being generated, so a turn costs roughly
+    max(generation, airtime).
+    """
+
+    def __init__(
+        self,
+        total_seconds: float,
+        topics: list[TopicArea],
+        weights: dict[TopicArea, float] | None = None,
+        words_per_second: float = 2.5,
+        prior_generation: float = 4.0,
+        prior_airtime: float = 20.0,
+        panel_size: int = 1,
+    ):
+        self.total_seconds = total_seconds
+        self.topics = list(topics)
+        self.weights = {topic: (weights or {}).get(topic, 1.0) for topic in self.topics}
+        self.words_per_second = words_per_second
+        # Guest answers per exchange: generated together, but spoken one after another
+        self.panel_size = panel_size
+        self.generation = {role: RollingCost(prior_generation) for role in ("host", "guest")}
+        self.airtime = {role: RollingCost(prior_airtime) for role in ("host", "guest")}
+        # Word-count estimates, only used until real speaking time is measured
+        self.estimated_airtime = {role: RollingCost(prior_airtime) for role in ("host", "guest")}
+        self.started_at: float | None = None
+        self.topic_deadline: float | None = None
+        self.current_topic: TopicArea | None = None
+
+    def start(self) -> None:
+        self.started_at = time.monotonic()
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started_at if self.started_at is not None else 0.0
+
+    @property
+    def remaining(self) -> float:
+        return self.total_seconds - self.elapsed
+
+    # Measurements
+
+    @contextmanager
+    def generating(self, role: Role) -> Iterator[None]:
+        """Time one LLM turn for ``role``."""
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.generation[role].add(time.monotonic() - start)
+
+    def record_text(self, role: Role, text: str) -> None:
+        """Estimate airtime of a line from its length."""
+        self.estimated_airtime[role].add(len(text.split()) / self.words_per_second)
+
+    def record_airtime(self, role: Role, seconds: float) -> None:
+        """Measured speaking time of a line, from speaking state transitions."""
+        self.airtime[role].add(seconds)
+
+    # Predictions
+
+    def airtime_of(self, role: Role) -> float:
+        if self.airtime[role].samples:
+            return self.airtime[role].value
+        return self.estimated_airtime[role].value
+
+    def turn_cost(self, role: Role) -> float:
+        """Predicted wall time of one line, with generation hidden behind the other speaker."""
+        lines = self.panel_size if role == "guest" else 1
+        return max(self.generation[role].value, self.airtime_of(role) * lines)
+
+    @property
+    def exchange_cost(self) -> float:
+        """Predicted wall time of one host question plus guest answer."""
+        return self.turn_cost("host") + self.turn_cost("guest")
+
+    @property
+    def closing_cost(self) -> float:
+        return self.generation["host"].value + self.airtime_of("host")
+
+    # Decisions
+
+    def open_topic(self, topic: TopicArea) -> bool:
+        """Give ``topic`` its share of the time left; False if not even one exchange fits."""
+        available = self.remaining - self.closing_cost
+        if available < self.exchange_cost:
+            return False
+        upcoming = self.topics[self.topics.index(topic):] if topic in self.topics else [topic]
+        share = available * self.weights.get(topic, 1.0) / sum(self.weights.get(t, 1.0) for t in upcoming)
+        self.current_topic = topic
+        self.topic_deadline = time.monotonic() + max(share, self.exchange_cost)
+        return True
+
+    def exchanges_left(self) -> int:
+        """Exchanges the current topic can still afford."""
+        if self.topic_deadline is None:
+            return 0
+        topic_left = self.topic_deadline - time.monotonic()
+        show_left = self.remaining - self.closing_cost
+        return max(0, int(min(topic_left, show_left) // self.exchange_cost))
+
+    def can_afford_exchange(self) -> bool:
+        return self.exchanges_left() >= 1
+
+    def audience_questions_affordable(self, seconds_per_question: float) -> int:
+        """Audience questions that fit in the current topic beyond one exchange."""
+        if not self.can_afford_exchange():
+            return 0
+        topic_left = min(self.topic_deadline - time.monotonic(), self.remaining - self.closing_cost)
+        spare = topic_left - self.exchange_cost
+        return 1 + max(0, int(spare // seconds_per_question))
+
+    def should_close(self) -> bool:
+        """True once only the closing line still fits."""
+        return self.remaining - self.closing_cost < self.exchange_cost
+
+    def report(self) -> dict[str, float | str | None]:
+        return {
+            "total_seconds": self.total_seconds,
+            "elapsed_seconds": round(self.elapsed, 1),
+            "remaining_seconds": round(self.remaining, 1),
+            "topic": self.current_topic.display_name if self.current_topic else None,
+            "exchanges_left": self.exchanges_left(),
+            "exchange_cost_seconds": round(self.exchange_cost, 1),
+        }
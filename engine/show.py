@@ -0,0 +1,296 @@
+# altotech_podcast/engine/show.py
+from contextlib import nullcontext
+from typing import Any, Awaitable, Callable, ContextManager
+
+from agents.base import PodcastAgent
+from agents.panel import Panel
+from context.question_bank import QuestionBank
+from context.topics import OPENING_PROMPT, CLOSING_PROMPT
+from engine.scheduler import ShowScheduler
+from engine.sinks import SinkSet, TurnEvent
+from models.audience import AudienceBatchBudget, group_related_questions
+from models.enums import DialogueType, Role, TopicArea
+from models.state import PodcastState
+from models.turns import TurnSignal
+from ui.prompts import PodcastPrompts
+
+class PodcastEngine:
+    """The show loop: opening, topics, follow-ups, audience questions and closing.
+
+    Every line is recorded in ``state`` and emitted to the sinks, which render it at
+    their own pace. ``pace`` is the only thing the loop waits on between lines (the web
+    show waits for each line to go out); without it the show runs as fast as the
+    models answer.
+
+    Topics end when the scheduler says their share of the slot is used, after
+    ``max_turns_per_topic`` exchanges, or when the producer says so in a follow-up
+    turn (``producer_signals``). With ``move_on_when_covered``, a topic also ends once
+    the guest has covered all of its suggested questions, but not before
+    ``min_turns_when_covered`` exchanges. Audience questions are
+    answered after each exchange, batched when a backlog builds up, as many as the
+    scheduler affords or at most ``audience_per_exchange``.
+    """
+
+    def __init__(
+        self,
+        prompts: PodcastPrompts,
+        host: PodcastAgent,
+        guest: PodcastAgent,
+        sinks: SinkSet,
+        topics: list[TopicArea] | None = None,
+        question_bank: QuestionBank | None = None,
+        state: PodcastState | None = None,
+        scheduler: ShowScheduler | None = None,
+        panel: Panel | None = None,
+        max_turns_per_topic: int | None = None,
+        producer_signals: bool = True,
+        move_on_when_covered: bool = False,
+        min_turns_when_covered: int = 2,
+        audience_budget: AudienceBatchBudget | None = None,
+        audience_per_exchange: int | None = None,
+        pace: Callable[[], Awaitable[None]] | None = None,
+    ):
+        self.prompts = prompts
+        self.host = host
+        self.guest = guest
+        self.sinks = sinks
+        self.topics = topics or list(TopicArea)
+        self.question_bank = question_bank or QuestionBank.load()
+        self.state = state or PodcastState(current_topic=self.topics[0])
+        self.scheduler = scheduler
+        self.panel = panel
+        self.max_turns_per_topic = max_turns_per_topic
+        # Panel follow-ups address everyone, so they stay plain questions
+        self.producer_signals = producer_signals and panel is None
+        self.move_on_when_covered = move_on_when_covered
+        self.min_turns_when_covered = min_turns_when_covered
+        self.audience_budget = audience_budget or AudienceBatchBudget()
+        self.audience_per_exchange = audience_per_exchange
+        self.pace = pace
+        self.running = False
+
+    def stop(self) -> None:
+        """Finish the current line and skip the rest of the show, closing included."""
+        self.running = False
+
+    def emit(self, kind: str, content: str = "", **fields: Any) -> None:
+        self.sinks.emit(TurnEvent(kind, content, topic=self.state.current_topic.value, **fields))
+
+    def _generating(self, role: Role) -> ContextManager[None]:
+        return self.scheduler.generating(role) if self.scheduler else nullcontext()
+
+    def say(self, role: Role, content: str, dialogue_type: DialogueType, session: str | None = None) -> None:
+        """Put a line on the record and in front of every sink."""
+        speaker = self.panel.name_of(session) if self.panel and session else None
+        if self.scheduler:
+            self.scheduler.record_text(role, content)
+        dialogue = {"role": role, "content": content, "dialogue_type": dialogue_type}
+        if speaker:
+            dialogue["speaker"] = speaker
+        self.state.add_dialogue(dialogue)
+        self.emit("line", content, role=role, dialogue_type=dialogue_type, session=session, speaker=speaker)
+        # Tokenizing for coverage waits until the line is on its way out
+        self.state.coverage.observe(dialogue)
+
+    async def _paced(self) -> None:
+        if self.pace is not None:
+            await self.pace()
+
+    def _open_topic(self, topic: TopicArea) -> bool:
+        if self.scheduler and not self.scheduler.open_topic(topic):
+            print(f"Out of time before {topic.display_name}, closing the show")
+            return False
+        self.state.current_topic = topic
+        self.emit("topic", topic.display_name)
+        return True
+
+    def _topic_done(self, topic: TopicArea, turns_in_topic: int) -> bool:
+        if self.scheduler and not self.scheduler.can_afford_exchange():
+            return True
+        if (
+            self.move_on_when_covered
+            and turns_in_topic >= self.min_turns_when_covered
+            and self.state.coverage.topic_complete(topic)
+        ):
+            return True
+        return bool(self.max_turns_per_topic) and turns_in_topic >= self.max_turns_per_topic
+
+    async def run(self, opening: Awaitable[str] | None = None) -> PodcastState:
+        """Run the show, from an already started ``opening`` if there is one."""
+        self.running = True
+        self.sinks.start()
+        if self.scheduler:
+            self.scheduler.start()
+        completed = False
+        try:
+            self.emit("header")
+            if opening is None:
+                with self._generating("host"):
+                    opening_line = await self.host.generate_response(OPENING_PROMPT)
+            else:
+                opening_line = await opening
+            self.say("host", opening_line, "transition")
+            await self._paced()
+
+            closing = await self._topics()
+            if self.running:
+                if closing is None:
+                    with self._generating("host"):
+                        closing = await self.host.generate_response(CLOSING_PROMPT)
+                self.say("host", closing, "transition")
+                await self._paced()
+            self.emit("footer")
+            completed = True
+        finally:
+            self.running = False
+            # A finished show lets its sinks catch up; a cancelled one leaves at once
+            await self.sinks.aclose(2.0 if completed else 0)
+        return self.state
+
+    async def _topics(self) -> str | None:
+        """The main conversation; returns the producer's closing line if it ended the show."""
+        topics = self.topics
+        current_topic_idx = 0
+        opened_topic = None
+        turns_in_topic = 0
+        while current_topic_idx < len(topics) and self.running:
+            topic = topics[current_topic_idx]
+            if topic != opened_topic:
+                if not self._open_topic(topic):
+                    break
+            elif self._topic_done(topic, turns_in_topic):
+                current_topic_idx += 1
+                continue
+
+            # Host question, with context if we have previous exchanges
+            topic_exchanges = self.state.get_current_topic_exchanges()
+            context = "\n".join(topic_exchanges) if topic_exchanges else ""
+            prompt = (
+                f"Ask a follow-up question about {topic.display_name}, building upon this context:\n{context}"
+                if context else
+                f"Ask about {topic.display_name}"
+            )
+            previous_topic = topics[current_topic_idx - 1].value if current_topic_idx > 0 else ""
+
+            # Topic openings come from the pre-generated bank; follow-ups are generated live
+            host_response = None
+            if topic != opened_topic:
+                host_response = self.question_bank.pick(topic.value, previous_topic, topic_exchanges)
+                opened_topic = topic
+                turns_in_topic = 0
+            elif self.producer_signals:
+                # Follow-ups carry the producer's decision, so no separate should_continue call
+                next_topic = topics[current_topic_idx + 1] if current_topic_idx + 1 < len(topics) else None
+                with self._generating("host"):
+                    turn = await self.host.generate_turn(
+                        prompt,
+                        topic=topic.value,
+                        next_topic=next_topic.display_name if next_topic else "",
+                        coverage=self.state.coverage
+                    )
+                if turn.signal == TurnSignal.END and turn.is_confident():
+                    return turn.question
+                if turn.signal == TurnSignal.MOVE_ON and turn.is_confident() and next_topic:
+                    current_topic_idx += 1
+                    topic = opened_topic = next_topic
+                    turns_in_topic = 0
+                    # The question is already written; the scheduler only re-plans the slot
+                    if self.scheduler:
+                        self.scheduler.open_topic(topic)
+                    self.state.current_topic = topic
+                    self.emit("topic", topic.display_name)
+                host_response = turn.question
+            if host_response is None:
+                with self._generating("host"):
+                    host_response = await self.host.generate_response(
+                        prompt,
+                        topic=topic.value,
+                        previous_topic=previous_topic,
+                        panel=self.panel.names if self.panel else None,
+                        coverage=self.state.coverage
+                    )
+            turns_in_topic += 1
+            self.say("host", host_response, "question")
+            await self._paced()
+
+            # Guest response
+            if self.panel:
+                # All panel answers are generated at once, then spoken in turn
+                with self._generating("guest"):
+                    answers = await self.panel.answer(host_response, topic=topic.value)
+                for session, answer in answers:
+                    self.say("guest", answer, "response", session)
+                guest_response = "\n".join(f"{self.panel.name_of(session)}: {answer}" for session, answer in answers)
+            else:
+                with self._generating("guest"):
+                    guest_response = await self.guest.generate_response(host_response, topic=topic.value)
+                self.say("guest", guest_response, "response")
+            await self._paced()
+
+            await self._audience(topic, guest_response)
+        return None
+
+    def _audience_affordable(self, answered: int) -> int:
+        affordable = (
+            self.scheduler.audience_questions_affordable(self.audience_budget.seconds_per_question)
+            if self.scheduler else self.prompts.pending_audience_question_count()
+        )
+        if self.audience_per_exchange is not None:
+            affordable = min(affordable, self.audience_per_exchange - answered)
+        return affordable
+
+    async def _audience(self, topic: TopicArea, guest_response: str) -> None:
+        """Answer pending audience questions; unaffordable ones wait for the next exchange."""
+        budget = self.audience_budget
+        answered = 0
+        while self.running:
+            pending = self.prompts.pending_audience_question_count()
+            affordable = self._audience_affordable(answered)
+            if pending == 0 or affordable <= 0:
+                break
+
+            # Large backlogs are answered in batches to keep the show on pace
+            if pending >= budget.threshold and affordable > 1:
+                questions = self.prompts.get_audience_questions(min(budget.questions_per_batch, affordable))
+                for question in questions:
+                    self.state.add_audience_question(question)
+                    self.emit("audience", question)
+                with self._generating("host"):
+                    host_followup = await self.host.generate_response(
+                        f"Address these audience questions: {'; '.join(questions)}",
+                        previous_response=guest_response,
+                        audience_question_groups=group_related_questions(questions),
+                        topic=topic.value
+                    )
+                guest_kwargs = {"word_budget": budget.word_budget(len(questions))}
+            else:
+                question = self.prompts.get_audience_question()
+                if question is None:
+                    break
+                questions = [question]
+                self.state.add_audience_question(question)
+                self.emit("audience", question)
+
+                # Host acknowledges previous response and asks audience question
+                with self._generating("host"):
+                    host_followup = await self.host.generate_response(
+                        f"Address this audience question: {question}",
+                        previous_response=guest_response,
+                        audience_question=question,
+                        topic=topic.value
+                    )
+                guest_kwargs = {}
+            answered += len(questions)
+            self.say("host", host_followup, "question")
+            await self._paced()
+
+            # Guest responds to audience
+            with self._generating("guest"):
+                guest_followup = await self.guest.generate_response(
+                    host_followup,
+                    topic=topic.value,
+                    **guest_kwargs
+                )
+            self.say("guest", guest_followup, "audience_response")
+            await self._paced()
+            guest_response = guest_followup
@@ -0,0 +1,223 @@
+# altotech_podcast/engine/sinks.py
+import asyncio
+import json
+import time
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from typing import Any, Literal, Protocol
+
+from models.enums import DialogueType, Role
+
+EventKind = Literal["header", "topic", "line", "audience", "info", "footer"]
+
+@dataclass
+class TurnEvent:
+    """Something that happened on the show, for every output to render its own way."""
+    kind: EventKind
+    content: str = ""
+    role: Role | None = None
+    dialogue_type: DialogueType | None = None
+    topic: str | None = None
+    # Speaker session and name, set for panel guests
+    session: str | None = None
+    speaker: str | None = None
+    at: float = field(default_factory=time.time)
+
+class Sink(Protocol):
+    async def handle(self, event: TurnEvent) -> None: ...
+
+class SinkRunner:
+    """One sink's bounded queue and the task that feeds it.
+
+    The engine only ever puts without waiting; when a sink falls ``maxsize`` events
+    behind, its oldest event is dropped rather than holding up the show.
+    """
+
+    def __init__(self, sink: Sink, maxsize: int = 256):
+        self.sink = sink
+        self.queue: asyncio.Queue[TurnEvent] = asyncio.Queue(maxsize)
+        self.handled = 0
+        self.dropped = 0
+        self.errors = 0
+        self.max_delay = 0.0
+        self._task: asyncio.Task | None = None
+
+    @property
+    def name(self) -> str:
+        return type(self.sink).__name__
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def put(self, event: TurnEvent) -> None:
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.queue.task_done()
+            self.dropped += 1
+            if self.dropped == 1 or self.dropped % 100 == 0:
+                print(f"{self.name} is falling behind, {self.dropped} events dropped")
+        self.queue.put_nowait(event)
+
+    async def _run(self) -> None:
+        while True:
+            event = await self.queue.get()
+            try:
+                await self.sink.handle(event)
+                self.handled += 1
+                self.max_delay = max(self.max_delay, time.time() - event.at)
+            except Exception as e:
+                # A broken output must not take the others (or the show) down
+                self.errors += 1
+                print(f"{self.name} failed on a {event.kind} event: {type(e).__name__}: {e}")
+            finally:
+                self.queue.task_done()
+
+    async def drain(self, timeout: float | None = None) -> bool:
+        """Wait until every queued event is handled; False on timeout."""
+        try:
+            await asyncio.wait_for(self.queue.join(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    async def aclose(self, timeout: float = 2.0) -> None:
+        """Give queued events ``timeout`` seconds to go out, then stop and close the sink."""
+        if timeout > 0 and self._task is not None and not self._task.done():
+            await self.drain(timeout)
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.wait([self._task])
+            self._task = None
+        if hasattr(self.sink, "aclose"):
+            await self.sink.aclose()
+
+    def report(self) -> dict[str, Any]:
+        report = {
+            "queued": self.queue.qsize(),
+            "handled": self.handled,
+            "dropped": self.dropped,
+            "errors": self.errors,
+            "max_delay_ms": round(self.max_delay * 1000, 1),
+        }
+        if hasattr(self.sink, "report"):
+            report.update(self.sink.report())
+        return report
+
+class SinkSet:
+    """Fans show events out to every sink, each behind its own queue."""
+
+    def __init__(self, sinks: list[Sink], maxsize: int = 256):
+        self.runners = [SinkRunner(sink, maxsize) for sink in sinks]
+
+    def start(self) -> None:
+        for runner in self.runners:
+            runner.start()
+
+    def emit(self, event: TurnEvent) -> None:
+        for runner in self.runners:
+            runner.put(event)
+
+    def runner_for(self, sink: Sink) -> SinkRunner:
+        return next(runner for runner in self.runners if runner.sink is sink)
+
+    async def drain(self, sink: Sink, timeout: float | None = None) -> bool:
+        return await self.runner_for(sink).drain(timeout)
+
+    async def aclose(self, timeout: float = 2.0) -> None:
+        for runner in self.runners:
+            await runner.aclose(timeout)
+
+    def report(self) -> dict[str, Any]:
+        return {runner.name: runner.report() for runner in self.runners}
+
+class ConsoleSink:
+    """Renders events on a PodcastConsole (or anything with its print_* methods).
+
+    With ``threaded``, rendering happens in a worker thread, so slow terminal output
+    never stalls the event loop.
+    """
+
+    def __init__(self, console: Any, threaded: bool = True):
+        self.console = console
+        self.threaded = threaded
+
+    async def handle(self, event: TurnEvent) -> None:
+        if event.kind == "header":
+            call = (self.console.print_header,)
+        elif event.kind == "footer":
+            call = (self.console.print_footer,)
+        elif event.kind == "topic":
+            call = (self.console.print_topic, event.content)
+        elif event.kind == "audience":
+            call = (self.console.print_audience, event.content)
+        elif event.kind == "info":
+            call = (self.console.print_info, event.content)
+        elif event.role == "host":
+            call = (self.console.print_host, event.content)
+        else:
+            content = f"{event.speaker}: {event.content}" if event.speaker else event.content
+            call = (self.console.print_guest, content)
+        if self.threaded:
+            await asyncio.to_thread(*call)
+        else:
+            call[0](*call[1:])
+
+class BroadcastSink:
+    """Queues spoken lines for the speaker sessions of a ConnectionManager."""
+
+    def __init__(self, manager: Any, sessions: dict[str, str] | None = None):
+        self.manager = manager
+        # Default session per role; panel guests carry their own
+        self.sessions = sessions or {"host": "left", "guest": "right"}
+
+    async def handle(self, event: TurnEvent) -> None:
+        if event.kind == "line":
+            await self.manager.broadcast(event.content, event.session or self.sessions[event.role])
+
+class JournalSink:
+    """Appends every event to a JSONL file, written off the event loop."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+
+    def _write(self, line: str) -> None:
+        if self._file is None:
+            self._file = open(self.path, 'a')
+        self._file.write(line)
+        self._file.flush()
+
+    async def handle(self, event: TurnEvent) -> None:
+        await asyncio.to_thread(self._write, json.dumps(asdict(event), ensure_ascii=False) + "\n")
+
+    async def aclose(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+class MetricsSink:
+    """Counts lines and words per speaker and the gaps between spoken lines."""
+
+    def __init__(self):
+        self.lines: Counter[str] = Counter()
+        self.words: Counter[str] = Counter()
+        self.gaps: list[float] = []
+        self._last_line_at: float | None = None
+
+    async def handle(self, event: TurnEvent) -> None:
+        if event.kind != "line":
+            return
+        speaker = event.speaker or event.role or "unknown"
+        self.lines[speaker] += 1
+        self.words[speaker] += len(event.content.split())
+        if self._last_line_at is not None:
+            self.gaps.append(event.at - self._last_line_at)
+        self._last_line_at = event.at
+
+    def report(self) -> dict[str, Any]:
+        return {
+            "lines": dict(self.lines),
+            "words": dict(self.words),
+            "mean_gap_s": round(sum(self.gaps) / len(self.gaps), 2) if self.gaps else None,
+        }
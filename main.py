@@ -1,10 +1,15 @@
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+import time
+_import_start = time.perf_counter()
+
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Header, Request, Response, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from typing import List, Dict, Tuple
 import json
+import os
 import asyncio
-import uvicorn
-import time
+import itertools
 from random import choice
 
 # Import podcast components
@@ -12,10 +17,47 @@ from agents.host import ElonMuskHost
 from agents.guest import AltoTechCEO
 from models.state import PodcastState
 from models.enums import TopicArea
-from ui.console import PodcastConsole
+from models.audience import AudienceBatchBudget
+from context.topics import OPENING_PROMPT
 from ui.prompts import PodcastPrompts
+from server.message_queue import LaneQueue, MessageLane, QueuedMessage
+from server.frames import Frame, FrameBuffer
+from server.streams import sse_events, snapshot_etag
+from server.startup import StartupProfile
+from server.memory import MemoryInspector, RetentionLimits
+from server.connections import CLOSE_DEAD, CLOSE_IDLE, CLOSE_TRY_AGAIN_LATER, ConnectionLifecycle, ConnectionLimits, within
+from server.profiler import profile
+from server.translation import LANGUAGES, TranslationPipeline, create_translator
+from server.playback import InFlight, PlaybackTracker
+from engine.scheduler import ShowScheduler
+from engine.show import PodcastEngine
+from engine.sinks import BroadcastSink, JournalSink, MetricsSink, SinkSet
+from agents.panel import INVESTOR_PANEL, build_panel
+from agents.summarizer import ShowSummarizer, SummaryCache
+from agents.rate_limit import Priority, request_context
+from agents.routing import default_router
+
+startup_profile = StartupProfile()
+startup_profile.record("import main", time.perf_counter() - _import_start)
 
-app = FastAPI()
+# Opt-in allocation tracing for /debug/memory; it slows allocations, so it is off by default
+memory_inspector = MemoryInspector()
+if os.getenv("PODCAST_DEBUG_MEMORY", "0") == "1":
+    memory_inspector.start()
+# Opt-in sampling profiler for /debug/profile; one run at a time
+profiling_enabled = os.getenv("PODCAST_DEBUG_PROFILE", "0") == "1"
+profile_lock = asyncio.Lock()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Build the show and pre-generate its opening before the first /podcast/start
+    if os.getenv("PODCAST_WARMUP", "1") != "0":
+        manager.warm_up()
+    yield
+    # Leave no show, warm-up, queue task or socket behind
+    await manager.shutdown()
+
+app = FastAPI(lifespan=lifespan)
 
 # Add CORS middleware
 app.add_middleware(
@@ -52,41 +94,269 @@ class ConnectionManager:
             "right": [],
             "audience": []  # Add audience session
         }
-        # Track speaking states
-        self.speaking_states = {
-            "leftIsSpeaking": False,
-            "rightIsSpeaking": False,
-            "audienceIsSpeaking": False  # Add audience speaking state
-        }
+        # Show frames sent to speakers but not yet aired; acking clients get the next one early
+        self.playback = PlaybackTracker(prefetch=int(os.getenv("PODCAST_PREFETCH", "1")))
+        # Sessions that speak show lines (and the role they speak for)
+        self.speaker_roles = {"left": "host", "right": "guest"}
         # Podcast components
         self.host = None
         self.guest = None
         self.state = None
         self.is_podcast_running = False
-        # Priority queue for messages with timestamps
-        self.message_queue = asyncio.PriorityQueue()
+        # The task that owns the running show; cancelling it stops every in-flight call
+        self.show_task: asyncio.Task | None = None
+        self.stop_timeout = 5.0
+        self.shutting_down = False
+        # Airtime budget for the show slot
+        self.show_minutes = float(os.getenv("PODCAST_DURATION_MINUTES", "30"))
+        self.scheduler: ShowScheduler | None = None
+        self.scheduler_options: Dict[str, float] = {}
+        # The running show's loop, and the outputs its lines fan out to (kept after the show for stats)
+        self.engine: PodcastEngine | None = None
+        self.sinks: SinkSet | None = None
+        self.journal_path = os.getenv("PODCAST_JOURNAL")
+        # Limits for answering audience backlogs in batches
+        self.audience_budget = AudienceBatchBudget()
+        # How much history and queued work to keep across many shows
+        self.limits = RetentionLimits.from_env()
+        self.submissions_path = os.getenv("PODCAST_SUBMISSIONS", "qr/submissions.json")
+        # Post-show summaries, cached so asking again after the show costs nothing
+        self.summary_cache = SummaryCache(os.getenv("PODCAST_SUMMARY_CACHE"))
+        # Lane-based queue: control > show turns > audience chatter
+        self.message_queue = LaneQueue(self.limits.queued_per_lane)
+        # Frame numbers are given out when frames are sent, not queued, since control
+        # frames overtake show turns; every session then sees its frames in order
+        self.frame_seq = itertools.count(1)
         # Background task for processing queue
         self.queue_task = None
-        # Event for queue empty notification
+        # Admission caps, heartbeats and reaping, so only live listeners cost memory and sends
+        self.connections = ConnectionLifecycle(ConnectionLimits.from_env())
+        self.heartbeat_task: asyncio.Task | None = None
+        # Read-only SSE/long-poll subscribers (they hold a cursor, not a socket entry)
+        self.stream_subscribers = 0
+        # Per-language audience sessions ("audience:th") and their SSE subscriber counts
+        self.language_streams: Dict[str, int] = {}
+        self.translation: TranslationPipeline | None = None
+        # Recently sent frames per session, for catch-up on (re)connect
+        self.frame_buffers = {session: FrameBuffer(self.limits.frames_per_session) for session in self.sessions}
+        # Panel guests get their own speaker sessions
+        for profile in INVESTOR_PANEL:
+            self.add_session(profile.session, "guest")
+        self.snapshot_turns = 10
+        self._snapshot_cache: Tuple[tuple, str] | None = None
+        # Event set once no show turns are waiting to be sent
         self.queue_empty = asyncio.Event()
         self.queue_empty.set()  # Initially set to True as queue is empty
+        # Pre-built show components and opening line, ready for the next show
+        self.warm_show: Tuple[PodcastPrompts, ElonMuskHost, AltoTechCEO] | None = None
+        self.warm_opening: asyncio.Task | None = None
+
+    def add_session(self, session: str, role: str):
+        """Register a speaker session that clients can connect to"""
+        self.sessions.setdefault(session, [])
+        self.frame_buffers.setdefault(session, FrameBuffer(self.limits.frames_per_session))
+        self.speaker_roles[session] = role
+
+    def audience_session(self, lang: str | None) -> str:
+        """Session for an audience language, registering it on first use"""
+        if not lang or lang == "en":
+            return "audience"
+        if lang not in LANGUAGES:
+            raise KeyError(lang)
+        session = f"audience:{lang}"
+        self.sessions.setdefault(session, [])
+        self.frame_buffers.setdefault(session, FrameBuffer(self.limits.frames_per_session))
+        if self.translation is None:
+            self.translation = TranslationPipeline(create_translator(), self._publish_translation, self.active_languages)
+        return session
+
+    def active_languages(self) -> List[str]:
+        """Languages with at least one WebSocket or SSE listener"""
+        return [
+            session.split(":", 1)[1] for session in self.sessions
+            if session.startswith("audience:") and (self.sessions[session] or self.language_streams.get(session))
+        ]
+
+    async def _publish_translation(self, lang: str, text: str, meta: dict):
+        self.message_queue.put({"text": text, "lang": lang, **meta}, f"audience:{lang}", MessageLane.AUDIENCE)
+
+    def warm_up(self):
+        """Build the next show's agents and start generating its opening line"""
+        try:
+            with startup_profile.measure("PodcastPrompts()"):
+                prompts = PodcastPrompts(self.submissions_path)
+            with startup_profile.measure("ElonMuskHost()"):
+                host = ElonMuskHost()
+            with startup_profile.measure("AltoTechCEO()"):
+                guest = AltoTechCEO()
+        except Exception as e:
+            print(f"Warm-up failed, the show will be built on start: {e}")
+            return
+        self.warm_show = (prompts, host, guest)
+        self.warm_opening = asyncio.create_task(host.generate_response(OPENING_PROMPT))
+
+    def _take_show(self) -> Tuple[PodcastPrompts, ElonMuskHost, AltoTechCEO, asyncio.Task]:
+        if self.warm_show is not None and self.warm_opening is not None:
+            prompts, host, guest = self.warm_show
+            opening = asyncio.create_task(self._opening(host, self.warm_opening))
+        else:
+            prompts, host, guest = PodcastPrompts(self.submissions_path), ElonMuskHost(), AltoTechCEO()
+            opening = asyncio.create_task(self._opening(host))
+        self.warm_show = None
+        self.warm_opening = None
+        return prompts, host, guest, opening
 
-    async def connect(self, websocket: WebSocket, session: str):
+    async def _opening(self, host: ElonMuskHost, warm: asyncio.Task | None = None) -> str:
+        """The show's opening line; a filler left by a failed warm-up call is generated again"""
+        if warm is not None:
+            line = await warm
+            if line not in host.filler_lines:
+                return line
+            print("Warm-up opening fell back to a filler line, generating it again")
+        return await host.generate_response(OPENING_PROMPT)
+
+    def snapshot(self, session: str) -> str:
+        """Encoded catch-up snapshot: current topic and the last few turns"""
+        last_seq = self.frame_buffers[session].last_seq
+        key = (session, id(self.state), self.state.exchange_count if self.state else 0, last_seq)
+        if self._snapshot_cache is None or self._snapshot_cache[0] != key:
+            turns = self.state.dialogue_history[-self.snapshot_turns:] if self.state else []
+            # Language sessions get whatever translations are already cached
+            lang = session.split(":", 1)[1] if session.startswith("audience:") else None
+            translate = (lambda text: self.translation.cache.get(text, lang) or text) if lang and self.translation else (lambda text: text)
+            self._snapshot_cache = (key, json.dumps({
+                "type": "snapshot",
+                "session": session,
+                "seq": last_seq,
+                "topic": self.state.current_topic.display_name if self.state else None,
+                "turns": [{"role": t["role"], "content": translate(t["content"])} for t in turns],
+            }))
+        return self._snapshot_cache[1]
+
+    async def admit(self, websocket: WebSocket, session: str) -> bool:
+        """Reserve a slot for a new client, or tell it to come back later"""
+        reason = self.connections.admit(websocket, session, session in self.speaker_roles)
+        if reason is None:
+            return True
+        print(f"Rejected a connection to {session} session ({reason})")
+        try:
+            await websocket.accept()
+            await websocket.send_text(json.dumps({
+                "type": "control",
+                "event": "rejected",
+                "reason": reason,
+                "retry_after": self.connections.limits.retry_after,
+            }))
+            await websocket.close(code=CLOSE_TRY_AGAIN_LATER)
+        except Exception:
+            pass
+        return False
+
+    async def connect(self, websocket: WebSocket, session: str, resume_from: int | None = None, acks: bool = False):
         await websocket.accept()
+        buffer = self.frame_buffers[session]
+        missed = buffer.since(resume_from) if resume_from is not None else []
+        if missed is None or (resume_from is None and session.startswith("audience")):
+            # Too far behind (or a fresh audience client): compact snapshot instead of history
+            last_seq = buffer.last_seq
+            await websocket.send_text(self.snapshot(session))
+            missed = buffer.since(last_seq) or []
+        # Replay the delta; loop until nothing new arrived while we were sending
+        while missed:
+            for frame in missed:
+                await websocket.send_text(frame.text)
+            missed = buffer.since(missed[-1].seq) or []
         self.sessions[session].append(websocket)
+        if session in self.speaker_roles:
+            self.playback.add_client(websocket, session, acks)
         print(f"New connection to {session} session")
-        
-        # Start queue processor if not running
+        self.ensure_queue_processor()
+        self.ensure_heartbeat()
+
+    def ensure_queue_processor(self):
+        """Start the queue processor if it is not running"""
         if self.queue_task is None or self.queue_task.done():
             self.queue_task = asyncio.create_task(self.process_queue())
 
+    def ensure_heartbeat(self):
+        """Start the heartbeat task if it is not running"""
+        if self.heartbeat_task is None or self.heartbeat_task.done():
+            self.heartbeat_task = asyncio.create_task(self.heartbeat())
+
+    async def heartbeat(self):
+        """Ping every client and reap the dead and idle ones; ends when nobody is connected"""
+        limits = self.connections.limits
+        while self.connections.clients:
+            await asyncio.sleep(limits.heartbeat_seconds)
+            for websocket, reason in self.connections.expired():
+                await self.reap(websocket, reason)
+            # Pings skip the queue (and the catch-up buffers); a failed or stuck send is a dead client
+            ping = json.dumps({"type": "control", "event": "ping", "ts": time.time()})
+            clients = list(self.connections.clients)
+            sent = await asyncio.gather(*(self._send(websocket, ping) for websocket in clients))
+            for websocket, ok in zip(clients, sent):
+                if not ok:
+                    await self.reap(websocket, "dead")
+
+    async def _fan_out(self, connections: List[WebSocket], text: str) -> List[WebSocket]:
+        """Send to every connection; returns the ones that failed or got stuck.
+
+        One deadline covers the whole fan-out (a timer per send would cost more than the
+        sends); when it fires, the client being sent to is the stuck one and the rest
+        get a fresh deadline.
+        """
+        dead = []
+        index = 0
+
+        async def send_rest():
+            nonlocal index
+            while index < len(connections):
+                connection = connections[index]
+                index += 1
+                try:
+                    await connection.send_text(text)
+                except Exception:
+                    dead.append(connection)
+
+        while index < len(connections):
+            if not await within(send_rest(), self.connections.limits.send_timeout):
+                dead.append(connections[index - 1])
+        return dead
+
+    async def _send(self, websocket: WebSocket, text: str) -> bool:
+        try:
+            return await within(websocket.send_text(text), self.connections.limits.send_timeout)
+        except Exception:
+            return False
+
+    async def reap(self, websocket: WebSocket, reason: str):
+        """Drop a client the server has given up on and close its socket"""
+        info = self.connections.clients.get(websocket)
+        if info is None:
+            return
+        self._drop(websocket, info.session, reason)
+        print(f"Reaped {reason} connection from {info.session} session")
+        try:
+            await within(websocket.close(code=CLOSE_IDLE if reason == "idle" else CLOSE_DEAD), self.connections.limits.send_timeout)
+        except Exception:
+            pass
+
+    def _drop(self, websocket: WebSocket, session: str, reason: str):
+        self.connections.forget(websocket, reason)
+        if websocket in self.sessions[session]:
+            self.sessions[session].remove(websocket)
+            self._forget_client(websocket, session)
+
     def disconnect(self, websocket: WebSocket, session: str):
+        self.connections.forget(websocket, "client")
         if websocket in self.sessions[session]:
             self.sessions[session].remove(websocket)
             print(f"Disconnected from {session} session")
             
+            self._forget_client(websocket, session)
+            
             # Cancel queue processor if no connections in any session
-            if not any(self.sessions.values()) and self.queue_task:
+            if not any(self.sessions.values()) and not self.stream_subscribers and self.queue_task:
                 self.queue_task.cancel()
                 self.queue_task = None
 
@@ -94,235 +364,427 @@ class ConnectionManager:
         """Wait for the queue to be empty"""
         await self.queue_empty.wait()
 
+    def is_sendable(self, item: QueuedMessage) -> bool:
+        """Control frames always go out; speaker frames wait for a free playback slot."""
+        if item.lane == MessageLane.CONTROL:
+            return True
+        if item.session in self.speaker_roles:
+            return self.playback.can_send(item.session)
+        return True
+
+    def _update_queue_empty(self):
+        if self.message_queue.pending(MessageLane.SHOW):
+            self.queue_empty.clear()
+        else:
+            self.queue_empty.set()
+
     async def process_queue(self):
         """Background task to process message queue"""
         while True:
             try:
-                # Wait for a message in the queue
-                timestamp, (message, session) = await self.message_queue.get()
-                self.queue_empty.clear()  # Queue has items
-                
-                # Skip if any agent is speaking
-                if any(self.speaking_states.values()):
-                    # Put the message back at the front of the queue with original timestamp
-                    await self.message_queue.put((timestamp, (message, session)))
-                    self.message_queue.task_done()
-                    await asyncio.sleep(0.1)  # Small delay before next attempt
-                    continue
-                
-                # Send message to all connections in the session
-                dead_connections = []
-                print(f"\nProcessing queued message for {session} session:")
-                print(f"Message: {message}")
+                item = await self.message_queue.get(self.is_sendable)
+            except asyncio.CancelledError:
+                break
+            session = item.session
+            seq = next(self.frame_seq)
+            try:
+                print(f"\nProcessing queued message #{seq} ({item.lane.name.lower()}) for {session} session:")
+                print(f"Message: {item.message}")
                 print(f"Active connections: {len(self.sessions[session])}")
 
-                # Set speaking state before broadcasting
-                self.speaking_states[f"{session}IsSpeaking"] = True
+                if isinstance(item.message, dict):
+                    # Control and translated frames carry their own fields
+                    payload = {**item.message, "session": session, "seq": seq}
+                else:
+                    payload = {"text": item.message, "session": session, "seq": seq}
+                    # Clients hold the line until the frame ahead of it has finished playing
+                    if session in self.speaker_roles and self.sessions[session]:
+                        payload["play_after"] = self.playback.sent(seq, session)
+                if item.lane == MessageLane.CONTROL:
+                    # Control events (aired, stopping, stopped) only mean something when sent
+                    frame = Frame.encode(seq, payload)
+                else:
+                    # Buffer the frame so late joiners and reconnecting clients can catch up
+                    frame = self.frame_buffers[session].append(seq, payload)
+                # Every audience language gets the same caption stream; English needs no
+                # translation, the others are translated off the speaking path
+                if session in self.speaker_roles and item.lane == MessageLane.SHOW:
+                    meta = {"source_seq": seq, "speaker": self.speaker_roles[session]}
+                    self.message_queue.put({"text": item.message, "lang": "en", **meta}, "audience", MessageLane.AUDIENCE)
+                    if self.translation is not None:
+                        self.translation.submit(item.message, meta)
                 
                 if not self.sessions[session]:
                     print(f"No active connections for {session} session")
-                    self.message_queue.task_done()
-                    self.speaking_states[f"{session}IsSpeaking"] = False
                     continue
                 
-                for connection in self.sessions[session]:
-                    try:
-                        await connection.send_json({
-                            "text": message,
-                            "session": session
-                        })
-                    except:
-                        dead_connections.append(connection)
-                        print(f"Failed to send to a connection in {session} session")
+                dead_connections = await self._fan_out(list(self.sessions[session]), frame.text)
 
                 # Clean up dead connections
                 for dead in dead_connections:
-                    if dead in self.sessions[session]:
-                        self.sessions[session].remove(dead)
-                        print(f"Removed dead connection from {session} session")
+                    print(f"Failed to send to a connection in {session} session")
+                    self._drop(dead, session, "send_failed")
+                    print(f"Removed dead connection from {session} session")
                 
                 print(f"Message processed. Remaining connections: {len(self.sessions[session])}\n")
-                # Only mark as done after successful processing
-                self.message_queue.task_done()
-                
-                # Check if queue is empty and set event if it is
-                if self.message_queue.empty():
-                    self.queue_empty.set()
                 
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 print(f"Error processing queue: {str(e)}")
-                # Reset speaking state on error
-                if 'session' in locals():
-                    self.speaking_states[f"{session}IsSpeaking"] = False
+                # Never leave the show lane waiting on a frame that may not have gone out
+                if session in self.speaker_roles:
+                    self._on_aired(self.playback.release_session(session), measured=False)
                 await asyncio.sleep(0.1)  # Small delay before retrying
+            finally:
+                self._update_queue_empty()
 
-    async def broadcast(self, message: str, session: str):
+    async def broadcast(self, message: str, session: str, lane: MessageLane | None = None):
         """Add message to queue for broadcasting"""
-        # Use timestamp as priority (lower timestamp = higher priority)
-        timestamp = int(time.time() * 1000)  # millisecond timestamp
-        self.queue_empty.clear()  # Queue will have items
+        # Podcast turns on the speaker sessions use the show lane unless told otherwise
+        if lane is None:
+            lane = MessageLane.AUDIENCE if session.startswith("audience") else MessageLane.SHOW
         
         # Remove "Host:" prefix if present
         if message.startswith("Host:"):
             message = message[5:].strip()
             
-        await self.message_queue.put((timestamp, (message, session)))
-        print(f"Added message to queue. Queue size: {self.message_queue.qsize()}")
-
-    def update_speaking_state(self, state_update: dict):
-        # Update speaking states
-        if "leftIsSpeaking" in state_update:
-            self.speaking_states["leftIsSpeaking"] = state_update["leftIsSpeaking"]
-        if "rightIsSpeaking" in state_update:
-            self.speaking_states["rightIsSpeaking"] = state_update["rightIsSpeaking"]
-        
-        # Print current speaking states
-        print("\nCurrent speaking states:")
-        print(f"Left agent speaking: {self.speaking_states['leftIsSpeaking']}")
-        print(f"Right agent speaking: {self.speaking_states['rightIsSpeaking']}\n")
+        self.message_queue.put(message, session, lane)
+        self._update_queue_empty()
+        print(f"Added message to {lane.name.lower()} lane. Queue size: {len(self.message_queue)}")
+
+    async def send_control(self, payload: dict, session: str):
+        """Queue a control frame that bypasses show turns and audience chatter"""
+        self.message_queue.put({"type": "control", **payload}, session, MessageLane.CONTROL)
+
+    def ack(self, websocket: WebSocket, seq: int, event: str):
+        """A client started or finished playing show frame ``seq``"""
+        if event == "started":
+            self.playback.started(seq, websocket)
+        elif event == "finished":
+            self._on_aired(self.playback.finished(seq, websocket))
+
+    def update_speaking_state(self, state_update: dict, session: str):
+        """Legacy clients report {"leftIsSpeaking": bool}; it applies to the session's current frame.
+
+        Only the sender's own session key counts, so one client cannot air another session's frame.
+        """
+        key = f"{session}IsSpeaking"
+        frame = self.playback.current(session) if session in self.speaker_roles and key in state_update else None
+        if frame is not None:
+            if state_update[key]:
+                self.playback.started(frame.seq)
+            else:
+                self._on_aired(self.playback.finished(frame.seq))
+        print(f"Speaking state update, aired up to #{self.playback.aired_seq}")
 
-    async def run_podcast(self):
-        """Run the podcast conversation"""
+    def _on_aired(self, aired: List[Tuple[InFlight, float | None]], measured: bool = True):
+        """Book airtime for frames that finished playing and free their playback slots"""
+        if not aired:
+            return
+        for frame, airtime in aired:
+            if measured and airtime is not None and self.scheduler is not None:
+                self.scheduler.record_airtime(self.speaker_roles.get(frame.session, "guest"), airtime)
+        # Clients on other sessions holding a frame behind this one may start it now
+        aired_seq = aired[-1][0].seq
+        for session in {frame.session for frame in self.playback.in_flight if frame.session != aired[-1][0].session}:
+            self.message_queue.put({"type": "control", "event": "aired", "aired_seq": aired_seq}, session, MessageLane.CONTROL)
+        # Aired frames free slots on the show lane, so let the queue re-check
+        self.message_queue.notify()
+
+    def _forget_client(self, websocket: WebSocket, session: str):
+        self.playback.remove_client(websocket)
+        # A speaker that left mid-line will never ack it
+        if session in self.speaker_roles and not self.sessions[session]:
+            self._on_aired(self.playback.release_session(session), measured=False)
+        self.message_queue.notify()
+
+    async def run_podcast(self, minutes: float | None = None, panel: bool = False):
+        """Run the podcast conversation within its time slot, optionally with a guest panel"""
         print("Starting podcast conversation")
-        prompts = PodcastPrompts()
-        prompts.clear_submissions()
         if self.is_podcast_running:
             return
             
-        self.is_podcast_running = True
-        self.host = ElonMuskHost()
-        self.guest = AltoTechCEO()
-        self.state = PodcastState(current_topic=TopicArea.COMPANY_GROWTH)
-        
-        # Opening
-        opening = await self.host.generate_response(
-            "Welcome AltoTech's lovely investors to the 4th AGM 2025. Give a very brief (1-3 sentences), engaging introduction to this talk about AltoTech and smart building solutions. You are happy to be the host today."
-        )
-        await self.broadcast(opening, "left")
-        await self.wait_for_queue_empty()
-        
-        # Topics to cover
-        topics = list(TopicArea)
-        current_topic_idx = 0
-        
-        # Main conversation loop
-        while current_topic_idx < len(topics) and self.is_podcast_running:
-            topic = topics[current_topic_idx]
-            
-            # Host question
-            topic_exchanges = self.state.get_current_topic_exchanges()
-            context = "\n".join(topic_exchanges) if topic_exchanges else ""
-            prompt = (
-                f"Ask a follow-up question about {topic.display_name}, building upon this context:\n{context}"
-                if context else
-                f"Ask about {topic.display_name}"
-            )
-            
-            previous_topic = topics[current_topic_idx - 1].value if current_topic_idx > 0 else ""
-            
-            host_response = await self.host.generate_response(
-                prompt,
-                topic=topic.value,
-                previous_topic=previous_topic
+        prompts = opening_task = guest_panel = None
+        try:
+            self.is_podcast_running = True
+            prompts, self.host, self.guest, opening_task = self._take_show()
+            prompts.clear_submissions()
+            topics = list(TopicArea)
+            # Panel mode: the CEO plus panelists, each on their own session
+            guest_panel = build_panel(self.guest) if panel else None
+            scheduler = self.scheduler = ShowScheduler(
+                (minutes or self.show_minutes) * 60,
+                topics,
+                panel_size=len(guest_panel) if guest_panel else 1,
+                **self.scheduler_options
             )
-            await self.broadcast(host_response, "left")
-            self.state.add_dialogue({"role": "host", "content": host_response, "dialogue_type": "question"})
-            await self.wait_for_queue_empty()
+            broadcast = BroadcastSink(self)
+            sinks = [broadcast, MetricsSink()]
+            if self.journal_path:
+                sinks.append(JournalSink(self.journal_path))
+            self.sinks = SinkSet(sinks)
             
-            # Guest response
-            guest_response = await self.guest.generate_response(
-                host_response,
-                topic=topic.value
-            )
-            await self.broadcast(guest_response, "right")
-            self.state.add_dialogue({"role": "guest", "content": guest_response, "dialogue_type": "response"})
-            await self.wait_for_queue_empty()
-            
-            # Check for audience questions
-            while True:
-                
-                question = prompts.get_audience_question()
-                if question is None:
-                    break
-                
-                self.state.add_audience_question(question)
-                
-                # Host acknowledges previous response and asks audience question
-                host_followup = await self.host.generate_response(
-                    f"Address this audience question: {question}",
-                    previous_response=guest_response,
-                    audience_question=question,
-                    topic=topic.value
-                )
-                await self.broadcast(host_followup, "left")
-                self.state.add_dialogue({"role": "host", "content": host_followup, "dialogue_type": "question"})
+            async def pace():
+                # Once the broadcast sink has queued the line, wait for it to go out
+                await self.sinks.drain(broadcast)
                 await self.wait_for_queue_empty()
-                
-                # Guest responds to audience
-                guest_followup = await self.guest.generate_response(
-                    host_followup,
-                    topic=topic.value
-                )
-                await self.broadcast(guest_followup, "right")
-                self.state.add_dialogue({"role": "guest", "content": guest_followup, "dialogue_type": "response"})
-                await self.wait_for_queue_empty()
-            
-            # Get recent conversation history
-        #     recent_exchanges = self.state.get_current_topic_exchanges()
-            
-        #     # Check if we should end the podcast
-        #     if await prompts.should_end_podcast(topic, recent_exchanges):
-        #         break
-                
-        #     # Check if we should move to the next topic
-        #     if await prompts.should_continue(topic, recent_exchanges):
-        #         current_topic_idx += 1
-        #         if current_topic_idx < len(topics):
-        #             self.state.current_topic = topics[current_topic_idx]
-        
-        # # Closing remarks
-        # closing = await self.host.generate_response(
-        #     "Give a brief, positive closing remark about AltoTech's potential impact on energy sustainability."
-        # )
-        # await self.broadcast(closing, "left")
-        # await self.wait_for_queue_empty()
             
+            # The scheduler decides when a topic has used its share of the slot
+            self.engine = PodcastEngine(
+                prompts=prompts,
+                host=self.host,
+                guest=self.guest,
+                sinks=self.sinks,
+                topics=topics,
+                state=PodcastState(
+                    current_topic=topics[0],
+                    max_dialogue=self.limits.transcript_turns,
+                    max_audience_questions=self.limits.audience_questions
+                ),
+                scheduler=scheduler,
+                panel=guest_panel,
+                producer_signals=False,
+                audience_budget=self.audience_budget,
+                pace=pace,
+            )
+            self.state = self.engine.state
+            # Opening (usually already generated during warm-up)
+            await self.engine.run(opening_task)
+            print(f"Podcast finished after {scheduler.elapsed:.0f}s of a {scheduler.total_seconds:.0f}s slot")
+        except asyncio.CancelledError:
+            print("Podcast cancelled")
+            raise
+        finally:
+            # The show owns its opening line; never leave it generating
+            if opening_task is not None and not opening_task.done():
+                opening_task.cancel()
+                await asyncio.wait([opening_task])
+            self.is_podcast_running = False
+            self.engine = None
+            # Tear the show down so its agents and clients do not outlive it
+            components = [prompts, self.host, *(guest_panel.guests.values() if guest_panel else [self.guest])]
+            await self.release_show(*(component for component in components if component is not None))
+            self.host = self.guest = None
+            # Get the next show ready while the stage is idle
+            if not self.shutting_down:
+                self.warm_up()
+
+    async def release_show(self, *components):
+        """Close the HTTP clients of a finished (or never used) show's prompts and agents"""
+        for component in components:
+            try:
+                await component.aclose()
+            except Exception as e:
+                print(f"Error releasing {type(component).__name__}: {e}")
+
+    def start_show(self, minutes: float | None = None, panel: bool = False) -> bool:
+        """Start the show as a single owned task; False if one is already running"""
+        if self.is_podcast_running or (self.show_task is not None and not self.show_task.done()):
+            return False
+        # The show's model calls (and its tasks') are live traffic for the scheduler
+        with request_context("live"):
+            self.show_task = asyncio.create_task(self.run_podcast(minutes, panel))
+        return True
+
+    async def drain_queue(self, timeout: float):
+        """Give queued control and audience frames up to ``timeout`` seconds to go out"""
+        deadline = time.monotonic() + timeout
+        while len(self.message_queue) and self.queue_task is not None and time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+
+    async def stop_show(self, timeout: float | None = None) -> bool:
+        """Cancel the show and its in-flight LLM requests; False if it outlived ``timeout``"""
+        timeout = self.stop_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        # The task stays the show's owner until it has finished, so no second show can start meanwhile
+        task = self.show_task
         self.is_podcast_running = False
+        if self.engine is not None:
+            self.engine.stop()
+        for session in self.sessions:
+            await self.send_control({"event": "podcast_stopping"}, session)
+        stopped = True
+        if task is not None and not task.done():
+            task.cancel()
+            done, _ = await asyncio.wait([task], timeout=timeout)
+            stopped = bool(done)
+        if stopped and self.show_task is task:
+            self.show_task = None
+        
+        # Unaired show lines are dropped (they stay in the transcript); the stage goes quiet
+        dropped = self.message_queue.drop(MessageLane.SHOW)
+        if dropped:
+            print(f"Dropped {len(dropped)} unaired show messages")
+        self.playback.reset()
+        self._update_queue_empty()
+        self.message_queue.notify()
+        for session in self.sessions:
+            await self.send_control({"event": "podcast_stopped"}, session)
+        await self.drain_queue(max(0.0, deadline - time.monotonic()))
+        return stopped
+
+    async def shutdown(self):
+        """Release everything the manager owns: show, warm-up, queue processor and sockets"""
+        self.shutting_down = True
+        await self.stop_show(timeout=self.stop_timeout / 2)
+        if self.warm_opening is not None and not self.warm_opening.done():
+            self.warm_opening.cancel()
+            await asyncio.wait([self.warm_opening])
+        if self.warm_show is not None:
+            await self.release_show(*self.warm_show)
+        if self.translation is not None:
+            await self.translation.aclose()
+        self.warm_show = self.warm_opening = None
+        if self.queue_task is not None:
+            self.queue_task.cancel()
+            await asyncio.wait([self.queue_task])
+            self.queue_task = None
+        if self.heartbeat_task is not None:
+            self.heartbeat_task.cancel()
+            await asyncio.wait([self.heartbeat_task])
+            self.heartbeat_task = None
+        for connections in self.sessions.values():
+            for websocket in list(connections):
+                self.connections.forget(websocket, "shutdown")
+                try:
+                    await websocket.close(code=1001)
+                except Exception:
+                    pass
+            connections.clear()
 
 manager = ConnectionManager()
 
 @app.websocket("/ws/{session}")
 async def websocket_endpoint(websocket: WebSocket, session: str):
-    if session not in ["left", "right", "audience"]:  # Add audience to valid sessions
+    # Audience clients pick a caption language with ?lang=th
+    lang = websocket.query_params.get("lang")
+    if session == "audience" and lang:
+        try:
+            session = manager.audience_session(lang)
+        except KeyError:
+            await websocket.close(code=4000)
+            return
+    if session not in manager.sessions:  # Speaker sessions, panel sessions and audience
         await websocket.close(code=4000)
         return
 
-    await manager.connect(websocket, session)
+    # Reconnecting clients pass the last seq they saw to get only the missed frames
+    resume_from = websocket.query_params.get("resume_from")
+    # Speakers that buffer frames and ack playback connect with ?protocol=ack
+    acks = websocket.query_params.get("protocol") == "ack"
+    if not await manager.admit(websocket, session):
+        return
     try:
+        await manager.connect(websocket, session, int(resume_from) if resume_from and resume_from.isdigit() else None, acks)
         while True:
             data = await websocket.receive_text()
-            print(f"Received message from {session}: {data[:100]}...")
+            manager.connections.seen(websocket)
             try:
                 message = json.loads(data)
-                if message.get("type") == "speaking_state":
-                    # Handle speaking state updates
-                    manager.update_speaking_state(message)
-                else:
-                    # Handle regular messages
-                    await manager.broadcast(data, session)
             except json.JSONDecodeError:
+                message = None
+            if isinstance(message, dict) and message.get("type") == "pong":
+                # Answer to {"type": "control", "event": "ping", "ts": ...}; echoing ts measures the round trip
+                ts = message.get("ts")
+                manager.connections.pong(websocket, ts if isinstance(ts, (int, float)) else None)
+                continue
+            print(f"Received message from {session}: {data[:100]}...")
+            if not isinstance(message, dict):
                 # Handle plain text messages
-                await manager.broadcast(data, session)
+                await manager.broadcast(data, session, MessageLane.AUDIENCE)
+            elif message.get("type") == "ack":
+                # {"type": "ack", "seq": 12, "event": "started" | "finished"}
+                if isinstance(message.get("seq"), int):
+                    manager.ack(websocket, message["seq"], message.get("event", "finished"))
+            elif message.get("type") == "speaking_state":
+                # Handle speaking state updates
+                manager.update_speaking_state(message, session)
+            else:
+                # Handle regular messages
+                await manager.broadcast(data, session, MessageLane.AUDIENCE)
     except WebSocketDisconnect:
+        pass
+    finally:
+        # Also covers clients that vanished during the handshake or were reaped
         manager.disconnect(websocket, session)
 
+@app.get("/sse/audience")
+async def audience_events(
+    request: Request,
+    resume_from: int | None = None,
+    lang: str | None = None,
+    last_event_id: str | None = Header(None)
+):
+    """Read-only Server-Sent Events stream of the audience session, optionally in a caption language"""
+    if resume_from is None and last_event_id and last_event_id.isdigit():
+        resume_from = int(last_event_id)
+    try:
+        session = manager.audience_session(lang)
+    except KeyError:
+        return Response(status_code=404, content=f"Unsupported language {lang}")
+    manager.ensure_queue_processor()
+
+    async def stream():
+        manager.stream_subscribers += 1
+        manager.language_streams[session] = manager.language_streams.get(session, 0) + 1
+        try:
+            async for chunk in sse_events(manager.frame_buffers[session], lambda: manager.snapshot(session), resume_from):
+                if await request.is_disconnected():
+                    break
+                yield chunk
+        finally:
+            manager.stream_subscribers -= 1
+            manager.language_streams[session] -= 1
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@app.get("/poll/audience")
+async def audience_poll(since: int | None = None, timeout: float = 25.0, lang: str | None = None):
+    """Long-poll fallback: frames after `since`, waiting up to `timeout` seconds for new ones"""
+    try:
+        session = manager.audience_session(lang)
+    except KeyError:
+        return Response(status_code=404, content=f"Unsupported language {lang}")
+    buffer = manager.frame_buffers[session]
+    if since is None:
+        return {"seq": buffer.last_seq, "snapshot": json.loads(manager.snapshot(session)), "frames": []}
+    manager.ensure_queue_processor()
+    manager.stream_subscribers += 1
+    # A waiting poller is a listener, so its language keeps being translated
+    manager.language_streams[session] = manager.language_streams.get(session, 0) + 1
+    try:
+        frames = await buffer.wait_since(since, timeout=min(timeout, 60.0))
+    finally:
+        manager.stream_subscribers -= 1
+        manager.language_streams[session] -= 1
+    if frames is None:
+        return {"seq": buffer.last_seq, "snapshot": json.loads(manager.snapshot(session)), "frames": []}
+    return {"seq": frames[-1].seq if frames else since, "frames": [frame.payload for frame in frames]}
+
+@app.get("/audience/snapshot")
+async def audience_snapshot(lang: str | None = None, if_none_match: str | None = Header(None)):
+    """Cacheable catch-up snapshot, optionally in a caption language; clients revalidate with If-None-Match"""
+    try:
+        session = manager.audience_session(lang)
+    except KeyError:
+        return Response(status_code=404, content=f"Unsupported language {lang}")
+    snapshot = manager.snapshot(session)
+    etag = snapshot_etag(snapshot)
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=1, must-revalidate"}
+    if if_none_match == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=snapshot, media_type="application/json", headers=headers)
+
 @app.post("/send_message/{session}")
 async def send_message(message: str, session: str):
-    if session not in ["left", "right", "audience"]:  # Add audience to valid sessions
+    if session not in manager.sessions:  # Speaker sessions, panel sessions and audience
         return {"error": "Invalid session"}
-    await manager.broadcast(message, session)
+    await manager.broadcast(message, session, MessageLane.AUDIENCE)
     return {"status": f"Message sent to {session} session"}
 
 @app.post("/test/start_conversation")
@@ -343,27 +805,119 @@ async def start_test_conversation():
     return {"status": "Started test conversation"}
 
 @app.post("/podcast/start")
-async def start_podcast():
-    """Start the AI podcast conversation"""
-    if not manager.is_podcast_running:
-        # Start the podcast in the background
-        asyncio.create_task(manager.run_podcast())
+async def start_podcast(minutes: float | None = None, panel: bool = False):
+    """Start the AI podcast conversation, optionally with a slot length in minutes and a guest panel"""
+    # Start the podcast in the background
+    if manager.start_show(minutes, panel):
         return {"status": "Started podcast conversation"}
     return {"status": "Podcast is already running"}
 
 @app.post("/podcast/stop")
 async def stop_podcast():
     """Stop the running podcast"""
-    if manager.is_podcast_running:
-        manager.is_podcast_running = False
-        return {"status": "Stopping podcast"}
+    if manager.is_podcast_running or (manager.show_task is not None and not manager.show_task.done()):
+        if await manager.stop_show():
+            return {"status": "Stopped podcast"}
+        return {"status": f"Podcast did not stop within {manager.stop_timeout}s"}
     return {"status": "No podcast running"}
 
+@app.get("/podcast/schedule")
+async def podcast_schedule():
+    """Airtime budget of the running show"""
+    if manager.scheduler is None:
+        return {"status": "No show scheduled"}
+    return manager.scheduler.report()
+
+@app.get("/podcast/coverage")
+async def podcast_coverage():
+    """Suggested questions covered per topic and company facts the guest has cited"""
+    if manager.state is None:
+        return {"status": "No show scheduled"}
+    return manager.state.coverage.report()
+
+@app.get("/podcast/sinks")
+async def podcast_sinks():
+    """Backlog, drops and delay of each output of the current (or last) show"""
+    if manager.sinks is None:
+        return {"status": "No show scheduled"}
+    return manager.sinks.report()
+
+@app.get("/podcast/playback")
+async def podcast_playback():
+    """What has aired, what speakers hold buffered, and each speaker client's position"""
+    return manager.playback.report()
+
+@app.get("/podcast/summary")
+async def podcast_summary():
+    """Recap, section summaries, audience Q&A digest and topic coverage of the latest show"""
+    if manager.state is None or not manager.state.dialogue_history:
+        return {"status": "No show recorded"}
+    summarizer = ShowSummarizer(cache=manager.summary_cache)
+    try:
+        # Post-show work never takes quota from a running show
+        with request_context("summary", Priority.BATCH):
+            summary = await summarizer.summarize(list(manager.state.dialogue_history))
+    finally:
+        await summarizer.aclose()
+    return summary.to_dict()
+
+@app.get("/debug/llm")
+async def debug_llm():
+    """Model call scheduler: quota, throttling and queueing per deployment and priority"""
+    return default_router.scheduler.report()
+
+@app.get("/debug/connections")
+async def debug_connections():
+    """Connected, rejected and reaped WebSocket clients, and connection churn"""
+    return manager.connections.report()
+
+@app.get("/debug/memory")
+async def debug_memory(top: int = 15, since: str | None = None):
+    """Top allocation sites, and growth since a mark (needs PODCAST_DEBUG_MEMORY=1)"""
+    if not memory_inspector.enabled:
+        return Response(status_code=404, content="Start the server with PODCAST_DEBUG_MEMORY=1")
+    try:
+        return memory_inspector.report(top, since)
+    except KeyError:
+        return Response(status_code=404, content=f"No memory mark named {since}")
+
+@app.post("/debug/memory/mark")
+async def debug_memory_mark(name: str = "baseline"):
+    """Remember current allocations for a later /debug/memory?since=<name>"""
+    if not memory_inspector.enabled:
+        return Response(status_code=404, content="Start the server with PODCAST_DEBUG_MEMORY=1")
+    memory_inspector.mark(name)
+    return {"status": f"Marked {name}", "traced_kib": memory_inspector.traced_kib}
+
+@app.get("/debug/profile")
+async def debug_profile(seconds: float = 10.0, interval_ms: float = 10.0, format: str = "collapsed"):
+    """Sample the live process: collapsed stacks for flame graphs, or loop/task stats with format=json (needs PODCAST_DEBUG_PROFILE=1)"""
+    if not profiling_enabled:
+        return Response(status_code=404, content="Start the server with PODCAST_DEBUG_PROFILE=1")
+    if profile_lock.locked():
+        return Response(status_code=409, content="A profile is already running")
+    async with profile_lock:
+        # Short and coarse enough that sampling never disturbs the show's cadence
+        result = await profile(min(seconds, 60.0), max(interval_ms, 1.0) / 1000)
+    if format == "json":
+        return await asyncio.to_thread(result.summary)
+    return Response(
+        content=await asyncio.to_thread(result.collapsed),
+        media_type="text/plain",
+        headers={"Content-Disposition": 'attachment; filename="podcast.collapsed"'}
+    )
+
+@app.get("/debug/startup")
+async def startup_timings():
+    """Startup profile: import and construction times in milliseconds"""
+    return startup_profile.report()
+
 @app.get("/ping")
 async def ping():
     """Ping the server"""
     return {"status": "pong"}
 
 if __name__ == "__main__":
+    import uvicorn
     print("Starting WebSocket server on port 8000")
     uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
@@ -0,0 +1,43 @@
+# altotech_podcast/models/audience.py
+from dataclasses import dataclass
+
+from context.coverage import terms
+
+@dataclass
+class AudienceBatchBudget:
+    """Limits for answering a backlog of audience questions in one exchange."""
+    threshold: int = 3  # Pending questions needed before batching kicks in
+    max_questions: int = 5
+    max_airtime_seconds: float = 60.0
+    seconds_per_question: float = 12.0
+    words_per_second: float = 2.5
+
+    @property
+    def questions_per_batch(self) -> int:
+        """Number of questions a single batch can afford within its airtime."""
+        affordable = int(self.max_airtime_seconds // self.seconds_per_question)
+        return max(1, min(self.max_questions, affordable))
+
+    def word_budget(self, question_count: int) -> int:
+        """Word budget for the guest's combined answer."""
+        seconds = min(self.max_airtime_seconds, question_count * self.seconds_per_question)
+        return max(20, int(seconds * self.words_per_second))
+
+def _keywords(question: str) -> set[str]:
+    # Drop the "<name> asks:" prefix added by PodcastPrompts
+    _, _, text = question.partition(" asks: ")
+    return set(terms(text or question))
+
+def group_related_questions(questions: list[str], min_overlap: int = 1) -> list[list[str]]:
+    """Greedily group questions that share keywords, preserving arrival order."""
+    groups: list[tuple[set[str], list[str]]] = []
+    for question in questions:
+        words = _keywords(question)
+        for group_words, group in groups:
+            if len(words & group_words) >= min_overlap:
+                group.append(question)
+                group_words |= words
+                break
+        else:
+            groups.append((words, [question]))
+    return [group for _, group in groups]
@@ -1,5 +1,6 @@
 # altotech_podcast/models/dialogue.py
 from typing import TypedDict
+from typing_extensions import NotRequired
 
 from models.enums import Role, DialogueType
 
@@ -8,6 +9,8 @@ class DialogueContent(TypedDict):
     role: Role
     content: str
     dialogue_type: DialogueType
+    speaker: NotRequired[str]  # Set when several guests share the role
+    topic: NotRequired[str]  # TopicArea value the exchange belongs to
 
 class DialogueMetadata(TypedDict, total=False):
     """Optional metadata for dialogue content."""
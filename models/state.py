@@ -4,6 +4,7 @@ from datetime import datetime
 
 from pydantic_ai.messages import ModelMessage
 
+from context.coverage import CoverageTracker
 from .enums import TopicArea
 from .dialogue import DialogueContent
 
@@ -16,6 +17,12 @@ class PodcastState:
     audience_questions: list[str] = field(default_factory=list)
     host_messages: list[ModelMessage] = field(default_factory=list)
     guest_messages: list[ModelMessage] = field(default_factory=list)
+    # Retention limits for long-running servers (None keeps everything, e.g. for transcripts)
+    max_dialogue: int | None = None
+    max_audience_questions: int | None = None
+    trimmed_dialogue: int = 0
+    # Suggested questions and company facts covered so far; the engine feeds it each line once emitted
+    coverage: CoverageTracker = field(default_factory=CoverageTracker)
     
     @property
     def duration(self) -> float:
@@ -25,15 +32,22 @@ class PodcastState:
     @property
     def exchange_count(self) -> int:
         """Returns the total number of dialogue exchanges."""
-        return len(self.dialogue_history)
+        return len(self.dialogue_history) + self.trimmed_dialogue
     
     def add_dialogue(self, content: DialogueContent) -> None:
-        """Add a new dialogue exchange to the history."""
+        """Add a new dialogue exchange to the history, tagged with the current topic."""
+        content.setdefault("topic", self.current_topic.value)
         self.dialogue_history.append(content)
+        if self.max_dialogue is not None and len(self.dialogue_history) > self.max_dialogue:
+            excess = len(self.dialogue_history) - self.max_dialogue
+            del self.dialogue_history[:excess]
+            self.trimmed_dialogue += excess
     
     def add_audience_question(self, question: str) -> None:
         """Add a new audience question."""
         self.audience_questions.append(question)
+        if self.max_audience_questions is not None and len(self.audience_questions) > self.max_audience_questions:
+            del self.audience_questions[:-self.max_audience_questions]
     
     def get_last_exchange(self, role: str | None = None) -> DialogueContent | None:
         """Get the last dialogue exchange, optionally filtered by role."""
@@ -0,0 +1,20 @@
+# altotech_podcast/models/summary.py
+from pydantic import BaseModel, Field
+
+class AudienceQA(BaseModel):
+    """One audience question and the gist of the answer it got."""
+    asker: str = Field(description="Name of the audience member who asked, or 'Audience' if not named")
+    question: str = Field(description="The audience question, in one sentence")
+    answer: str = Field(description="The gist of the guest's answer, in 1-2 sentences")
+
+class ChunkSummary(BaseModel):
+    """Summary of one topic section of a transcript (the map step)."""
+    summary: str = Field(description="What was discussed in this section, in 2-4 sentences")
+    highlights: list[str] = Field(description="Quotable lines or concrete facts and numbers worth sharing with investors")
+    covered_questions: list[str] = Field(description="Suggested questions this section answered, copied verbatim from the list")
+    audience_qa: list[AudienceQA] = Field(description="Audience questions answered in this section")
+
+class EpisodeRecap(BaseModel):
+    """Episode-level summary merged from the section summaries (the reduce step)."""
+    summary: str = Field(description="Summary of the whole episode for investors, in one or two paragraphs")
+    highlights: list[str] = Field(description="The 3-7 most important highlights of the episode")
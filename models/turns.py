@@ -0,0 +1,23 @@
+# altotech_podcast/models/turns.py
+from enum import Enum
+
+from pydantic import BaseModel, Field
+
+class TurnSignal(str, Enum):
+    """Producer decision folded into the host's turn."""
+    STAY = "stay"
+    MOVE_ON = "move_on"
+    END = "end"
+
+class HostTurn(BaseModel):
+    """Structured host turn: the line to say plus the flow decision behind it."""
+    question: str = Field(description="What the host says next, in character")
+    signal: TurnSignal = Field(
+        description="'stay' to keep exploring the current topic, 'move_on' if it is sufficiently covered "
+                    "and the question already opens the next topic, 'end' if the podcast should wrap up"
+    )
+    confidence: float = Field(ge=0.0, le=1.0, description="Confidence in the signal, from 0 to 1")
+
+    def is_confident(self, threshold: float = 0.6) -> bool:
+        """Return whether the signal is confident enough to act on."""
+        return self.confidence >= threshold
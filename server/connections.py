@@ -0,0 +1,174 @@
+# altotech_podcast/server/connections.py
+import asyncio
+import os
+import statistics
+import time
+from collections import Counter, deque
+from dataclasses import dataclass, field, fields
+from typing import Any, Awaitable, Hashable
+
+# Close codes sent to clients the server lets go of
+CLOSE_TRY_AGAIN_LATER = 1013  # Admission caps; clients should retry after a delay
+CLOSE_DEAD = 4001             # Heartbeat or send failed
+CLOSE_IDLE = 4002             # Nothing received for too long
+
+async def within(awaitable: Awaitable[Any], timeout: float) -> bool:
+    """Await ``awaitable`` for up to ``timeout`` seconds; False (and cancelled) if it took longer.
+
+    One timer that cancels the current task, like asyncio.timeout (Python 3.11+), so no
+    task is created. asyncio.wait_for before 3.12 would swallow a cancellation of the
+    caller whenever the awaitable finished in the same instant. Its errors propagate.
+    """
+    task = asyncio.current_task()
+    expired = False
+
+    def expire() -> None:
+        nonlocal expired
+        expired = True
+        task.cancel()
+
+    timer = asyncio.get_running_loop().call_later(timeout, expire)
+    try:
+        await awaitable
+    except asyncio.CancelledError:
+        if not expired:
+            raise
+        return False
+    finally:
+        timer.cancel()
+    return True
+
+@dataclass
+class ConnectionLimits:
+    """Admission caps and liveness timeouts for WebSocket clients."""
+    max_total: int = 5000
+    max_per_session: int = 5000   # Audience and caption sessions
+    max_per_speaker: int = 4      # Speaker sessions (left, right, panel)
+    heartbeat_seconds: float = 15.0
+    # Clients that have answered a ping are dead once they stop answering this long
+    pong_timeout: float = 45.0
+    # Nothing at all received (pongs included) for this long; 0 (the default) disables it,
+    # since listen-only and legacy clients never send anything and are still listening
+    idle_seconds: float = 0.0
+    # A send that takes longer belongs to a stuck client
+    send_timeout: float = 5.0
+    retry_after: float = 5.0
+
+    @classmethod
+    def from_env(cls) -> "ConnectionLimits":
+        """Limits overridden by PODCAST_WS_<FIELD> environment variables."""
+        overrides = {
+            f.name: f.type(os.environ[f"PODCAST_WS_{f.name.upper()}"])
+            for f in fields(cls)
+            if f"PODCAST_WS_{f.name.upper()}" in os.environ
+        }
+        return cls(**overrides)
+
+@dataclass
+class ClientInfo:
+    session: str
+    speaker: bool
+    connected_at: float = field(default_factory=time.monotonic)
+    last_seen: float = field(default_factory=time.monotonic)
+    # Set once the client answers a ping; clients that never do are only dropped when a send fails
+    last_pong: float | None = None
+    rtt: float | None = None
+
+class ConnectionLifecycle:
+    """Who is connected, who may connect, and who has stopped listening.
+
+    Clients are keyed by their socket. ``admit`` reserves the slot before the
+    (awaiting) handshake, so concurrent connects cannot overshoot the caps.
+    """
+
+    def __init__(self, limits: ConnectionLimits | None = None, window: float = 60.0):
+        self.limits = limits or ConnectionLimits()
+        self.clients: dict[Hashable, ClientInfo] = {}
+        self.per_session: Counter[str] = Counter()
+        self.peak = 0
+        self.admitted = 0
+        self.rejected: Counter[str] = Counter()
+        self.closed: Counter[str] = Counter()
+        # Connect and disconnect times within ``window``, for churn rates
+        self.window = window
+        self._connects: deque[float] = deque()
+        self._disconnects: deque[float] = deque()
+        self._lifetimes: deque[float] = deque(maxlen=500)
+
+    def admit(self, client: Hashable, session: str, speaker: bool) -> str | None:
+        """Register ``client``, or return why it was turned away."""
+        cap = self.limits.max_per_speaker if speaker else self.limits.max_per_session
+        if len(self.clients) >= self.limits.max_total:
+            reason = "server_full"
+        elif self.per_session[session] >= cap:
+            reason = "session_full"
+        else:
+            self.clients[client] = ClientInfo(session, speaker)
+            self.per_session[session] += 1
+            self.admitted += 1
+            self.peak = max(self.peak, len(self.clients))
+            self._connects.append(time.monotonic())
+            self._trim(self._connects)
+            return None
+        self.rejected[reason] += 1
+        return reason
+
+    def seen(self, client: Hashable) -> None:
+        if info := self.clients.get(client):
+            info.last_seen = time.monotonic()
+
+    def pong(self, client: Hashable, sent_at: float | None = None) -> None:
+        if info := self.clients.get(client):
+            info.last_seen = info.last_pong = time.monotonic()
+            if sent_at is not None:
+                info.rtt = max(0.0, time.time() - sent_at)
+
+    def forget(self, client: Hashable, reason: str) -> ClientInfo | None:
+        """Drop ``client`` (idempotent) and count why it left."""
+        info = self.clients.pop(client, None)
+        if info is None:
+            return None
+        self.per_session[info.session] -= 1
+        if not self.per_session[info.session]:
+            del self.per_session[info.session]
+        now = time.monotonic()
+        self.closed[reason] += 1
+        self._disconnects.append(now)
+        self._trim(self._disconnects)
+        self._lifetimes.append(now - info.connected_at)
+        return info
+
+    def expired(self) -> list[tuple[Hashable, str]]:
+        """Clients that stopped answering pings ("dead") or went quiet ("idle")."""
+        now = time.monotonic()
+        limits = self.limits
+        expired = []
+        for client, info in self.clients.items():
+            if info.last_pong is not None and now - info.last_pong > limits.pong_timeout:
+                expired.append((client, "dead"))
+            elif limits.idle_seconds and now - info.last_seen > limits.idle_seconds:
+                expired.append((client, "idle"))
+        return expired
+
+    def _trim(self, times: deque[float]) -> int:
+        cutoff = time.monotonic() - self.window
+        while times and times[0] < cutoff:
+            times.popleft()
+        return len(times)
+
+    def report(self) -> dict[str, Any]:
+        rtts = sorted(info.rtt for info in self.clients.values() if info.rtt is not None)
+        per_minute = 60.0 / self.window
+        return {
+            "connected": len(self.clients),
+            "peak": self.peak,
+            "by_session": dict(self.per_session),
+            "responsive": sum(info.last_pong is not None for info in self.clients.values()),
+            "admitted": self.admitted,
+            "rejected": dict(self.rejected),
+            "closed": dict(self.closed),
+            "connects_per_minute": round(self._trim(self._connects) * per_minute, 1),
+            "disconnects_per_minute": round(self._trim(self._disconnects) * per_minute, 1),
+            "median_lifetime_s": round(statistics.median(self._lifetimes), 1) if self._lifetimes else None,
+            "rtt_ms_p50": round(statistics.median(rtts) * 1000, 1) if rtts else None,
+        }
@@ -0,0 +1,79 @@
+# altotech_podcast/server/frames.py
+import asyncio
+import json
+from collections import deque
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any
+
+@dataclass
+class Frame:
+    """A sent message, encoded once and shared by every connection."""
+    seq: int
+    payload: dict[str, Any]
+    text: str
+
+    @classmethod
+    def encode(cls, seq: int, payload: dict[str, Any]) -> "Frame":
+        return cls(seq=seq, payload=payload, text=json.dumps(payload))
+
+    @cached_property
+    def sse(self) -> bytes:
+        """Server-Sent Events encoding, shared by every SSE subscriber."""
+        return f"id: {self.seq}\ndata: {self.text}\n\n".encode()
+
+class FrameBuffer:
+    """Bounded ring buffer of recently sent frames for one session.
+
+    Frames must be appended in increasing ``seq`` order (the order they are sent).
+    """
+
+    def __init__(self, maxlen: int = 200):
+        self._frames: deque[Frame] = deque(maxlen=maxlen)
+        # Highest sequence number that has fallen out of the buffer
+        self._evicted_seq = 0
+        # One future shared by every waiter, resolved and dropped on the next append
+        self._changed: asyncio.Future | None = None
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    @property
+    def last_seq(self) -> int:
+        return self._frames[-1].seq if self._frames else self._evicted_seq
+
+    def append(self, seq: int, payload: dict[str, Any]) -> Frame:
+        """Encode and remember a frame."""
+        if len(self._frames) == self._frames.maxlen:
+            self._evicted_seq = self._frames[0].seq
+        frame = Frame.encode(seq, payload)
+        self._frames.append(frame)
+        if self._changed is not None:
+            if not self._changed.done():
+                self._changed.set_result(None)
+            self._changed = None
+        return frame
+
+    def since(self, seq: int) -> list[Frame] | None:
+        """Frames newer than ``seq``, or None if some of them were already evicted."""
+        if seq < self._evicted_seq:
+            return None
+        # Walk back from the newest frame: caught-up readers only need the tail
+        newer = []
+        for frame in reversed(self._frames):
+            if frame.seq <= seq:
+                break
+            newer.append(frame)
+        newer.reverse()
+        return newer
+
+    async def wait_since(self, seq: int, timeout: float | None = None) -> list[Frame] | None:
+        """Like ``since``, but waits up to ``timeout`` seconds for a new frame if there is none yet."""
+        frames = self.since(seq)
+        if frames is None or frames:
+            return frames
+        if self._changed is None:
+            self._changed = asyncio.get_running_loop().create_future()
+        # asyncio.wait does not wrap the shared future in a task per waiter
+        done, _ = await asyncio.wait([self._changed], timeout=timeout)
+        return self.since(seq) if done else []
@@ -0,0 +1,85 @@
+# altotech_podcast/server/memory.py
+import os
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any
+
+@dataclass
+class RetentionLimits:
+    """How much per-show history and queued work a long-running server keeps."""
+    transcript_turns: int = 500
+    audience_questions: int = 200
+    queued_per_lane: int = 500
+    frames_per_session: int = 200
+
+    @classmethod
+    def from_env(cls) -> "RetentionLimits":
+        """Limits overridden by PODCAST_RETAIN_<FIELD> environment variables."""
+        overrides = {
+            name: int(os.environ[f"PODCAST_RETAIN_{name.upper()}"])
+            for name in cls.__dataclass_fields__
+            if f"PODCAST_RETAIN_{name.upper()}" in os.environ
+        }
+        return cls(**overrides)
+
+# tracemalloc's own bookkeeping and the import system are noise in every report
+_IGNORED = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+)
+
+class MemoryInspector:
+    """Opt-in tracemalloc snapshots: top allocation sites and growth between marks."""
+
+    def __init__(self):
+        self.marks: dict[str, tracemalloc.Snapshot] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return tracemalloc.is_tracing()
+
+    @property
+    def traced_kib(self) -> float:
+        return round(tracemalloc.get_traced_memory()[0] / 1024, 1)
+
+    def start(self, frames: int = 1) -> None:
+        if not self.enabled:
+            tracemalloc.start(frames)
+
+    def stop(self) -> None:
+        tracemalloc.stop()
+        self.marks.clear()
+
+    def _snapshot(self) -> tracemalloc.Snapshot:
+        return tracemalloc.take_snapshot().filter_traces(_IGNORED)
+
+    def mark(self, name: str = "baseline") -> None:
+        """Remember the current allocations so later reports can show growth since now."""
+        self.marks[name] = self._snapshot()
+
+    def report(self, top: int = 15, since: str | None = None) -> dict[str, Any]:
+        snapshot = self._snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        report: dict[str, Any] = {
+            "traced_kib": round(current / 1024, 1),
+            "peak_kib": round(peak / 1024, 1),
+            "top": [
+                {"site": str(stat.traceback), "kib": round(stat.size / 1024, 1), "count": stat.count}
+                for stat in snapshot.statistics("lineno")[:top]
+            ],
+        }
+        if since is not None:
+            if since not in self.marks:
+                raise KeyError(since)
+            report["growth_since"] = since
+            report["growth"] = [
+                {
+                    "site": str(stat.traceback),
+                    "kib": round(stat.size_diff / 1024, 1),
+                    "count": stat.count_diff,
+                }
+                for stat in snapshot.compare_to(self.marks[since], "lineno")[:top]
+                if stat.size_diff
+            ]
+        return report
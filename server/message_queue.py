@@ -0,0 +1,89 @@
+# altotech_podcast/server/message_queue.py
+import asyncio
+import itertools
+from collections import deque
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Callable
+
+class MessageLane(IntEnum):
+    """Priority classes for outgoing messages (lower value = served first)."""
+    CONTROL = 0
+    SHOW = 1
+    AUDIENCE = 2
+
+@dataclass
+class QueuedMessage:
+    """A message waiting to be sent to a session."""
+    lane: MessageLane
+    seq: int
+    session: str
+    message: Any = field(repr=False)
+
+class LaneQueue:
+    """Multi-lane message queue with monotonic sequence numbers.
+
+    Each lane is FIFO. ``get`` serves the highest-priority lane that has a
+    sendable message, so a blocked lane never holds back the others, and a
+    blocked session never holds back other sessions in the same lane. Messages
+    for the same session within a lane always leave in sequence order.
+    """
+
+    def __init__(self, max_per_lane: int | None = None):
+        self._lanes: dict[MessageLane, deque[QueuedMessage]] = {lane: deque() for lane in MessageLane}
+        # A full audience lane drops its oldest message, so a stalled consumer cannot grow memory
+        # without bound. Show turns and control frames (aired, stopped) are never dropped: losing
+        # one breaks the show, and pacing and the show's own events already bound them
+        self.max_per_lane = max_per_lane
+        self.dropped: dict[MessageLane, int] = {lane: 0 for lane in MessageLane}
+        self._seq = itertools.count(1)
+        self._wakeup = asyncio.Event()
+
+    def __len__(self) -> int:
+        return sum(len(q) for q in self._lanes.values())
+
+    def pending(self, lane: MessageLane) -> int:
+        """Return the number of messages waiting in a lane."""
+        return len(self._lanes[lane])
+
+    def put(self, message: Any, session: str, lane: MessageLane) -> QueuedMessage:
+        """Append a message to its lane and wake the consumer."""
+        item = QueuedMessage(lane=lane, seq=next(self._seq), session=session, message=message)
+        if self.max_per_lane is not None and lane == MessageLane.AUDIENCE and len(self._lanes[lane]) >= self.max_per_lane:
+            self._lanes[lane].popleft()
+            self.dropped[lane] += 1
+        self._lanes[lane].append(item)
+        self._wakeup.set()
+        return item
+
+    def notify(self) -> None:
+        """Wake the consumer so it re-checks readiness (e.g. after a speaking state change)."""
+        self._wakeup.set()
+
+    def drop(self, lane: MessageLane) -> list[QueuedMessage]:
+        """Remove and return every message queued on ``lane``."""
+        items = list(self._lanes[lane])
+        self._lanes[lane].clear()
+        return items
+
+    def _pop_ready(self, is_ready: Callable[[QueuedMessage], bool]) -> QueuedMessage | None:
+        for lane in MessageLane:
+            queue = self._lanes[lane]
+            blocked_sessions: set[str] = set()
+            for index, item in enumerate(queue):
+                if item.session in blocked_sessions:
+                    continue
+                if is_ready(item):
+                    del queue[index]
+                    return item
+                blocked_sessions.add(item.session)
+        return None
+
+    async def get(self, is_ready: Callable[[QueuedMessage], bool]) -> QueuedMessage:
+        """Wait for and remove the next message that ``is_ready`` allows to be sent."""
+        while True:
+            self._wakeup.clear()
+            item = self._pop_ready(is_ready)
+            if item is not None:
+                return item
+            await self._wakeup.wait()
@@ -0,0 +1,128 @@
+# altotech_podcast/server/playback.py
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Hashable
+
+@dataclass
+class ClientPlayback:
+    """What one client has played, from its acks."""
+    session: str
+    # Acking clients buffer frames and play them after their "play_after" seq;
+    # legacy clients play on receipt and report speaking state instead
+    acks: bool
+    started: int = 0
+    finished: int = 0
+    last_ack: float = field(default_factory=time.monotonic)
+
+@dataclass
+class InFlight:
+    seq: int
+    session: str
+    # The frame this one is queued behind on the client (0: plays on receipt)
+    play_after: int
+    sent_at: float
+    started_at: float | None = None
+
+    @property
+    def playing_since(self) -> float | None:
+        """When playback started: acked, or on receipt if nothing was ahead of it."""
+        if self.started_at is not None:
+            return self.started_at
+        return self.sent_at if not self.play_after else None
+
+class PlaybackTracker:
+    """Show frames sent to speakers but not yet aired, and each client's position.
+
+    A show frame is sent as soon as fewer than ``prefetch`` frames are queued behind
+    the one playing, marked with the seq it has to wait for, so acking clients can
+    start it the moment the previous line ends. A frame has aired once a client of
+    its session acks that it finished. Sessions with a legacy (non-acking) client
+    get no prefetch: the next frame waits until the current one has aired.
+    """
+
+    def __init__(self, prefetch: int = 1):
+        self.prefetch = prefetch
+        self.clients: dict[Hashable, ClientPlayback] = {}
+        self.in_flight: deque[InFlight] = deque()
+        self.last_show_seq = 0
+        self.aired_seq = 0
+
+    def add_client(self, client: Hashable, session: str, acks: bool) -> None:
+        self.clients[client] = ClientPlayback(session=session, acks=acks)
+
+    def remove_client(self, client: Hashable) -> None:
+        self.clients.pop(client, None)
+
+    def session_acks(self, session: str) -> bool:
+        """True if ``session`` has clients and every one of them buffers frames and acks them."""
+        clients = [c for c in self.clients.values() if c.session == session]
+        return bool(clients) and all(c.acks for c in clients)
+
+    def can_send(self, session: str) -> bool:
+        if not self.in_flight:
+            return True
+        if not self.session_acks(session) or not all(self.session_acks(f.session) for f in self.in_flight):
+            return False
+        return len(self.in_flight) <= self.prefetch
+
+    def sent(self, seq: int, session: str) -> int:
+        """Record a show frame as sent; returns the seq it must play after (0: right away)."""
+        play_after = self.in_flight[-1].seq if self.in_flight else 0
+        self.in_flight.append(InFlight(seq=seq, session=session, play_after=play_after, sent_at=time.monotonic()))
+        self.last_show_seq = seq
+        return play_after
+
+    def started(self, seq: int, client: Hashable | None = None) -> None:
+        if client in self.clients:
+            playback = self.clients[client]
+            playback.started = max(playback.started, seq)
+            playback.last_ack = time.monotonic()
+        for frame in self.in_flight:
+            if frame.seq == seq and frame.started_at is None:
+                frame.started_at = time.monotonic()
+
+    def finished(self, seq: int, client: Hashable | None = None) -> list[tuple[InFlight, float | None]]:
+        """Mark ``seq`` (and anything before it) aired; returns the aired frames with their
+        airtime, None where playback start is unknown."""
+        if client in self.clients:
+            playback = self.clients[client]
+            playback.finished = max(playback.finished, seq)
+            playback.last_ack = time.monotonic()
+        aired = []
+        now = time.monotonic()
+        while self.in_flight and self.in_flight[0].seq <= seq:
+            frame = self.in_flight.popleft()
+            since = frame.playing_since
+            aired.append((frame, now - since if since is not None else None))
+            self.aired_seq = frame.seq
+        return aired
+
+    def current(self, session: str) -> InFlight | None:
+        """Oldest unaired frame of ``session`` (what a legacy client is speaking)."""
+        return next((frame for frame in self.in_flight if frame.session == session), None)
+
+    def release_session(self, session: str) -> list[tuple[InFlight, float | None]]:
+        """A session lost its last client: its unaired frames will never be acked."""
+        frame = None
+        for candidate in self.in_flight:
+            if candidate.session == session:
+                frame = candidate
+        return self.finished(frame.seq) if frame else []
+
+    def reset(self) -> None:
+        self.in_flight.clear()
+
+    def report(self) -> dict[str, Any]:
+        return {
+            "aired_seq": self.aired_seq,
+            "last_show_seq": self.last_show_seq,
+            "in_flight": [
+                {"seq": f.seq, "session": f.session, "play_after": f.play_after, "playing": f.playing_since is not None}
+                for f in self.in_flight
+            ],
+            "clients": [
+                {"session": c.session, "acks": c.acks, "started": c.started, "finished": c.finished}
+                for c in self.clients.values()
+            ],
+        }
@@ -0,0 +1,225 @@
+# altotech_podcast/server/profiler.py
+import asyncio
+import os
+import signal
+import statistics
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from types import CodeType, FrameType
+from typing import Any
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MAX_DEPTH = 128
+
+# Where a loop-thread sample spent its time, judged by the innermost matching frame
+_CATEGORIES = (
+    ("idle", ("selectors.py",)),  # Waiting on sockets and timers (thread sampler only)
+    ("json", ("/json/",)),
+    ("rich console", ("/rich/",)),
+    ("network", ("/ssl.py", "/httpx/", "/httpcore/", "/h11/", "/anyio/", "/uvicorn/protocols/", "/websockets/")),
+    ("pydantic", ("/pydantic/", "/pydantic_core/", "/pydantic_ai/")),
+    ("asyncio", ("/asyncio/",)),
+)
+
+def _label(code: CodeType) -> str:
+    path = code.co_filename
+    if path.startswith(_ROOT):
+        path = os.path.relpath(path, _ROOT)
+    elif "site-packages" in path:
+        path = path.split("site-packages" + os.sep, 1)[1]
+    else:
+        path = os.path.basename(path)
+    # Semicolons separate frames in the collapsed format; co_qualname is Python 3.11+
+    name = getattr(code, "co_qualname", code.co_name)
+    return f"{name} ({path})".replace(";", ",")
+
+def _stack(frame: FrameType | None) -> tuple[CodeType, ...]:
+    """Code objects of a thread's stack, outermost first."""
+    codes = []
+    while frame is not None and len(codes) < MAX_DEPTH:
+        codes.append(frame.f_code)
+        frame = frame.f_back
+    return tuple(reversed(codes))
+
+class CPUSampler:
+    """Samples the main thread's stack on SIGPROF, every ``interval`` of CPU time.
+
+    Idle time costs nothing, and each sample is weighted by the thread's CPU time
+    since the previous one, so a long call that delays the signal (C code such as
+    JSON encoding holds on to the interpreter) is still charged in full to the
+    frame it returns to. Samples are aggregated as code-object tuples; labels are
+    built once at the end. Unix only, and only for the main thread.
+    """
+    kind = "cpu"
+
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        # (thread id, stack) -> seconds
+        self.samples: Counter[tuple[int, tuple[CodeType, ...]]] = Counter()
+        self.ticks = 0
+        self.cpu_seconds = 0.0
+        self._thread = threading.main_thread().ident
+        self._last = 0.0
+        self._previous_handler: Any = None
+
+    @staticmethod
+    def available() -> bool:
+        return hasattr(signal, "setitimer") and threading.current_thread() is threading.main_thread()
+
+    def start(self) -> None:
+        self._last = time.thread_time()
+        self._previous_handler = signal.signal(signal.SIGPROF, self._sample)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+
+    def stop(self) -> None:
+        signal.setitimer(signal.ITIMER_PROF, 0, 0)
+        signal.signal(signal.SIGPROF, self._previous_handler or signal.SIG_DFL)
+
+    def _sample(self, signum: int, frame: FrameType | None) -> None:
+        now = time.thread_time()
+        weight, self._last = now - self._last, now
+        self.ticks += 1
+        self.cpu_seconds += weight
+        self.samples[self._thread, _stack(frame)] += weight
+
+class StackSampler:
+    """Samples every thread's Python stack from a background thread, every ``interval`` of wall time.
+
+    Fallback for event loops outside the main thread. A thread only sees another
+    thread's stack when the GIL changes hands, so short bursts of work look idle
+    and long C calls are charged to whatever runs after them.
+    """
+    kind = "wall"
+
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        # (thread id, stack) -> seconds
+        self.samples: Counter[tuple[int, tuple[CodeType, ...]]] = Counter()
+        self.ticks = 0
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            self.ticks += 1
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id != own:
+                    self.samples[thread_id, _stack(frame)] += self.interval
+
+@dataclass
+class LoopStats:
+    """Event-loop lag and task counts measured from inside the loop."""
+    lags: list[float] = field(default_factory=list)
+    tasks: list[int] = field(default_factory=list)
+    # Peak number of live tasks per coroutine
+    task_names: Counter[str] = field(default_factory=Counter)
+
+    async def watch(self, seconds: float, interval: float = 0.05) -> None:
+        """Sleep in short steps for ``seconds``; how late each wake-up is is the loop's lag."""
+        deadline = time.monotonic() + seconds
+        while (now := time.monotonic()) < deadline:
+            await asyncio.sleep(interval)
+            self.lags.append(max(0.0, time.monotonic() - now - interval))
+            tasks = asyncio.all_tasks()
+            self.tasks.append(len(tasks))
+            if len(self.tasks) % 10 == 1:
+                for name, count in Counter(_task_name(task) for task in tasks).items():
+                    self.task_names[name] = max(self.task_names[name], count)
+
+def _task_name(task: asyncio.Task) -> str:
+    coro = task.get_coro()
+    return getattr(coro, "__qualname__", None) or task.get_name()
+
+@dataclass
+class ProfileResult:
+    seconds: float
+    sampler: CPUSampler | StackSampler
+    loop: LoopStats
+    loop_thread: int
+
+    def collapsed(self) -> str:
+        """Brendan Gregg's collapsed-stack format, "thread;outer;...;inner weight" per line,
+        weighted in microseconds."""
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        weights: Counter[str] = Counter()
+        for (thread_id, codes), seconds in self.sampler.samples.items():
+            thread = "event-loop" if thread_id == self.loop_thread else names.get(thread_id, f"thread-{thread_id}")
+            weights[";".join([thread, *map(_label, codes)])] += seconds
+        lines = (f"{stack} {round(seconds * 1e6)}" for stack, seconds in weights.most_common())
+        return "\n".join(line for line in lines if not line.endswith(" 0")) + "\n"
+
+    def summary(self, top: int = 20) -> dict[str, Any]:
+        """Where the event loop's time went (shares of wall time), its lag and its tasks."""
+        categories: Counter[str] = Counter()
+        own_time: Counter[str] = Counter()
+        for (thread_id, codes), seconds in self.sampler.samples.items():
+            if thread_id == self.loop_thread:
+                categories[_category(codes)] += seconds
+                if codes:
+                    own_time[_label(codes[-1])] += seconds
+        if self.sampler.kind == "cpu":
+            # CPU samples only cover busy time; the rest of the wall clock the loop was waiting
+            categories["idle"] = max(0.0, self.seconds - self.sampler.cpu_seconds)
+        total = sum(categories.values()) or 1.0
+        lags = sorted(self.loop.lags)
+        return {
+            "seconds": self.seconds,
+            "sampler": self.sampler.kind,
+            "interval_ms": self.sampler.interval * 1000,
+            "samples": self.sampler.ticks,
+            "event_loop": {
+                "time_share": {name: round(seconds / total, 3) for name, seconds in categories.most_common()},
+                "top_functions": [
+                    {"function": name, "share": round(seconds / total, 3)} for name, seconds in own_time.most_common(top)
+                ],
+                "lag_ms": {
+                    "p50": round(statistics.median(lags) * 1000, 2) if lags else 0.0,
+                    "p95": round(lags[int(len(lags) * 0.95)] * 1000, 2) if lags else 0.0,
+                    "max": round(lags[-1] * 1000, 2) if lags else 0.0,
+                },
+            },
+            "tasks": {
+                "max": max(self.loop.tasks, default=0),
+                "last": self.loop.tasks[-1] if self.loop.tasks else 0,
+                "by_coroutine": dict(self.loop.task_names.most_common(top)),
+            },
+        }
+
+def _category(codes: tuple[CodeType, ...]) -> str:
+    # Innermost first; our own code claims everything it calls that is not listed
+    for code in reversed(codes):
+        for name, markers in _CATEGORIES:
+            if any(marker in code.co_filename for marker in markers):
+                return name
+        if code.co_filename.startswith(_ROOT):
+            return "app"
+    return "other"
+
+async def profile(seconds: float, interval: float = 0.01) -> ProfileResult:
+    """Profile the running process for ``seconds`` without blocking the event loop."""
+    sampler = CPUSampler(interval) if CPUSampler.available() else StackSampler(interval)
+    loop = LoopStats()
+    start = time.monotonic()
+    sampler.start()
+    try:
+        await loop.watch(seconds)
+    finally:
+        if isinstance(sampler, StackSampler):
+            # Joining takes at most one interval; keep it off the loop anyway
+            await asyncio.to_thread(sampler.stop)
+        else:
+            sampler.stop()
+    return ProfileResult(time.monotonic() - start, sampler, loop, threading.get_ident())
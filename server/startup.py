@@ -0,0 +1,66 @@
+# altotech_podcast/server/startup.py
+import re
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+class StartupProfile:
+    """Records how long each startup step (imports, object construction) takes."""
+
+    def __init__(self):
+        self.timings: dict[str, float] = {}
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        """Time the enclosed block and record it under ``name``."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def record(self, name: str, seconds: float) -> None:
+        self.timings[name] = seconds
+
+    def report(self) -> dict[str, float]:
+        """Return timings in milliseconds, slowest first."""
+        return {
+            name: round(seconds * 1000, 2)
+            for name, seconds in sorted(self.timings.items(), key=lambda item: -item[1])
+        }
+
+_IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|\s+(\S.*)$")
+
+def profile_imports(modules: list[str]) -> dict[str, float]:
+    """Measure the cumulative import time (ms) of each module in a fresh interpreter."""
+    results = {}
+    for module in modules:
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True,
+            text=True
+        )
+        for line in proc.stderr.splitlines():
+            match = _IMPORTTIME_LINE.match(line)
+            if match and match.group(3).strip() == module:
+                results[module] = int(match.group(2)) / 1000
+    return results
+
+if __name__ == "__main__":
+    from ui.prompts import PodcastPrompts
+    from agents.host import ElonMuskHost
+    from agents.guest import AltoTechCEO
+
+    print("Import time (ms, cold interpreter):")
+    for module, ms in profile_imports(["fastapi", "pydantic_ai", "openai", "rich", "dotenv", "agents.host", "agents.guest", "ui.prompts", "main"]).items():
+        print(f"  {module:<14} {ms:8.1f}")
+
+    profile = StartupProfile()
+    for name, factory in [("PodcastPrompts", PodcastPrompts), ("ElonMuskHost", ElonMuskHost), ("AltoTechCEO", AltoTechCEO)]:
+        with profile.measure(name):
+            factory()
+    print("Construction time (ms):")
+    for name, ms in profile.report().items():
+        print(f"  {name:<14} {ms:8.1f}")
@@ -0,0 +1,43 @@
+# altotech_podcast/server/streams.py
+import hashlib
+from typing import AsyncIterator, Callable
+
+from server.frames import FrameBuffer
+
+SSE_KEEPALIVE = b": keep-alive\n\n"
+
+def encode_sse_snapshot(snapshot: str, seq: int) -> bytes:
+    return f"event: snapshot\nid: {seq}\ndata: {snapshot}\n\n".encode()
+
+def snapshot_etag(snapshot: str) -> str:
+    """Strong ETag for an encoded snapshot."""
+    return '"' + hashlib.blake2b(snapshot.encode(), digest_size=12).hexdigest() + '"'
+
+async def sse_events(
+    buffer: FrameBuffer,
+    snapshot: Callable[[], str],
+    resume_from: int | None = None,
+    keepalive: float = 15.0,
+) -> AsyncIterator[bytes]:
+    """Read-only event stream over a session's frame buffer.
+
+    A subscriber holds nothing but its cursor; frame encodings are shared.
+    """
+    frames = buffer.since(resume_from) if resume_from is not None else None
+    if frames is None:
+        # Fresh subscriber or too far behind: start from a snapshot
+        cursor = buffer.last_seq
+        yield encode_sse_snapshot(snapshot(), cursor)
+    else:
+        cursor = resume_from
+    while True:
+        frames = await buffer.wait_since(cursor, timeout=keepalive)
+        if frames is None:
+            cursor = buffer.last_seq
+            yield encode_sse_snapshot(snapshot(), cursor)
+            continue
+        if not frames:
+            yield SSE_KEEPALIVE
+            continue
+        yield b"".join(frame.sse for frame in frames)
+        cursor = frames[-1].seq
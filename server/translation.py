@@ -0,0 +1,184 @@
+# altotech_podcast/server/translation.py
+import asyncio
+import hashlib
+import os
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Protocol
+
+from agents.base import create_tier_agents, default_callers
+from agents.routing import CallType, ModelTier, default_router
+
+# Audience languages: Thai, Singaporean and Hong Kong investors
+LANGUAGES = {
+    "th": "Thai",
+    "zh": "Simplified Chinese",
+    "zh-hant": "Traditional Chinese (Hong Kong)",
+    "ms": "Malay",
+}
+
+class Translator(Protocol):
+    async def translate(self, text: str, lang: str) -> str: ...
+
+class LocalTranslator:
+    """Stand-in translator for tests and offline runs: tags the text instead of translating it."""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.calls = 0
+
+    async def translate(self, text: str, lang: str) -> str:
+        self.calls += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return f"[{lang}] {text}"
+
+class LLMTranslator:
+    """Translates show lines with the mini model."""
+
+    def __init__(self):
+        self.agents = create_tier_agents(
+            system_prompt="""You translate live podcast lines for an investor audience.
+Translate the user's text faithfully and naturally. Keep names, company names and numbers as they are.
+Reply with the translation only.""",
+            tiers=[ModelTier.MINI]
+        )
+        self.router = default_router
+        self.callers = default_callers
+
+    async def translate(self, text: str, lang: str) -> str:
+        result = await self.router.run(
+            self.agents,
+            CallType.TRANSLATION,
+            f"Translate into {LANGUAGES.get(lang, lang)}:\n{text}",
+            callers=self.callers
+        )
+        return result.data
+
+def create_translator() -> Translator:
+    """Translator chosen by PODCAST_TRANSLATOR: "llm" (default) or "local"."""
+    if os.getenv("PODCAST_TRANSLATOR", "llm") == "local":
+        return LocalTranslator()
+    return LLMTranslator()
+
+class TranslationCache:
+    """LRU cache keyed by a hash of language and text, so repeated lines cost nothing."""
+
+    def __init__(self, maxsize: int = 2000):
+        self.maxsize = maxsize
+        self._items: OrderedDict[bytes, str] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @staticmethod
+    def key(text: str, lang: str) -> bytes:
+        return hashlib.blake2b(f"{lang}\0{text}".encode(), digest_size=16).digest()
+
+    def get(self, text: str, lang: str) -> str | None:
+        key = self.key(text, lang)
+        if key not in self._items:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._items.move_to_end(key)
+        return self._items[key]
+
+    def put(self, text: str, lang: str, translation: str) -> None:
+        key = self.key(text, lang)
+        self._items[key] = translation
+        self._items.move_to_end(key)
+        if len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
+
+class TranslationPipeline:
+    """Translates show lines into every subscribed language, off the speaking path.
+
+    Translation of a line into every subscribed language starts as soon as it is
+    submitted, overlapping with earlier lines still in flight; a worker publishes the
+    results in submission order. Cost scales with languages, not listeners: each line
+    is translated once per language.
+    """
+
+    def __init__(
+        self,
+        translator: Translator,
+        publish: Callable[[str, str, dict[str, Any]], Awaitable[None]],
+        languages: Callable[[], list[str]],
+        cache: TranslationCache | None = None,
+        max_pending: int = 100,
+    ):
+        self.translator = translator
+        self.publish = publish
+        # Languages that currently have listeners
+        self.languages = languages
+        self.cache = cache if cache is not None else TranslationCache()
+        self._pending: asyncio.Queue[tuple[list[str], asyncio.Task, dict[str, Any]]] = asyncio.Queue(max_pending)
+        self._inflight: dict[bytes, asyncio.Future] = {}
+        self._worker: asyncio.Task | None = None
+
+    def submit(self, text: str, meta: dict[str, Any]) -> None:
+        """Start translating a line; never blocks the caller."""
+        languages = self.languages()
+        if not languages:
+            return
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+        if self._pending.full():
+            # Captions that fell this far behind are no longer worth showing
+            _, stale, _ = self._pending.get_nowait()
+            stale.cancel()
+        task = asyncio.ensure_future(asyncio.gather(*(self.translate(text, lang) for lang in languages)))
+        self._pending.put_nowait((languages, task, meta))
+
+    async def translate(self, text: str, lang: str) -> str:
+        """Cached translation; concurrent requests for the same line share one call."""
+        if (cached := self.cache.get(text, lang)) is not None:
+            return cached
+        key = TranslationCache.key(text, lang)
+        if key in self._inflight:
+            return await asyncio.shield(self._inflight[key])
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            translation = await self.translator.translate(text, lang)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            # Untranslated is better than a missing line
+            print(f"Translation to {lang} failed ({type(e).__name__}: {e}), sending the original")
+            translation = text
+        else:
+            self.cache.put(text, lang, translation)
+        finally:
+            del self._inflight[key]
+        future.set_result(translation)
+        return translation
+
+    async def _run(self) -> None:
+        while True:
+            languages, task, meta = await self._pending.get()
+            # Waiting without awaiting the task tells the worker being stopped apart from a
+            # line cancelled under it
+            try:
+                await asyncio.wait([task])
+            except asyncio.CancelledError:
+                task.cancel()
+                raise
+            try:
+                translations = task.result()
+            except asyncio.CancelledError:
+                continue
+            for lang, translation in zip(languages, translations):
+                await self.publish(lang, translation, meta)
+
+    async def aclose(self) -> None:
+        while not self._pending.empty():
+            _, task, _ = self._pending.get_nowait()
+            task.cancel()
+        if self._worker is not None:
+            self._worker.cancel()
+            await asyncio.wait([self._worker])
+            self._worker = None
@@ -0,0 +1,92 @@
+# altotech_podcast/summarize.py
+"""Post-show summaries and highlights export.
+
+Summarizes recorded transcripts (the JSONL files written by batch.py) into an
+episode recap, per-topic section summaries, an audience Q&A digest and the
+suggested questions each topic covered:
+
+    python summarize.py episodes/episode-001.jsonl
+    python summarize.py episodes/*.jsonl --concurrency 8 --offline
+
+Writes <name>.summary.md and <name>.summary.json next to each transcript (or into
+--output). Results are cached by content in --cache, so re-running after editing
+a transcript only re-summarizes the sections that changed.
+"""
+import argparse
+import asyncio
+import json
+import os
+import time
+
+from agents.offline import OfflineModel, configure_offline_env, use_offline_model
+from agents.rate_limit import Priority, request_context
+
+def load_transcript(path: str) -> list[dict]:
+    """Dialogue entries of a batch.py transcript, without the episode bookkeeping."""
+    dialogue = []
+    with open(path, 'r') as f:
+        for line in f:
+            if line.strip():
+                entry = json.loads(line)
+                entry.pop("episode", None)
+                entry.pop("index", None)
+                dialogue.append(entry)
+    return dialogue
+
+async def summarize_transcripts(
+    paths: list[str],
+    output_dir: str | None,
+    concurrency: int,
+    cache_path: str,
+    offline_latency: float | None = None,
+) -> None:
+    from agents.summarizer import ShowSummarizer, SummaryCache
+
+    summarizer = ShowSummarizer(concurrency, SummaryCache(cache_path))
+    if offline_latency is not None:
+        use_offline_model(summarizer, OfflineModel(latency=offline_latency, jitter=offline_latency / 2))
+
+    async def summarize_one(path: str) -> None:
+        name = os.path.basename(path).removesuffix(".jsonl")
+        directory = output_dir or os.path.dirname(path)
+        try:
+            with request_context(name, Priority.BATCH):
+                summary = await summarizer.summarize(load_transcript(path))
+        except Exception as e:
+            print(f"{name}: failed ({type(e).__name__}: {e})")
+            return
+        with open(os.path.join(directory, f"{name}.summary.md"), 'w') as f:
+            f.write(summary.to_markdown(name))
+        with open(os.path.join(directory, f"{name}.summary.json"), 'w') as f:
+            json.dump(summary.to_dict(), f, indent=2, ensure_ascii=False)
+        print(f"{name}: {len(summary.sections)} sections, {len(summary.audience_qa)} audience answers")
+
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    start = time.perf_counter()
+    try:
+        # Episodes share the summarizer, so the concurrency limit holds across all of them
+        await asyncio.gather(*(summarize_one(path) for path in paths))
+    finally:
+        await summarizer.aclose()
+    cache = summarizer.cache
+    print(
+        f"Summarized {len(paths)} transcript(s) in {time.perf_counter() - start:.1f}s; "
+        f"{cache.hits} cached and {cache.misses} new results"
+    )
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Summarize recorded podcast transcripts")
+    parser.add_argument("transcripts", nargs="+", help="JSONL transcripts written by batch.py")
+    parser.add_argument("--output", help="Directory for the summaries (default: next to each transcript)")
+    parser.add_argument("--concurrency", type=int, default=4, help="Summary calls running at the same time")
+    parser.add_argument("--cache", default="episodes/summary_cache.json", help="Cache of section summaries and recaps")
+    parser.add_argument("--offline", type=float, nargs="?", const=0.05, metavar="LATENCY",
+                        help="Use the offline stand-in model with this simulated latency (seconds)")
+    args = parser.parse_args()
+
+    if args.offline is not None:
+        configure_offline_env()
+    if os.path.dirname(args.cache):
+        os.makedirs(os.path.dirname(args.cache), exist_ok=True)
+    asyncio.run(summarize_transcripts(args.transcripts, args.output, args.concurrency, args.cache, args.offline))
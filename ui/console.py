@@ -1,9 +1,12 @@
 # altotech_podcast/ui/console.py
+import time
 from enum import Enum
 from typing import Any
 
 from rich.console import Console
+from rich.live import Live
 from rich.panel import Panel
+from rich.table import Table
 from rich.text import Text
 
 class SpeakerStyle(str, Enum):
@@ -60,7 +63,98 @@ class PodcastConsole:
         """Create a bordered panel with content."""
         return Panel(str(content), title=title, border_style="bold yellow")
 
+    def batch_dashboard(self) -> "BatchDashboard":
+        """Create a live progress dashboard for headless batch runs."""
+        return BatchDashboard(self.console)
+
     def print_metrics(self, metrics: dict[str, Any]) -> None:
         """Print metrics in a formatted panel."""
         content = "\n".join(f"{k}: {v}" for k, v in metrics.items())
-        self.console.print(self.create_panel(content, "📊 Metrics"))
\ No newline at end of file
+        self.console.print(self.create_panel(content, "📊 Metrics"))
+
+class EpisodeProgress:
+    """Console stand-in for one headless episode: tracks progress instead of printing lines."""
+    
+    def __init__(self, name: str):
+        self.name = name
+        self.status = "queued"
+        self.topic = ""
+        self.turns = 0
+        self.last_line = ""
+        self.started_at: float | None = None
+        self.finished_at: float | None = None
+    
+    @property
+    def elapsed(self) -> float:
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.perf_counter()) - self.started_at
+    
+    def print_header(self) -> None:
+        self.status = "running"
+        self.started_at = time.perf_counter()
+    
+    def print_footer(self) -> None:
+        self.status = "done"
+        self.finished_at = time.perf_counter()
+    
+    def print_topic(self, topic: str) -> None:
+        self.topic = topic
+    
+    def print_host(self, message: str) -> None:
+        self._record(f"Elon: {message}")
+    
+    def print_guest(self, message: str) -> None:
+        self._record(f"CEO: {message}")
+    
+    def print_audience(self, message: str) -> None:
+        self._record(f"Audience: {message}")
+    
+    def print_info(self, message: str) -> None:
+        self.last_line = message
+    
+    def _record(self, line: str) -> None:
+        self.turns += 1
+        self.last_line = line
+
+class BatchDashboard:
+    """Rich Live table showing every episode of a batch run."""
+    
+    def __init__(self, console: Console):
+        self.console = console
+        self.episodes: list[EpisodeProgress] = []
+        self._live: Live | None = None
+    
+    def add_episode(self, name: str) -> EpisodeProgress:
+        episode = EpisodeProgress(name)
+        self.episodes.append(episode)
+        return episode
+    
+    def render(self) -> Table:
+        table = Table(title="🎙️ Batch episodes", expand=True)
+        table.add_column("Episode", style=SpeakerStyle.SYSTEM.value, no_wrap=True)
+        table.add_column("Status")
+        table.add_column("Topic")
+        table.add_column("Turns", justify="right")
+        table.add_column("Time", justify="right")
+        table.add_column("Last line", style=SpeakerStyle.INFO.value, overflow="ellipsis", no_wrap=True, ratio=1)
+        for episode in self.episodes:
+            table.add_row(
+                episode.name,
+                episode.status,
+                episode.topic,
+                str(episode.turns),
+                f"{episode.elapsed:.1f}s",
+                episode.last_line
+            )
+        return table
+    
+    def __enter__(self) -> "BatchDashboard":
+        self._live = Live(get_renderable=self.render, console=self.console, refresh_per_second=4)
+        self._live.__enter__()
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        if self._live is not None:
+            self._live.__exit__(*exc_info)
+            self._live = None
@@ -1,12 +1,9 @@
 # altotech_podcast/ui/prompts.py
 import json
 from typing import Any
-import os
 from dotenv import load_dotenv
-from rich.prompt import Prompt, Confirm
-from pydantic_ai import Agent
-from openai import AsyncAzureOpenAI
-from pydantic_ai.models.openai import OpenAIModel
+from agents.base import close_agents, create_tier_agents, default_callers
+from agents.routing import CallType, ModelTier, default_router
 from context.company import CompanyContext
 from context.topics import get_topic_prompt
 from models.enums import TopicArea
@@ -16,20 +13,12 @@ load_dotenv()
 class PodcastPrompts:
     """Handles user input prompts during the podcast."""
     
-    def __init__(self):
+    def __init__(self, submissions_path: str = 'qr/submissions.json'):
         """Initialize the LLM agent for decision making."""
-        model = os.getenv('AZURE_OPENAI_MINI_MODEL')
-        azure_client = AsyncAzureOpenAI(
-            azure_endpoint=os.getenv('AZURE_OPENAI_ENDPOINT'),
-            api_version=os.getenv('AZURE_OPENAI_API_VERSION'),
-            api_key=os.getenv('AZURE_OPENAI_API_KEY'),
-        )
-        openai_model = OpenAIModel(model, openai_client=azure_client)
-        
+        self.submissions_path = submissions_path
         self.latest_answered_q_index = 0
 
-        self.agent = Agent(
-            openai_model,
+        self.agents = create_tier_agents(
             system_prompt="""You are a podcast producer helping to manage the flow of conversation.
 Your job is to analyze the recent conversation and company context to decide if:
 1. The current topic has been sufficiently covered and it's time to move on
@@ -39,15 +28,22 @@ Base your decisions on:
 - Whether key points have been addressed
 - The natural flow of conversation
 - Whether there are still interesting angles to explore
-Keep the podcast engaging but concise."""
+Keep the podcast engaging but concise.""",
+            tiers=[ModelTier.MINI]
         )
+        self.agent = self.agents[ModelTier.MINI]
+        self.router = default_router
         self.company = CompanyContext()
         self.last_processed_timestamp = None
         
+    async def aclose(self) -> None:
+        """Release the producer agent's HTTP connections."""
+        await close_agents(self.agents)
+        
     def clear_submissions(self) -> None:
         """Clear all submissions from the submissions.json file."""
         try:
-            with open('qr/submissions.json', 'w') as f:
+            with open(self.submissions_path, 'w') as f:
                 json.dump([], f)
         except Exception as e:
             print(f"Error clearing submissions: {e}")
@@ -56,7 +52,7 @@ Keep the podcast engaging but concise."""
         """Get an audience question from submissions.json if available."""
         try:
             # Read submissions from file
-            with open('qr/submissions.json', 'r') as f:
+            with open(self.submissions_path, 'r') as f:
                 submissions = json.loads(f.read())
                 
             if submissions:
@@ -91,6 +87,26 @@ Keep the podcast engaging but concise."""
             print(f"Error reading submissions: {e}")
             return None
 
+    def _read_submissions(self) -> list[dict[str, Any]]:
+        try:
+            with open(self.submissions_path, 'r') as f:
+                return json.loads(f.read())
+        except (FileNotFoundError, json.JSONDecodeError) as e:
+            print(f"Error reading submissions: {e}")
+            return []
+
+    def pending_audience_question_count(self) -> int:
+        """Return how many audience questions are still waiting to be answered."""
+        return max(0, len(self._read_submissions()) - self.latest_answered_q_index)
+
+    def get_audience_questions(self, limit: int) -> list[str]:
+        """Get up to ``limit`` unanswered audience questions, oldest first."""
+        submissions = self._read_submissions()
+        start = self.latest_answered_q_index
+        selected = submissions[start:start + limit]
+        self.latest_answered_q_index = start + len(selected)
+        return [f"{s['name']} asks: {s['question']}" for s in selected]
+
     async def should_end_podcast(self, topic: TopicArea, recent_exchanges: list[str]) -> bool:
         """Determine if we should end the podcast based on topic coverage."""
         # The podcast should only end when all topics have been covered
@@ -122,7 +138,12 @@ Should we move to the next topic? Consider:
 We should move on if they are sufficiently met.
 Respond with either 'yes' or 'no' and a brief explanation."""
 
-        result = await self.agent.run(prompt)
+        try:
+            result = await self.router.run(self.agents, CallType.PRODUCER, prompt, callers=default_callers)
+        except Exception as e:
+            # Stay on the current topic if the producer can't decide in time
+            print(f"Producer decision failed ({type(e).__name__}: {e}), staying on topic")
+            return False
         decision = result.data.lower().strip().startswith('yes')
         return decision
     
@@ -133,6 +154,8 @@ Respond with either 'yes' or 'no' and a brief explanation."""
         default: str | None = None
     ) -> str:
         """Get a choice from a list of options."""
+        # Console-only dependency, imported lazily to keep server start-up light
+        from rich.prompt import Prompt
         return Prompt.ask(
             prompt,
             choices=options,
@@ -147,6 +170,7 @@ Respond with either 'yes' or 'no' and a brief explanation."""
         **kwargs: Any
     ) -> Any:
         """Get a typed value from the user."""
+        from rich.prompt import Prompt
         return Prompt.ask(
             prompt,
             default=default,